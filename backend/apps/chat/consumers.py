@@ -94,7 +94,7 @@ class ChatConsumer(AsyncJsonWebsocketConsumer):
     @database_sync_to_async
     def get_project(self, project_id):
         try:
-            return Project.objects.get(id=project_id)
+            return Project.visible.get(id=project_id)
         except Project.DoesNotExist:
             return None
 
@@ -0,0 +1,172 @@
+"""
+Load test websocket chat connects against the in-process ASGI application.
+
+Every connect does the production database work (JWT user lookup, project
+lookup, membership check) through database_sync_to_async. The command
+reports connect latency, the number of PostgreSQL backends open during the
+run and, with DATABASE_POOL_MODE=pool, the pool metrics, so pool modes can
+be compared on the same data.
+
+Usage:
+    python manage.py load_test_chat_connects --connections 1000 --concurrency 200
+    DATABASE_POOL_MODE=pool python manage.py load_test_chat_connects --memory-layer
+    python manage.py load_test_chat_connects --cleanup
+"""
+import asyncio
+import statistics
+import time
+
+from asgiref.sync import sync_to_async
+from channels.testing import WebsocketCommunicator
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.projects.models import Project
+from apps.users.models import User
+from core.db_pool import get_pool_stats
+
+LOAD_TEST_EMAIL = 'chat-load-test@interfacehive.local'
+LOAD_TEST_TITLE = '[loadtest] chat connects'
+MEMORY_CHANNEL_LAYERS = {'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}}
+
+
+def count_backends():
+    """Open PostgreSQL backends on the current database (None elsewhere)."""
+    if connection.vendor != 'postgresql':
+        return None
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT count(*) FROM pg_stat_activity WHERE datname = current_database()'
+            )
+            return cursor.fetchone()[0]
+    finally:
+        connection.close()
+
+
+class Command(BaseCommand):
+    help = 'Open many concurrent chat websocket connections and report latency and DB connections.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--connections', type=int, default=500,
+                            help='Total websocket connects to perform.')
+        parser.add_argument('--concurrency', type=int, default=100,
+                            help='Connects in flight at once.')
+        parser.add_argument('--timeout', type=float, default=10,
+                            help='Seconds to wait for each connect.')
+        parser.add_argument('--memory-layer', action='store_true',
+                            help='Use the in-memory channel layer instead of Redis.')
+        parser.add_argument('--cleanup', action='store_true',
+                            help='Delete the load test user and project and exit.')
+
+    def handle(self, *args, **options):
+        if options['cleanup']:
+            deleted, _ = User.objects.filter(email=LOAD_TEST_EMAIL).delete()
+            self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} load test rows.'))
+            return
+
+        project = self.seed()
+        token = str(AccessToken.for_user(project.host_user))
+        path = f'/ws/chat/{project.id}/?token={token}'
+        connection.close()
+
+        # Imported late: building the ASGI application sets up routing
+        from config.asgi import application
+
+        channel_layers = MEMORY_CHANNEL_LAYERS if options['memory_layer'] else settings.CHANNEL_LAYERS
+        with override_settings(CHANNEL_LAYERS=channel_layers):
+            report = asyncio.run(self.run(application, path, options))
+
+        self.print_report(report, options)
+
+    def seed(self):
+        host, _ = User.objects.get_or_create(
+            email=LOAD_TEST_EMAIL,
+            defaults={'display_name': 'Chat Load Test', 'username': 'chat_load_test'}
+        )
+        project = Project.objects.filter(host_user=host, title=LOAD_TEST_TITLE).first()
+        if project is None:
+            project = Project.objects.create(
+                host_user=host,
+                title=LOAD_TEST_TITLE,
+                description='Synthetic project used by load_test_chat_connects.',
+                what_it_does='Receives websocket connects.',
+                desired_outputs='Latency and connection metrics.',
+            )
+        return project
+
+    async def run(self, application, path, options):
+        semaphore = asyncio.Semaphore(options['concurrency'])
+        backends = []
+        done = asyncio.Event()
+
+        async def sample_backends():
+            while not done.is_set():
+                backends.append(await sync_to_async(count_backends, thread_sensitive=False)())
+                await asyncio.sleep(0.1)
+
+        async def connect_once():
+            async with semaphore:
+                communicator = WebsocketCommunicator(application, path)
+                started = time.perf_counter()
+                try:
+                    connected, _ = await communicator.connect(timeout=options['timeout'])
+                except Exception:
+                    connected = False
+                elapsed = (time.perf_counter() - started) * 1000
+                if connected:
+                    await communicator.disconnect()
+                return connected, elapsed
+
+        baseline = await sync_to_async(count_backends, thread_sensitive=False)()
+        sampler = asyncio.create_task(sample_backends())
+        started = time.perf_counter()
+        results = await asyncio.gather(*(connect_once() for _ in range(options['connections'])))
+        duration = time.perf_counter() - started
+        done.set()
+        await sampler
+        after = await sync_to_async(count_backends, thread_sensitive=False)()
+
+        sampled = [count for count in backends if count is not None]
+        return {
+            'results': results,
+            'duration': duration,
+            'backends_baseline': baseline,
+            'backends_peak': max(sampled) if sampled else None,
+            'backends_after': after,
+        }
+
+    def print_report(self, report, options):
+        latencies = sorted(elapsed for connected, elapsed in report['results'] if connected)
+        failed = len(report['results']) - len(latencies)
+
+        self.stdout.write(f"pool mode:        {settings.DATABASE_POOL_MODE}")
+        self.stdout.write(f"connects:         {len(latencies)} ok, {failed} failed "
+                          f"in {report['duration']:.2f}s "
+                          f"({len(report['results']) / report['duration']:.0f}/s)")
+        if latencies:
+            self.stdout.write(
+                f"latency ms:       p50 {statistics.median(latencies):.1f}  "
+                f"p95 {self.percentile(latencies, 95):.1f}  "
+                f"p99 {self.percentile(latencies, 99):.1f}  "
+                f"max {latencies[-1]:.1f}"
+            )
+        if report['backends_peak'] is not None:
+            self.stdout.write(f"pg backends:      baseline {report['backends_baseline']}  "
+                              f"peak {report['backends_peak']}  after {report['backends_after']}")
+        for alias, stats in get_pool_stats().items():
+            metrics = '  '.join(f'{key} {value}' for key, value in stats.items() if key not in ('alias', 'pid'))
+            self.stdout.write(f"pool[{alias}]:  {metrics}")
+
+        if failed:
+            self.stdout.write(self.style.WARNING(f'{failed} connect(s) failed or timed out.'))
+        else:
+            self.stdout.write(self.style.SUCCESS('All connects succeeded.'))
+
+    @staticmethod
+    def percentile(values, percent):
+        index = min(len(values) - 1, round(percent / 100 * (len(values) - 1)))
+        return values[index]
@@ -1,9 +1,12 @@
 from rest_framework import serializers
 from .models import ChatMessage
 from apps.users.serializers import UserProfileSerializer
+from apps.users.sideload import SideloadUsersMixin
+from core.fieldsets import SparseFieldsetsMixin
 
-class ChatMessageSerializer(serializers.ModelSerializer):
+class ChatMessageSerializer(SideloadUsersMixin, SparseFieldsetsMixin, serializers.ModelSerializer):
     user = UserProfileSerializer(read_only=True)
+    sideload_user_fields = {'user': 'user'}
     
     class Meta:
         model = ChatMessage
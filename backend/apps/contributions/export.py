@@ -0,0 +1,18 @@
+"""
+Row shape for the streaming contribution export.
+"""
+from django.db.models import F
+
+CONTRIBUTION_EXPORT_COLUMNS = (
+    'id', 'project_id', 'contributor_user_id', 'contributor_display_name',
+    'title', 'body', 'links_json', 'attachments_json', 'status',
+    'decided_at', 'created_at', 'updated_at',
+)
+
+
+def export_rows_queryset(queryset):
+    """Values queryset of export rows for a (visibility-filtered) contribution queryset."""
+    return queryset.select_related(None).order_by('created_at', 'id').values(
+        *[column for column in CONTRIBUTION_EXPORT_COLUMNS if column != 'contributor_display_name'],
+        contributor_display_name=F('contributor_user__display_name'),
+    )
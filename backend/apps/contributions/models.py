@@ -1,8 +1,10 @@
 import uuid
 from django.db import models
 
+from core.models import DirtyFieldsMixin
 
-class Contribution(models.Model):
+
+class Contribution(DirtyFieldsMixin, models.Model):
     """
     Submissions from contributors to projects.
     
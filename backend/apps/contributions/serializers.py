@@ -1,14 +1,22 @@
 from rest_framework import serializers
+from django.db import transaction
 from django.utils import timezone
 from apps.contributions.models import Contribution
+from apps.contributions.services import ContributionService
 from apps.users.serializers import UserProfileSerializer
+from apps.users.sideload import SideloadUsersMixin
 from apps.projects.models import Project
+from apps.projects.trending import SUBMISSION, schedule_trending_event
+from core.fieldsets import SparseFieldsetsMixin
 
 
-class ContributionSerializer(serializers.ModelSerializer):
+class ContributionSerializer(SideloadUsersMixin, SparseFieldsetsMixin, serializers.ModelSerializer):
     """
     Serializer for displaying and updating contributions.
+    
+    Supports ?fields= / ?omit= and ?include=users on GET requests.
     """
+    sideload_user_fields = {'contributor': 'contributor_user'}
     contributor = UserProfileSerializer(source='contributor_user', read_only=True)
     project_title = serializers.CharField(source='project.title', read_only=True)
     decided_by_name = serializers.CharField(source='decided_by_user.display_name', read_only=True, allow_null=True)
@@ -115,12 +123,17 @@ class ContributionCreateSerializer(serializers.ModelSerializer):
         links = validated_data.pop('links', [])
         attachments = validated_data.pop('attachments', [])
         
-        contribution = Contribution.objects.create(
-            contributor_user=self.context['request'].user,
-            links_json=links,
-            attachments_json=attachments,
-            **validated_data
-        )
+        with transaction.atomic():
+            contribution = Contribution.objects.create(
+                contributor_user=self.context['request'].user,
+                links_json=links,
+                attachments_json=attachments,
+                **validated_data
+            )
+            ContributionService.update_project_counters(
+                contribution.project_id, new_status=contribution.status
+            )
+            schedule_trending_event(contribution.project_id, SUBMISSION)
         return contribution
 
 
@@ -4,9 +4,13 @@ Contribution Service Layer
 Handles contribution acceptance/decline logic with atomic credit awards.
 """
 from django.db import transaction, IntegrityError
+from django.db.models import F
 from django.utils import timezone
 from apps.contributions.models import Contribution
 from apps.credits.services import CreditService
+from apps.projects.cache import bump_projects_version
+from apps.projects.models import Project
+from apps.projects.trending import ACCEPT, schedule_trending_event
 from apps.users.models import User
 import logging
 
@@ -20,6 +24,67 @@ class ContributionService:
     Provides atomic operations for contribution acceptance with credit awards.
     """
 
+    # Project counter column tracking each contribution status (declined is not counted)
+    STATUS_COUNTER_FIELDS = {
+        'pending': 'pending_contribution_count',
+        'accepted': 'accepted_contribution_count',
+    }
+
+    @staticmethod
+    def update_project_counters(project_id, old_status=None, new_status=None) -> None:
+        """
+        Apply a contribution status transition to the Project counter columns.
+        
+        Uses atomic F() updates so concurrent submissions and decisions don't
+        lose increments. Call inside the transaction that changes the contribution.
+        
+        Args:
+            project_id: ID of the contribution's project
+            old_status: Previous status (None when the contribution was just created)
+            new_status: New status (None when the contribution was deleted)
+        """
+        deltas = {}
+        if old_status is None:
+            deltas['contribution_count'] = 1
+        if new_status is None:
+            deltas['contribution_count'] = deltas.get('contribution_count', 0) - 1
+        
+        for status, delta in ((old_status, -1), (new_status, 1)):
+            field = ContributionService.STATUS_COUNTER_FIELDS.get(status)
+            if field:
+                deltas[field] = deltas.get(field, 0) + delta
+        
+        updates = {field: F(field) + delta for field, delta in deltas.items() if delta}
+        if updates:
+            Project.objects.filter(pk=project_id).update(**updates)
+            bump_projects_version()
+
+    # Columns written when a contribution is decided
+    DECISION_FIELDS = ['status', 'decided_by_user', 'decided_at', 'updated_at']
+
+    @staticmethod
+    def claim_decision(contribution: Contribution, new_status: str, decided_by: User = None) -> bool:
+        """
+        Move a contribution out of PENDING with a conditional UPDATE.
+        
+        Only one of several concurrent decisions (or a decision racing a
+        delete) matches status='pending', so only that caller may adjust the
+        project counters or award credit. The instance is refreshed from the
+        database either way.
+        
+        Returns:
+            bool: True if this call made the transition
+        """
+        now = timezone.now()
+        changed = Contribution.objects.filter(pk=contribution.pk, status='pending').update(
+            status=new_status,
+            decided_by_user=decided_by,
+            decided_at=now,
+            updated_at=now,
+        )
+        contribution.refresh_from_db(fields=ContributionService.DECISION_FIELDS)
+        return changed == 1
+
     @staticmethod
     @transaction.atomic
     def accept_contribution(contribution: Contribution, decided_by: User) -> dict:
@@ -58,11 +123,20 @@ class ContributionService:
                 "Only the project host can accept contributions."
             )
         
-        # Update contribution status
-        contribution.status = 'accepted'
-        contribution.decided_by_user = decided_by
-        contribution.decided_at = timezone.now()
-        contribution.save(update_fields=['status', 'decided_by_user', 'decided_at', 'updated_at'])
+        # Update contribution status; a concurrent decision may have won the race
+        if not ContributionService.claim_decision(contribution, 'accepted', decided_by):
+            if contribution.status == 'accepted':
+                return {
+                    'contribution': contribution,
+                    'credit_entry': None,
+                    'credit_awarded': False
+                }
+            raise ValueError(
+                f"Cannot accept contribution. Current status: {contribution.status}. "
+                f"Only PENDING contributions can be accepted."
+            )
+        ContributionService.update_project_counters(contribution.project_id, 'pending', 'accepted')
+        schedule_trending_event(contribution.project_id, ACCEPT)
         
         logger.info(
             f"Contribution {contribution.id} accepted by {decided_by.email} "
@@ -130,11 +204,15 @@ class ContributionService:
                 "Only the project host can decline contributions."
             )
         
-        # Update contribution status
-        contribution.status = 'declined'
-        contribution.decided_by_user = decided_by
-        contribution.decided_at = timezone.now()
-        contribution.save(update_fields=['status', 'decided_by_user', 'decided_at', 'updated_at'])
+        # Update contribution status; a concurrent decision may have won the race
+        if not ContributionService.claim_decision(contribution, 'declined', decided_by):
+            if contribution.status == 'declined':
+                return contribution
+            raise ValueError(
+                f"Cannot decline contribution. Current status: {contribution.status}. "
+                f"Only PENDING contributions can be declined."
+            )
+        ContributionService.update_project_counters(contribution.project_id, 'pending', 'declined')
         
         logger.info(
             f"Contribution {contribution.id} declined by {decided_by.email} "
@@ -0,0 +1,63 @@
+"""
+Tests for conditional GET (ETag / 304) on contribution detail.
+"""
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from apps.contributions.models import Contribution
+from apps.projects.models import Project
+from apps.users.models import User
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ContributionDetailConditionalGetTests(TestCase):
+
+    def setUp(self):
+        self.host = User.objects.create(email='host@example.com', username='host', display_name='Host')
+        self.contributor = User.objects.create(
+            email='contributor@example.com', username='contributor', display_name='Contributor'
+        )
+        project = Project.objects.create(
+            host_user=self.host,
+            title='Conditional project',
+            description='d' * 30,
+            what_it_does='Tests ETags',
+            desired_outputs='o' * 30,
+        )
+        self.contribution = Contribution.objects.create(
+            project=project, contributor_user=self.contributor, title='Contribution', body='b' * 60
+        )
+        self.url = reverse('contribution-detail', kwargs={'id': self.contribution.pk})
+        self.client = APIClient()
+
+    def test_contributor_gets_304_for_current_etag(self):
+        self.client.force_authenticate(self.contributor)
+        etag = self.client.get(self.url)['ETag']
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_edit_changes_etag(self):
+        self.client.force_authenticate(self.contributor)
+        etag = self.client.get(self.url)['ETag']
+
+        self.contribution.body = 'c' * 60
+        self.contribution.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_pending_contribution_is_not_304_for_other_users(self):
+        self.client.force_authenticate(self.contributor)
+        etag = self.client.get(self.url)['ETag']
+
+        self.client.force_authenticate(None)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertNotEqual(response.status_code, 304)
+        self.assertNotIn('ETag', response)
@@ -0,0 +1,155 @@
+"""
+Tests for the contribution counters maintained on Project.
+
+Decisions are claimed with a conditional UPDATE, so a stale instance (a
+request that read the contribution before another decision committed)
+must not move the counters or award credit a second time.
+"""
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.contributions.models import Contribution
+from apps.contributions.services import ContributionService
+from apps.credits.models import CreditLedgerEntry
+from apps.moderation.services import ModerationService
+from apps.projects.models import Project
+from apps.users.models import User
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+def make_user(name, **kwargs):
+    return User.objects.create(
+        email=f'{name}@example.com',
+        username=name,
+        display_name=name,
+        email_verified=True,
+        email_verified_at=timezone.now(),
+        **kwargs
+    )
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ContributionCounterTests(TestCase):
+
+    def setUp(self):
+        self.host = make_user('host')
+        self.contributor = make_user('contributor')
+        self.project = Project.objects.create(
+            host_user=self.host,
+            title='Counter test project',
+            description='d' * 30,
+            what_it_does='Tests counters',
+            desired_outputs='o' * 30,
+        )
+        self.client = APIClient()
+
+    def counters(self):
+        return Project.objects.values(
+            'contribution_count', 'pending_contribution_count', 'accepted_contribution_count'
+        ).get(pk=self.project.pk)
+
+    def assertCounters(self, total, pending, accepted):
+        self.assertEqual(self.counters(), {
+            'contribution_count': total,
+            'pending_contribution_count': pending,
+            'accepted_contribution_count': accepted,
+        })
+
+    def submit(self, user=None):
+        self.client.force_authenticate(user or self.contributor)
+        response = self.client.post(
+            reverse('contribution-create', kwargs={'project_id': self.project.pk}),
+            {'title': 'Contribution', 'body': 'b' * 60},
+            format='json',
+        )
+        self.assertEqual(response.status_code, 201, response.data)
+        return Contribution.objects.select_related('project', 'contributor_user').get(
+            pk=response.data['data']['id']
+        )
+
+    def test_submission_counts_as_pending(self):
+        self.submit()
+
+        self.assertCounters(total=1, pending=1, accepted=0)
+
+    def test_accept_moves_pending_to_accepted_and_awards_credit(self):
+        contribution = self.submit()
+
+        result = ContributionService.accept_contribution(contribution, self.host)
+
+        self.assertTrue(result['credit_awarded'])
+        self.assertCounters(total=1, pending=0, accepted=1)
+        self.assertEqual(User.objects.get(pk=self.contributor.pk).credit_balance, 1)
+
+    def test_decline_moves_pending_out_of_counters(self):
+        contribution = self.submit()
+
+        ContributionService.decline_contribution(contribution, self.host)
+
+        self.assertCounters(total=1, pending=0, accepted=0)
+
+    def test_delete_pending_decrements_counters(self):
+        contribution = self.submit()
+
+        response = self.client.delete(reverse('contribution-detail', kwargs={'id': contribution.pk}))
+
+        self.assertEqual(response.status_code, 204)
+        self.assertCounters(total=0, pending=0, accepted=0)
+
+    def test_claim_decision_only_succeeds_once(self):
+        contribution = self.submit()
+        stale = Contribution.objects.get(pk=contribution.pk)
+
+        self.assertTrue(ContributionService.claim_decision(contribution, 'accepted', self.host))
+        self.assertFalse(ContributionService.claim_decision(stale, 'declined', self.host))
+        self.assertEqual(stale.status, 'accepted')
+
+    def test_racing_accepts_count_and_award_once(self):
+        contribution = self.submit()
+        stale = Contribution.objects.select_related('project', 'contributor_user').get(pk=contribution.pk)
+
+        first = ContributionService.accept_contribution(contribution, self.host)
+        second = ContributionService.accept_contribution(stale, self.host)
+
+        self.assertTrue(first['credit_awarded'])
+        self.assertFalse(second['credit_awarded'])
+        self.assertCounters(total=1, pending=0, accepted=1)
+        self.assertEqual(CreditLedgerEntry.objects.filter(contribution=contribution).count(), 1)
+        self.assertEqual(User.objects.get(pk=self.contributor.pk).credit_balance, 1)
+
+    def test_decline_racing_an_accept_is_rejected(self):
+        contribution = self.submit()
+        stale = Contribution.objects.select_related('project', 'contributor_user').get(pk=contribution.pk)
+
+        ContributionService.accept_contribution(contribution, self.host)
+        with self.assertRaises(ValueError):
+            ContributionService.decline_contribution(stale, self.host)
+
+        self.assertCounters(total=1, pending=0, accepted=1)
+
+    def test_delete_racing_a_decision_is_rejected(self):
+        contribution = self.submit()
+        ContributionService.decline_contribution(
+            Contribution.objects.select_related('project').get(pk=contribution.pk), self.host
+        )
+
+        response = self.client.delete(reverse('contribution-detail', kwargs={'id': contribution.pk}))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(Contribution.objects.filter(pk=contribution.pk).exists())
+        self.assertCounters(total=1, pending=0, accepted=0)
+
+    def test_moderator_soft_delete_uses_current_status(self):
+        moderator = make_user('moderator', is_staff=True)
+        contribution = self.submit()
+        stale = Contribution.objects.select_related('project', 'contributor_user').get(pk=contribution.pk)
+        ContributionService.accept_contribution(contribution, self.host)
+
+        ModerationService.soft_delete_contribution(stale, moderator, 'Spam submission')
+        ModerationService.soft_delete_contribution(stale, moderator, 'Spam submission')
+
+        self.assertEqual(stale.status, 'declined')
+        self.assertCounters(total=1, pending=0, accepted=0)
@@ -0,0 +1,66 @@
+"""
+Tests that contributions to projects pending deletion are hidden.
+"""
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.contributions.models import Contribution
+from apps.projects.models import Project
+from apps.users.models import User
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+def make_user(name):
+    return User.objects.create(
+        email=f'{name}@example.com',
+        username=name,
+        display_name=name,
+        email_verified=True,
+        email_verified_at=timezone.now(),
+    )
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PendingDeletionContributionTests(TestCase):
+
+    def setUp(self):
+        self.host = make_user('host')
+        self.contributor = make_user('contributor')
+        project = Project.objects.create(
+            host_user=self.host,
+            title='Doomed project',
+            description='d' * 30,
+            what_it_does='Tests deletion',
+            desired_outputs='o' * 30,
+        )
+        self.contribution = Contribution.objects.create(
+            project=project, contributor_user=self.contributor, title='Contribution', body='b' * 60
+        )
+        Project.objects.filter(pk=project.pk).update(deletion_requested_at=timezone.now())
+        self.client = APIClient()
+
+    def test_detail_is_not_found(self):
+        self.client.force_authenticate(self.contributor)
+
+        response = self.client.get(reverse('contribution-detail', kwargs={'id': self.contribution.pk}))
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_contributors_list_omits_it(self):
+        self.client.force_authenticate(self.contributor)
+
+        response = self.client.get(reverse('my-contributions'))
+
+        self.assertEqual(response.data['data'], [])
+
+    def test_host_cannot_decide_it(self):
+        self.client.force_authenticate(self.host)
+
+        for name in ('contribution-accept', 'contribution-decline'):
+            with self.subTest(name=name):
+                response = self.client.post(reverse(name, kwargs={'contribution_id': self.contribution.pk}))
+                self.assertEqual(response.status_code, 404)
+        self.assertEqual(Contribution.objects.get(pk=self.contribution.pk).status, 'pending')
@@ -1,6 +1,7 @@
 from django.urls import path
 from apps.contributions.views import (
     ProjectContributionListView,
+    ProjectContributionExportView,
     ContributionCreateView,
     ContributionDetailView,
     MyContributionsView,
@@ -11,6 +12,7 @@ from apps.contributions.views import (
 urlpatterns = [
     # Contribution submission for a project
     path('projects/<uuid:project_id>/contributions/', ProjectContributionListView.as_view(), name='project-contributions-list'),
+    path('projects/<uuid:project_id>/contributions/export/', ProjectContributionExportView.as_view(), name='project-contributions-export'),
     path('projects/<uuid:project_id>/contributions/create/', ContributionCreateView.as_view(), name='contribution-create'),
     
     # User's own contributions
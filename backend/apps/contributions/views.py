@@ -1,5 +1,6 @@
 from rest_framework import generics, status, views
 import logging
+from django.conf import settings
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from django.db import transaction, IntegrityError
@@ -13,9 +14,14 @@ from apps.contributions.serializers import (
     ContributionCreateSerializer,
     ContributionDecisionSerializer
 )
+from apps.contributions.export import CONTRIBUTION_EXPORT_COLUMNS, export_rows_queryset
 from apps.contributions.services import ContributionService
 from apps.projects.models import Project
 from apps.users.permissions import IsAuthenticatedAndVerified, IsHostOrReadOnly
+from apps.users.sideload import SideloadUsersViewMixin
+from core.conditional import compute_etag, latest, not_modified_response, set_conditional_headers
+from core.export import EXPORT_FORMATS, get_export_format, iter_chunks, streaming_export_response
+from core.fieldsets import SparseQuerysetMixin
 from core.pagination import CustomPageNumberPagination
 from core.responses import SuccessResponse, ErrorResponse
 
@@ -23,7 +29,7 @@ logger = logging.getLogger(__name__)
 
 from django.db.models import Q
 
-class ProjectContributionListView(generics.ListAPIView):
+class ProjectContributionListView(SideloadUsersViewMixin, SparseQuerysetMixin, generics.ListAPIView):
     """
     List all contributions for a specific project.
     
@@ -45,7 +51,7 @@ class ProjectContributionListView(generics.ListAPIView):
         request_user = self.request.user
         if request_user.is_authenticated:
             try:
-                project = Project.objects.get(id=project_id)
+                project = Project.visible.get(id=project_id)
                 if project.host_user != request_user:
                     queryset = queryset.filter(Q(status='accepted') | Q(contributor_user=request_user))
             except Project.DoesNotExist:
@@ -66,6 +72,31 @@ class ProjectContributionListView(generics.ListAPIView):
         return SuccessResponse(data=serializer.data)
 
 
+class ProjectContributionExportView(ProjectContributionListView):
+    """
+    Stream a project's contributions as NDJSON or CSV.
+    
+    Same visibility rules as the contribution list. Query parameters:
+    - output: 'ndjson' (default, one JSON object per line) or 'csv'
+    """
+    permission_classes = (IsAuthenticatedAndVerified,)
+
+    def get(self, request, *args, **kwargs):
+        export_format = get_export_format(request)
+        if export_format is None:
+            return ErrorResponse(
+                detail=f"output must be one of: {', '.join(EXPORT_FORMATS)}",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
+        rows = export_rows_queryset(self.get_queryset())
+        chunks = iter_chunks(rows, settings.EXPORT_CHUNK_SIZE)
+        return streaming_export_response(
+            request, chunks, CONTRIBUTION_EXPORT_COLUMNS, export_format,
+            f"project-{self.kwargs['project_id']}-contributions"
+        )
+
+
 @method_decorator(ratelimit(key='user', rate='20/h', block=True), name='post')
 class ContributionCreateView(generics.CreateAPIView):
     """
@@ -89,7 +120,7 @@ class ContributionCreateView(generics.CreateAPIView):
         
         # Validate project exists
         try:
-            project = Project.objects.get(id=project_id)
+            project = Project.visible.get(id=project_id)
         except Project.DoesNotExist:
             return ErrorResponse(
                 detail="Project not found.",
@@ -135,12 +166,54 @@ class ContributionDetailView(generics.RetrieveUpdateDestroyAPIView):
     - Only contributor can update/delete
     - Only while status is PENDING
     """
-    queryset = Contribution.objects.select_related('contributor_user', 'project', 'decided_by_user')
+    # Contributions to projects pending deletion are hidden like the projects
+    queryset = Contribution.objects.filter(
+        project__deletion_requested_at__isnull=True
+    ).select_related('contributor_user', 'project', 'decided_by_user')
     serializer_class = ContributionSerializer
     permission_classes = (IsAuthenticatedOrReadOnly,)
     lookup_field = 'id'
 
+    def get_conditional_validators(self):
+        """
+        ETag and Last-Modified for a contribution the requester may view.
+        
+        Returns None when the contribution is missing or not visible, so the
+        normal path produces the 404/403.
+        """
+        row = self.queryset.filter(id=self.kwargs['id']).values(
+            'status',
+            'contributor_user_id',
+            'project__host_user_id',
+            'updated_at',
+            'project__updated_at',
+            'contributor_user__updated_at',
+            'decided_by_user__updated_at',
+        ).first()
+        if row is None:
+            return None
+        
+        if row['status'] != 'accepted':
+            user_id = self.request.user.pk if self.request.user.is_authenticated else None
+            if user_id is None or user_id not in (row['contributor_user_id'], row['project__host_user_id']):
+                return None
+        
+        etag = compute_etag(self.kwargs['id'], *row.values())
+        last_modified = latest(
+            row['updated_at'],
+            row['project__updated_at'],
+            row['contributor_user__updated_at'],
+            row['decided_by_user__updated_at'],
+        )
+        return etag, last_modified
+
     def retrieve(self, request, *args, **kwargs):
+        validators = self.get_conditional_validators()
+        if validators:
+            not_modified = not_modified_response(request, *validators)
+            if not_modified is not None:
+                return not_modified
+        
         instance = self.get_object()
         
         # Check visibility permissions
@@ -157,7 +230,10 @@ class ContributionDetailView(generics.RetrieveUpdateDestroyAPIView):
                 )
         
         serializer = self.get_serializer(instance)
-        return SuccessResponse(data=serializer.data)
+        response = SuccessResponse(data=serializer.data)
+        if validators:
+            set_conditional_headers(response, *validators)
+        return response
 
     def perform_update(self, serializer):
         instance = self.get_object()
@@ -190,7 +266,12 @@ class ContributionDetailView(generics.RetrieveUpdateDestroyAPIView):
             raise PermissionError("Only the contributor can delete this request.")
         if instance.status != 'pending':
             raise ValueError(f"Cannot delete a request that has already been {instance.status}.")
-        instance.delete()
+        with transaction.atomic():
+            # Conditional delete: a decision or another delete may have run since the read
+            deleted, _ = Contribution.objects.filter(pk=instance.pk, status='pending').delete()
+            if not deleted:
+                raise ValueError("Cannot delete a request that is no longer pending.")
+            ContributionService.update_project_counters(instance.project_id, old_status='pending')
 
     def destroy(self, request, *args, **kwargs):
         try:
@@ -203,7 +284,7 @@ class ContributionDetailView(generics.RetrieveUpdateDestroyAPIView):
             return ErrorResponse(detail=str(e), status_code=status.HTTP_400_BAD_REQUEST)
 
 
-class MyContributionsView(generics.ListAPIView):
+class MyContributionsView(SideloadUsersViewMixin, SparseQuerysetMixin, generics.ListAPIView):
     """
     Get all contributions by the authenticated user.
     
@@ -215,7 +296,8 @@ class MyContributionsView(generics.ListAPIView):
 
     def get_queryset(self):
         queryset = Contribution.objects.filter(
-            contributor_user=self.request.user
+            contributor_user=self.request.user,
+            project__deletion_requested_at__isnull=True,
         ).select_related(
             'project', 'project__host_user', 'decided_by_user'
         ).order_by('-created_at')
@@ -249,7 +331,9 @@ class ContributionAcceptView(views.APIView):
 
     def post(self, request, contribution_id):
         try:
-            contribution = Contribution.objects.select_related('project', 'contributor_user').get(id=contribution_id)
+            contribution = Contribution.objects.select_related('project', 'contributor_user').get(
+                id=contribution_id, project__deletion_requested_at__isnull=True
+            )
         except Contribution.DoesNotExist:
             return ErrorResponse(
                 detail="Contribution not found.",
@@ -312,7 +396,9 @@ class ContributionDeclineView(views.APIView):
 
     def post(self, request, contribution_id):
         try:
-             contribution = Contribution.objects.select_related('project', 'contributor_user').get(id=contribution_id)
+            contribution = Contribution.objects.select_related('project', 'contributor_user').get(
+                id=contribution_id, project__deletion_requested_at__isnull=True
+            )
         except Contribution.DoesNotExist:
             return ErrorResponse(
                 detail="Contribution not found.",
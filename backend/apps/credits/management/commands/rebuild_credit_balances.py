@@ -0,0 +1,26 @@
+"""
+Recompute User.credit_balance from the credit ledger.
+
+Usage:
+    python manage.py rebuild_credit_balances
+    python manage.py rebuild_credit_balances --user <uuid> --user <uuid>
+"""
+from django.core.management.base import BaseCommand
+
+from apps.credits.services import CreditService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the denormalized credit balance of users from the credit ledger.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--user',
+            action='append',
+            dest='user_ids',
+            help='Only rebuild the given user ID (may be repeated).',
+        )
+
+    def handle(self, *args, **options):
+        updated = CreditService.rebuild_credit_balances(user_ids=options['user_ids'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt credit balance for {updated} user(s).'))
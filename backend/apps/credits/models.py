@@ -1,5 +1,7 @@
 import uuid
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F
+from django.utils import timezone
 
 
 class CreditLedgerEntry(models.Model):
@@ -99,7 +101,24 @@ class CreditLedgerEntry(models.Model):
                 "CreditLedgerEntry is append-only. Updates not allowed. "
                 "Use entry_type='reversal' to reverse credits."
             )
-        super().save(*args, **kwargs)
+        
+        # Keep the denormalized User.credit_balance in the same transaction as the entry
+        from apps.users.models import User
+        
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            # Touch updated_at so cached profiles (ETag / Last-Modified) see the change
+            User.objects.filter(pk=self.to_user_id).update(
+                credit_balance=F('credit_balance') + self.balance_delta,
+                updated_at=timezone.now()
+            )
+    
+    @property
+    def balance_delta(self):
+        """Signed effect of this entry on the recipient's balance."""
+        if self.entry_type == 'reversal':
+            return -self.amount
+        return self.amount
     
     def delete(self, *args, **kwargs):
         """
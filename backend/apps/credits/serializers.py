@@ -1,13 +1,15 @@
 from rest_framework import serializers
 from apps.credits.models import CreditLedgerEntry
 from apps.users.serializers import UserProfileSerializer
+from core.fieldsets import SparseFieldsetsMixin
 
 
-class CreditLedgerEntrySerializer(serializers.ModelSerializer):
+class CreditLedgerEntrySerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     """
     Serializer for credit ledger entries.
     
     Shows credit transaction history with related user and project info.
+    Supports ?fields= / ?omit=.
     """
     from_user_name = serializers.CharField(source='created_by_user.display_name', read_only=True, allow_null=True)
     project_title = serializers.CharField(source='project.title', read_only=True)
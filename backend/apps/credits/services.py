@@ -5,10 +5,12 @@ Handles credit award logic with atomic transactions.
 Ensures data integrity for contribution acceptance + credit award operations.
 """
 from django.db import transaction, IntegrityError
-from django.db.models import Q, Sum
+from django.db.models import Case, F, OuterRef, Q, Subquery, Sum, When
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from apps.credits.models import CreditLedgerEntry
 from apps.users.models import User
+from apps.projects.cache import bump_projects_version
 from apps.projects.models import Project
 from apps.contributions.models import Contribution
 import logging
@@ -141,6 +143,43 @@ class CreditService:
         
         return awards - reversals + adjustments
     
+    @staticmethod
+    @transaction.atomic
+    def rebuild_credit_balances(user_ids=None) -> int:
+        """
+        Recompute the denormalized User.credit_balance column from the ledger.
+        
+        Runs as a single UPDATE with a correlated subquery, so it is safe to use
+        for repairing drift on the whole user table.
+        
+        Args:
+            user_ids: Optional iterable of user IDs to restrict the rebuild to
+        
+        Returns:
+            int: Number of user rows updated
+        """
+        ledger_balance = CreditLedgerEntry.objects.filter(
+            to_user=OuterRef('pk')
+        ).values('to_user').annotate(
+            total=Sum(
+                Case(
+                    When(entry_type='reversal', then=-F('amount')),
+                    default=F('amount'),
+                )
+            )
+        ).values('total')
+        
+        users = User.objects.all()
+        if user_ids is not None:
+            users = users.filter(pk__in=list(user_ids))
+        
+        updated = users.update(credit_balance=Coalesce(Subquery(ledger_balance), 0))
+        if updated:
+            # Host profiles (with total_credits) are embedded in cached project lists
+            bump_projects_version()
+        logger.info(f"Rebuilt credit balances for {updated} user(s)")
+        return updated
+    
     @staticmethod
     def get_user_ledger(user: User, limit: int = 50):
         """
@@ -0,0 +1,98 @@
+"""
+Tests for the denormalized User.credit_balance column.
+"""
+from django.db import IntegrityError
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.contributions.models import Contribution
+from apps.credits.models import CreditLedgerEntry
+from apps.credits.services import CreditService
+from apps.projects.models import Project
+from apps.users.models import User
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+def make_user(name):
+    return User.objects.create(email=f'{name}@example.com', username=name, display_name=name)
+
+
+def make_project(host, title='Credit test project'):
+    return Project.objects.create(
+        host_user=host,
+        title=title,
+        description='d' * 30,
+        what_it_does='Tests credits',
+        desired_outputs='o' * 30,
+    )
+
+
+def make_accepted_contribution(project, contributor):
+    return Contribution.objects.create(
+        project=project,
+        contributor_user=contributor,
+        title='Contribution',
+        body='b' * 60,
+        status='accepted',
+        decided_by_user=project.host_user,
+        decided_at=timezone.now(),
+    )
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CreditBalanceTests(TestCase):
+
+    def setUp(self):
+        self.host = make_user('host')
+        self.contributor = make_user('contributor')
+        self.project = make_project(self.host)
+        self.contribution = make_accepted_contribution(self.project, self.contributor)
+
+    def balance(self, user):
+        return User.objects.values_list('credit_balance', flat=True).get(pk=user.pk)
+
+    def test_award_increments_balance(self):
+        CreditService.award_credit(self.contributor, self.host, self.project, self.contribution, amount=2)
+
+        self.assertEqual(self.balance(self.contributor), 2)
+        self.assertEqual(self.balance(self.contributor), CreditService.get_user_credit_balance(self.contributor))
+
+    def test_reversal_decrements_balance(self):
+        CreditService.award_credit(self.contributor, self.host, self.project, self.contribution, amount=3)
+        CreditLedgerEntry.objects.create(
+            to_user=self.contributor,
+            created_by_user=self.host,
+            project=self.project,
+            contribution=self.contribution,
+            amount=1,
+            entry_type='reversal',
+        )
+
+        self.assertEqual(self.balance(self.contributor), 2)
+        self.assertEqual(self.balance(self.contributor), CreditService.get_user_credit_balance(self.contributor))
+
+    def test_duplicate_award_leaves_balance_unchanged(self):
+        CreditService.award_credit(self.contributor, self.host, self.project, self.contribution)
+
+        with self.assertRaises(IntegrityError):
+            CreditService.award_credit(self.contributor, self.host, self.project, self.contribution)
+        self.assertEqual(self.balance(self.contributor), 1)
+
+    def test_full_save_does_not_overwrite_balance(self):
+        stale = User.objects.get(pk=self.contributor.pk)
+        CreditService.award_credit(self.contributor, self.host, self.project, self.contribution)
+
+        stale.bio = 'Updated bio'
+        stale.save()
+
+        self.assertEqual(self.balance(self.contributor), 1)
+
+    def test_rebuild_repairs_drift(self):
+        CreditService.award_credit(self.contributor, self.host, self.project, self.contribution)
+        User.objects.filter(pk=self.contributor.pk).update(credit_balance=42)
+
+        CreditService.rebuild_credit_balances(user_ids=[self.contributor.pk])
+
+        self.assertEqual(self.balance(self.contributor), 1)
+        self.assertEqual(self.balance(self.host), 0)
@@ -5,6 +5,7 @@ from apps.credits.models import CreditLedgerEntry
 from apps.credits.serializers import CreditLedgerEntrySerializer, CreditBalanceSerializer
 from apps.credits.services import CreditService
 from apps.users.permissions import IsAuthenticatedAndVerified
+from core.fieldsets import SparseQuerysetMixin
 from core.pagination import CustomPageNumberPagination
 from core.responses import SuccessResponse, ErrorResponse
 
@@ -46,7 +47,7 @@ class UserCreditBalanceView(views.APIView):
         return SuccessResponse(data=data)
 
 
-class UserCreditLedgerView(generics.ListAPIView):
+class UserCreditLedgerView(SparseQuerysetMixin, generics.ListAPIView):
     """
     Get the credit ledger (transaction history) for the authenticated user.
     
@@ -93,7 +94,7 @@ class UserPublicCreditsView(views.APIView):
                 status_code=status.HTTP_404_NOT_FOUND
             )
         
-        total_credits = CreditService.get_user_credit_balance(user)
+        total_credits = user.total_credits
         
         data = {
             'user_id': str(user.id),
@@ -63,7 +63,7 @@ class ModerationLog(models.Model):
     
     def save(self, *args, **kwargs):
         # Ensure immutability (only create, no updates)
-        if self.pk:
+        if not self._state.adding:
             raise ValueError("Moderation logs are immutable and cannot be updated")
         super().save(*args, **kwargs)
     
@@ -3,6 +3,7 @@ Service layer for moderation actions.
 
 Handles admin content moderation with audit logging.
 """
+from django.db import transaction
 from django.utils import timezone
 from apps.moderation.models import ModerationLog
 
@@ -78,6 +79,7 @@ class ModerationService:
         return project, log_entry
     
     @staticmethod
+    @transaction.atomic
     def soft_delete_contribution(contribution, moderator, reason, request=None):
         """
         Soft delete a contribution (sets status to DECLINED, preserves data).
@@ -92,13 +94,25 @@ class ModerationService:
             tuple: (contribution, log_entry)
         """
         from apps.contributions.models import Contribution
+        from apps.contributions.services import ContributionService
         
-        # Update contribution status
+        # Conditional update on the status we saw, so a concurrent accept,
+        # decline or delete cannot make the counters move twice
         original_status = contribution.status
-        contribution.status = 'declined'
-        contribution.decided_by = moderator
-        contribution.decided_at = timezone.now()
-        contribution.save(update_fields=['status', 'decided_by', 'decided_at'])
+        while original_status != 'declined':
+            now = timezone.now()
+            changed = Contribution.objects.filter(pk=contribution.pk, status=original_status).update(
+                status='declined',
+                decided_by_user=moderator,
+                decided_at=now,
+                updated_at=now,
+            )
+            if changed:
+                ContributionService.update_project_counters(contribution.project_id, original_status, 'declined')
+                break
+            # Someone else changed it first: retry from the current status
+            original_status = Contribution.objects.values_list('status', flat=True).get(pk=contribution.pk)
+        contribution.refresh_from_db(fields=ContributionService.DECISION_FIELDS)
         
         # Log the action
         log_entry = ModerationService.log_action(
@@ -106,7 +120,7 @@ class ModerationService:
             moderator=moderator,
             target_type='contribution',
             target_id=contribution.id,
-            target_description=f"Contribution to {contribution.project.title} by {contribution.contributor.display_name} (was {original_status})",
+            target_description=f"Contribution to {contribution.project.title} by {contribution.contributor_user.display_name} (was {original_status})",
             reason=reason,
             request=request
         )
@@ -176,10 +190,14 @@ class ModerationService:
         return user, log_entry
     
     @staticmethod
+    @transaction.atomic
     def reverse_credit(ledger_entry, moderator, reason, request=None):
         """
         Reverse a credit transaction (creates offsetting entry).
         
+        The reversal entry, the recipient's credit_balance update and the audit
+        log are written in one transaction.
+        
         Args:
             ledger_entry: CreditLedgerEntry to reverse
             moderator: Admin user performing action
@@ -191,16 +209,14 @@ class ModerationService:
         """
         from apps.credits.models import CreditLedgerEntry
         
-        # Create reversal entry
+        # Create reversal entry (amount stays positive; reversals are subtracted from the balance)
         reversal_entry = CreditLedgerEntry.objects.create(
             to_user=ledger_entry.to_user,
-            from_user=moderator,
+            created_by_user=moderator,
             entry_type='reversal',
-            amount=-ledger_entry.amount,
+            amount=ledger_entry.amount,
             project=ledger_entry.project,
             contribution=ledger_entry.contribution,
-            reason=f"Reversal by admin: {reason}",
-            related_entry_id=ledger_entry.id
         )
         
         # Log the action
@@ -17,5 +17,8 @@ urlpatterns = [
     
     # Credit Reversal
     path('credits/<uuid:entry_id>/reverse/', views.AdminReverseCreditView.as_view(), name='reverse-credit'),
+    
+    # Database connection pool metrics
+    path('db-pool/', views.AdminDatabasePoolStatsView.as_view(), name='db-pool-stats'),
 ]
 
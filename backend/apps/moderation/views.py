@@ -3,6 +3,9 @@ Admin moderation API views.
 
 Handles soft-delete, ban/unban, and credit reversal actions.
 """
+import os
+
+from django.conf import settings
 from rest_framework import status, views
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
@@ -13,6 +16,7 @@ from apps.projects.models import Project
 from apps.contributions.models import Contribution
 from apps.users.models import User
 from apps.credits.models import CreditLedgerEntry
+from core.db_pool import get_pool_stats
 from core.responses import SuccessResponse, ErrorResponse
 
 
@@ -71,12 +75,19 @@ class AdminSoftDeleteContributionView(views.APIView):
                 status_code=status.HTTP_400_BAD_REQUEST
             )
         
-        contribution, log_entry = ModerationService.soft_delete_contribution(
-            contribution=contribution,
-            moderator=request.user,
-            reason=reason,
-            request=request
-        )
+        try:
+            contribution, log_entry = ModerationService.soft_delete_contribution(
+                contribution=contribution,
+                moderator=request.user,
+                reason=reason,
+                request=request
+            )
+        except Contribution.DoesNotExist:
+            # Deleted by its contributor while we were declining it
+            return ErrorResponse(
+                detail="Contribution not found.",
+                status_code=status.HTTP_404_NOT_FOUND
+            )
         
         return SuccessResponse(
             data={
@@ -222,3 +233,22 @@ class AdminReverseCreditView(views.APIView):
             message="Credit reversed successfully"
         )
 
+
+
+class AdminDatabasePoolStatsView(views.APIView):
+    """
+    GET /api/v1/admin/db-pool/
+    
+    Connection pool metrics for the worker process serving the request.
+    Admin only.
+    """
+    permission_classes = (IsAdminUser,)
+    
+    def get(self, request):
+        return SuccessResponse(
+            data={
+                'mode': settings.DATABASE_POOL_MODE,
+                'pid': os.getpid(),
+                'pools': get_pool_stats(),
+            }
+        )
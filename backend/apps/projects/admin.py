@@ -1,5 +1,20 @@
-from django.contrib import admin
+from django import forms
+from django.contrib import admin, messages
+from django.contrib.admin.helpers import ActionForm
 from .models import Project, ProjectTag, ProjectTagMap
+from .services import ProjectTagService
+
+
+def parse_tag_names(value):
+    """Split a comma-separated tag list into normalized names."""
+    return {tag.strip().lower() for tag in (value or '').split(',') if tag.strip()}
+
+
+class RetagActionForm(ActionForm):
+    """Extra action-bar fields for the bulk retag action."""
+    
+    add_tags = forms.CharField(required=False, label='Add tags', help_text='Comma-separated')
+    remove_tags = forms.CharField(required=False, label='Remove tags', help_text='Comma-separated')
 
 
 @admin.register(Project)
@@ -14,7 +29,7 @@ class ProjectAdmin(admin.ModelAdmin):
         'created_at',
         'updated_at'
     ]
-    list_filter = ['status', 'difficulty', 'created_at']
+    list_filter = ['status', 'difficulty', 'created_at', ('deletion_requested_at', admin.EmptyFieldListFilter)]
     search_fields = ['title', 'description', 'host_user__email', 'host_user__display_name']
     ordering = ['-created_at']
     
@@ -28,6 +43,9 @@ class ProjectAdmin(admin.ModelAdmin):
         ('Metadata', {
             'fields': ('difficulty', 'estimated_time', 'github_url')
         }),
+        ('Contributions', {
+            'fields': ('contribution_count', 'pending_contribution_count', 'accepted_contribution_count')
+        }),
         ('Search', {
             'fields': ('search_vector',),
             'classes': ('collapse',)
@@ -37,7 +55,45 @@ class ProjectAdmin(admin.ModelAdmin):
         }),
     )
     
-    readonly_fields = ['search_vector', 'created_at', 'updated_at']
+    readonly_fields = [
+        'search_vector',
+        'contribution_count',
+        'pending_contribution_count',
+        'accepted_contribution_count',
+        'created_at',
+        'updated_at'
+    ]
+    
+    action_form = RetagActionForm
+    actions = ['retag_projects']
+    
+    @admin.action(description='Add/remove tags on selected projects')
+    def retag_projects(self, request, queryset):
+        """Apply the action-bar tag lists to every selected project."""
+        add = parse_tag_names(request.POST.get('add_tags'))
+        remove = parse_tag_names(request.POST.get('remove_tags'))
+        
+        too_long = [name for name in add if len(name) > 50]
+        if too_long:
+            self.message_user(
+                request,
+                f"Tags too long (max 50 characters): {', '.join(sorted(too_long))}",
+                level=messages.ERROR
+            )
+            return
+        if not add and not remove:
+            self.message_user(request, 'Enter tags to add or remove.', level=messages.WARNING)
+            return
+        
+        result = ProjectTagService.retag_projects(
+            queryset.values_list('pk', flat=True), add=add, remove=remove
+        )
+        self.message_user(
+            request,
+            f"Retagged {queryset.count()} project(s): "
+            f"{result['added']} tag(s) added, {result['removed']} removed.",
+            level=messages.SUCCESS
+        )
 
 
 @admin.register(ProjectTag)
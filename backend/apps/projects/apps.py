@@ -5,3 +5,6 @@ class ProjectsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.projects'
     verbose_name = 'Projects'
+
+    def ready(self):
+        from apps.projects import signals  # noqa: F401
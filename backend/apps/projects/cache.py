@@ -0,0 +1,112 @@
+"""
+Redis-backed cache for project list/search (and facet) responses.
+
+Entries are keyed by the normalized query (search, tags, status, difficulty,
+ordering, pagination) plus a global "projects version". Any project or tag
+write bumps the version, which orphans every cached page at once (O(1)
+invalidation); orphaned entries simply expire.
+"""
+import hashlib
+import json
+import logging
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = 'projects:version'
+HITS_KEY = 'projects:list:hits'
+MISSES_KEY = 'projects:list:misses'
+
+# Query parameters that affect the list response, in key order
+CACHED_PARAMS = (
+    'search', 'tags', 'status', 'difficulty', 'ordering',
+    'page', 'page_size', 'pagination', 'cursor', 'tag_limit',
+    'fields', 'omit', 'include',
+)
+
+
+def get_projects_version():
+    """Current projects version (initialised to 1 on first use)."""
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, 1, timeout=None)
+        version = cache.get(VERSION_KEY, 1)
+    return version
+
+
+def bump_projects_version():
+    """Invalidate all cached project lists once the current transaction commits."""
+    def _bump():
+        try:
+            cache.incr(VERSION_KEY)
+        except ValueError:
+            # Key missing (evicted or never set): any new value invalidates old entries
+            cache.add(VERSION_KEY, 1, timeout=None)
+        except Exception as e:
+            logger.warning(f"Could not bump projects cache version: {e}")
+
+    transaction.on_commit(_bump)
+
+
+def normalize_list_params(query_params):
+    """Canonical form of the list query so equivalent requests share a cache entry."""
+    normalized = {}
+    for name in CACHED_PARAMS:
+        value = query_params.get(name)
+        if not value:
+            continue
+        value = value.strip()
+        if name == 'search':
+            value = ' '.join(value.lower().split())
+        elif name == 'tags':
+            value = ','.join(sorted({tag.strip().lower() for tag in value.split(',') if tag.strip()}))
+        if value:
+            normalized[name] = value
+    return normalized
+
+
+def list_cache_key(request, namespace='list'):
+    """Versioned cache key for a project list (or facets) request."""
+    payload = json.dumps(
+        [request.get_host(), normalize_list_params(request.query_params)],
+        sort_keys=True,
+    )
+    digest = hashlib.sha1(payload.encode('utf-8')).hexdigest()
+    return f'projects:{namespace}:v{get_projects_version()}:{digest}'
+
+
+def get_cached_list(key):
+    """Return cached response data or None, recording a hit/miss."""
+    data = cache.get(key)
+    _incr_metric(HITS_KEY if data is not None else MISSES_KEY)
+    return data
+
+
+def set_cached_list(key, data):
+    cache.set(key, data, timeout=settings.PROJECT_LIST_CACHE_TIMEOUT)
+
+
+def get_list_cache_stats():
+    """Hit/miss counters for the project list cache."""
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    total = hits + misses
+    return {
+        'version': cache.get(VERSION_KEY),
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / total, 4) if total else None,
+    }
+
+
+def reset_list_cache_stats():
+    cache.delete_many([HITS_KEY, MISSES_KEY])
+
+
+def _incr_metric(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 1, timeout=None)
@@ -0,0 +1,49 @@
+"""
+Per-project statistics for the host dashboard.
+
+Everything comes from one query over the host's projects: each statistic is
+a correlated subquery that PostgreSQL answers from an index on the child
+table (contrib_project_status_idx for contribution counts and the newest
+pending submission, chat_msg_proj_time_idx for the latest chat message).
+"""
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from apps.chat.models import ChatMessage
+from apps.contributions.models import Contribution
+from apps.projects.models import Project
+
+
+def _contribution_count(status):
+    """Correlated COUNT(*) of a project's contributions with the given status."""
+    return Coalesce(
+        Subquery(
+            Contribution.objects.filter(project=OuterRef('pk'), status=status)
+            .order_by()
+            .values('project')
+            .annotate(total=Count('id'))
+            .values('total'),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def host_dashboard_queryset(user):
+    """The user's hosted projects annotated with contribution and chat statistics."""
+    newest_pending = Contribution.objects.filter(
+        project=OuterRef('pk'), status='pending'
+    ).order_by('-created_at').values('created_at')[:1]
+    latest_message = ChatMessage.objects.filter(
+        project=OuterRef('pk')
+    ).order_by('-created_at').values('created_at')[:1]
+
+    return Project.visible.filter(host_user=user).annotate(
+        pending_count=_contribution_count('pending'),
+        accepted_count=_contribution_count('accepted'),
+        declined_count=_contribution_count('declined'),
+        newest_pending_at=Subquery(newest_pending),
+        last_message_at=Subquery(latest_message),
+    ).only(
+        'id', 'title', 'status', 'difficulty', 'created_at', 'updated_at'
+    ).order_by('-created_at')
@@ -0,0 +1,43 @@
+"""
+Row shape for the streaming project export.
+
+Projects are read as plain dicts (no model instances, no serializer) and
+tag names are attached per chunk with one grouped query on the tag map.
+"""
+from django.db.models import F
+
+from apps.projects.models import Project, ProjectTagMap
+
+PROJECT_EXPORT_COLUMNS = (
+    'id', 'title', 'description', 'status', 'difficulty', 'estimated_time',
+    'github_url', 'host_user_id', 'host_display_name', 'tags',
+    'contribution_count', 'pending_contribution_count', 'accepted_contribution_count',
+    'created_at', 'updated_at',
+)
+
+
+def export_rows_queryset(queryset):
+    """
+    Values queryset for exporting the projects matched by a filtered queryset.
+
+    Filter/search annotations, ordering and DISTINCT are folded into a pk
+    subquery; rows come back in creation order.
+    """
+    project_ids = queryset.order_by().values('pk')
+    return Project.objects.filter(pk__in=project_ids).order_by('created_at', 'id').values(
+        *[column for column in PROJECT_EXPORT_COLUMNS if column not in ('host_display_name', 'tags')],
+        host_display_name=F('host_user__display_name'),
+    )
+
+
+def attach_tags(rows):
+    """Add a sorted 'tags' list to each row of a chunk using one query."""
+    tags_by_project = {row['id']: [] for row in rows}
+    tag_maps = ProjectTagMap.objects.filter(
+        project_id__in=tags_by_project
+    ).values_list('project_id', 'tag__name')
+    for project_id, tag_name in tag_maps:
+        tags_by_project[project_id].append(tag_name)
+    for row in rows:
+        row['tags'] = sorted(tags_by_project[row['id']])
+    return rows
@@ -0,0 +1,55 @@
+"""
+Facet counts for the project list sidebar.
+
+Status and difficulty counts come from a single conditional-aggregate pass
+over the filtered projects; tag counts from one grouped query on the tag map
+restricted to the same projects.
+"""
+from django.db.models import Count, Q
+
+from apps.projects.models import Project, ProjectTagMap
+
+DEFAULT_TAG_LIMIT = 20
+MAX_TAG_LIMIT = 100
+
+
+def compute_project_facets(queryset, tag_limit=DEFAULT_TAG_LIMIT):
+    """
+    Count projects per status, difficulty and (top) tag.
+    
+    Args:
+        queryset: Filtered Project queryset (as built by the list view)
+        tag_limit: Maximum number of tags to return, most used first
+    
+    Returns:
+        dict: total, status, difficulty and tags facet lists
+    """
+    # Filter/search annotations, ordering and DISTINCT are folded into a pk subquery
+    project_ids = queryset.order_by().values('pk')
+    projects = Project.objects.filter(pk__in=project_ids)
+    
+    aggregates = {'total': Count('pk')}
+    for value, _ in Project.STATUS_CHOICES:
+        aggregates[f'status_{value}'] = Count('pk', filter=Q(status=value))
+    for value, _ in Project.DIFFICULTY_CHOICES:
+        aggregates[f'difficulty_{value}'] = Count('pk', filter=Q(difficulty=value))
+    counts = projects.aggregate(**aggregates)
+    
+    tags = ProjectTagMap.objects.filter(
+        project_id__in=project_ids
+    ).values('tag__name').annotate(
+        count=Count('project_id')
+    ).order_by('-count', 'tag__name')[:tag_limit]
+    
+    return {
+        'total': counts['total'],
+        'status': [
+            {'value': value, 'label': label, 'count': counts[f'status_{value}']}
+            for value, label in Project.STATUS_CHOICES
+        ],
+        'difficulty': [
+            {'value': value, 'label': label, 'count': counts[f'difficulty_{value}']}
+            for value, label in Project.DIFFICULTY_CHOICES
+        ],
+        'tags': [{'name': row['tag__name'], 'count': row['count']} for row in tags],
+    }
@@ -0,0 +1,86 @@
+"""
+Backfill projects.search_vector with the database-side search document.
+
+Rows are processed in primary-key chunks, each chunk is one short UPDATE
+transaction, and chunks are spread across worker threads (one database
+connection each) so large tables backfill without a long table lock. At
+most two chunks per worker are queued at a time, so the ID listing keeps
+pace with the updates instead of reading the whole table up front.
+
+Usage:
+    python manage.py backfill_search_vectors
+    python manage.py backfill_search_vectors --workers 8 --batch-size 2000 --only-missing
+"""
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections
+
+from apps.projects.models import Project
+
+UPDATE_SQL = """
+    UPDATE projects
+    SET search_vector = project_search_document(id, title, description, desired_outputs)
+    WHERE id = ANY(%s::uuid[])
+"""
+
+
+def update_chunk(project_ids):
+    """Recompute search_vector for one chunk; runs in a worker thread."""
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(UPDATE_SQL, [[str(pk) for pk in project_ids]])
+            return cursor.rowcount
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = 'Recompute search_vector for existing projects in parallel chunks.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Projects per UPDATE statement.')
+        parser.add_argument('--workers', type=int, default=4,
+                            help='Number of parallel worker connections.')
+        parser.add_argument('--only-missing', action='store_true',
+                            help='Only backfill rows whose search_vector is NULL.')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('search_vector is maintained by PostgreSQL triggers only.')
+
+        queryset = Project.objects.order_by('pk')
+        if options['only_missing']:
+            queryset = queryset.filter(search_vector__isnull=True)
+
+        updated = 0
+        window = options['workers'] * 2
+        with ThreadPoolExecutor(max_workers=options['workers']) as executor:
+            pending = set()
+            for project_ids in self.chunks(queryset, options['batch_size']):
+                pending.add(executor.submit(update_chunk, project_ids))
+                if len(pending) < window:
+                    continue
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                updated += self.collect(done, updated)
+            updated += self.collect(wait(pending).done, updated)
+
+        self.stdout.write(self.style.SUCCESS(f'Backfilled search_vector for {updated} project(s).'))
+
+    def collect(self, futures, updated):
+        """Sum the row counts of finished chunks and report progress."""
+        count = sum(future.result() for future in futures)
+        self.stdout.write(f'  {updated + count} project(s) updated', ending='\r')
+        return count
+
+    def chunks(self, queryset, batch_size):
+        """Yield lists of project IDs using keyset pagination on the primary key."""
+        last_pk = None
+        while True:
+            page = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+            project_ids = list(page.values_list('pk', flat=True)[:batch_size])
+            if not project_ids:
+                return
+            last_pk = project_ids[-1]
+            yield project_ids
@@ -0,0 +1,128 @@
+"""
+Benchmark project search: legacy icontains OR-chain vs trigram-indexed search.
+
+Seeds synthetic projects (tagged '[bench]') up to --projects rows, then times
+both query shapes for each search term and prints the median latency.
+
+Usage:
+    python manage.py benchmark_project_search --projects 100000
+    python manage.py benchmark_project_search --query react --query "data pipeline"
+    python manage.py benchmark_project_search --cleanup
+"""
+import random
+import statistics
+import time
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Q
+
+from apps.projects.models import Project, ProjectTag, ProjectTagMap
+from apps.projects.search import search_projects
+from apps.users.models import User
+
+BENCH_EMAIL = 'search-benchmark@interfacehive.local'
+BENCH_PREFIX = '[bench]'
+WORDS = [
+    'react', 'django', 'api', 'dashboard', 'pipeline', 'data', 'mobile', 'auth',
+    'payments', 'search', 'chat', 'analytics', 'design', 'migration', 'testing',
+    'kubernetes', 'postgres', 'frontend', 'backend', 'notifications', 'export',
+]
+TAGS = ['python', 'typescript', 'react', 'django', 'devops', 'ml', 'ui', 'sql', 'go', 'rust']
+
+
+def legacy_search(queryset, search_query):
+    """The pre-trigram query shape: FTS OR icontains chain joined through tags."""
+    words = [f"{word}:*" for word in search_query.split() if word]
+    fts_query = SearchQuery(" & ".join(words), search_type='raw')
+    substring_filter = (
+        Q(title__icontains=search_query) |
+        Q(description__icontains=search_query) |
+        Q(desired_outputs__icontains=search_query) |
+        Q(tag_maps__tag__name__icontains=search_query)
+    )
+    return queryset.filter(
+        Q(search_vector=fts_query) | substring_filter
+    ).annotate(rank=SearchRank('search_vector', fts_query)).order_by('-rank')
+
+
+class Command(BaseCommand):
+    help = 'Compare project search latency (icontains OR-chain vs pg_trgm indexes).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--projects', type=int, default=100000,
+                            help='Ensure at least this many benchmark projects exist.')
+        parser.add_argument('--query', action='append', dest='queries',
+                            help='Search term to benchmark (may be repeated).')
+        parser.add_argument('--runs', type=int, default=5, help='Timed runs per query.')
+        parser.add_argument('--cleanup', action='store_true',
+                            help='Delete benchmark data and exit.')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('This benchmark requires PostgreSQL (pg_trgm).')
+
+        if options['cleanup']:
+            deleted, _ = Project.objects.filter(title__startswith=BENCH_PREFIX).delete()
+            User.objects.filter(email=BENCH_EMAIL).delete()
+            self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} benchmark rows.'))
+            return
+
+        self.seed(options['projects'])
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE projects, project_tags, project_tag_maps')
+
+        queries = options['queries'] or ['dashboard', 'pipe', 'react api']
+        self.stdout.write(f"{'query':<20}{'legacy ms':>12}{'trigram ms':>12}{'speedup':>10}")
+        for query in queries:
+            legacy = self.time_query(lambda: legacy_search(Project.objects.all(), query), options['runs'])
+            trigram = self.time_query(lambda: search_projects(Project.objects.all(), query), options['runs'])
+            speedup = legacy / trigram if trigram else float('inf')
+            self.stdout.write(f"{query:<20}{legacy:>12.1f}{trigram:>12.1f}{speedup:>9.1f}x")
+
+    def time_query(self, build_queryset, runs):
+        """Median wall time (ms) to build the queryset and fetch the first page."""
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            list(build_queryset()[:20])
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
+
+    def seed(self, target):
+        existing = Project.objects.filter(title__startswith=BENCH_PREFIX).count()
+        missing = target - existing
+        if missing <= 0:
+            return
+
+        self.stdout.write(f'Seeding {missing} benchmark projects...')
+        host, _ = User.objects.get_or_create(
+            email=BENCH_EMAIL,
+            defaults={'display_name': 'Search Benchmark', 'username': 'search_benchmark'}
+        )
+        tags = [ProjectTag.objects.get_or_create(name=name)[0] for name in TAGS]
+        rng = random.Random(42)
+
+        def sentence(count):
+            return ' '.join(rng.choice(WORDS) for _ in range(count))
+
+        batch_size = 5000
+        for offset in range(0, missing, batch_size):
+            with transaction.atomic():
+                projects = Project.objects.bulk_create([
+                    Project(
+                        host_user=host,
+                        title=f'{BENCH_PREFIX} {sentence(4)}',
+                        description=sentence(40),
+                        what_it_does=sentence(10),
+                        desired_outputs=sentence(15),
+                    )
+                    for _ in range(min(batch_size, missing - offset))
+                ])
+                # search_vector is filled in by the database triggers
+                ProjectTagMap.objects.bulk_create([
+                    ProjectTagMap(project=project, tag=tag)
+                    for project in projects
+                    for tag in rng.sample(tags, 3)
+                ])
@@ -0,0 +1,68 @@
+"""
+Bulk-import projects from a JSON array or NDJSON file.
+
+Every row uses the project create format (title, description, what_it_does,
+desired_outputs, tags, ...). Rows are imported in batches through
+ProjectImportService; invalid rows are reported and skipped.
+
+Usage:
+    python manage.py import_projects partner.ndjson --host host@example.com
+    python manage.py import_projects partner.json --host host@example.com --batch-size 200
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.projects.services import ProjectImportService
+from apps.users.models import User
+
+
+class Command(BaseCommand):
+    help = 'Import projects in bulk from a JSON array or NDJSON file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='JSON array or NDJSON (one project per line) file.')
+        parser.add_argument('--host', required=True,
+                            help='Email of the user who hosts the imported projects.')
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='Projects validated and inserted per batch.')
+
+    def handle(self, *args, **options):
+        try:
+            host = User.objects.get(email=options['host'])
+        except User.DoesNotExist:
+            raise CommandError(f"No user with email {options['host']}")
+
+        rows = self.read_rows(options['path'])
+        batch_size = options['batch_size']
+        created = 0
+        rejected = 0
+        for offset in range(0, len(rows), batch_size):
+            result = ProjectImportService.import_projects(host, rows[offset:offset + batch_size])
+            created += len(result['created'])
+            rejected += len(result['errors'])
+            for error in result['errors']:
+                self.stderr.write(f"  row {offset + error['index']}: {json.dumps(error['errors'])}")
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {created} project(s); {rejected} row(s) rejected.'
+        ))
+
+    def read_rows(self, path):
+        try:
+            with open(path, encoding='utf-8') as f:
+                content = f.read()
+        except OSError as e:
+            raise CommandError(f'Could not read {path}: {e}')
+
+        try:
+            if content.lstrip().startswith('['):
+                rows = json.loads(content)
+            else:
+                rows = [json.loads(line) for line in content.splitlines() if line.strip()]
+        except json.JSONDecodeError as e:
+            raise CommandError(f'Invalid JSON in {path}: {e}')
+
+        if not all(isinstance(row, dict) for row in rows):
+            raise CommandError('Every row must be a JSON object.')
+        return rows
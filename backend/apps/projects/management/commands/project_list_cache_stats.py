@@ -0,0 +1,37 @@
+"""
+Report hit/miss metrics for the project list cache.
+
+Usage:
+    python manage.py project_list_cache_stats
+    python manage.py project_list_cache_stats --reset
+    python manage.py project_list_cache_stats --invalidate
+"""
+from django.core.management.base import BaseCommand
+
+from apps.projects.cache import bump_projects_version, get_list_cache_stats, reset_list_cache_stats
+
+
+class Command(BaseCommand):
+    help = 'Show (and optionally reset) project list cache hit/miss counters.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true',
+                            help='Reset the hit/miss counters after printing them.')
+        parser.add_argument('--invalidate', action='store_true',
+                            help='Bump the projects version, orphaning every cached list.')
+
+    def handle(self, *args, **options):
+        stats = get_list_cache_stats()
+        hit_rate = f"{stats['hit_rate']:.1%}" if stats['hit_rate'] is not None else 'n/a'
+        self.stdout.write(f"version:  {stats['version']}")
+        self.stdout.write(f"hits:     {stats['hits']}")
+        self.stdout.write(f"misses:   {stats['misses']}")
+        self.stdout.write(f"hit rate: {hit_rate}")
+
+        if options['invalidate']:
+            bump_projects_version()
+            self.stdout.write(self.style.SUCCESS('Project list cache invalidated.'))
+
+        if options['reset']:
+            reset_list_cache_stats()
+            self.stdout.write(self.style.SUCCESS('Counters reset.'))
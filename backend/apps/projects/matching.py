@@ -0,0 +1,183 @@
+"""
+Skill-to-project matching ("projects for me").
+
+Redis keeps an inverted index of tag name -> set of open project IDs.
+Ranking a user's skills is a ZUNIONSTORE over the sets for those skills:
+each project's score is the number of skills it matches. A reverse set per
+project (tag names it is indexed under) lets tag and status changes be
+applied incrementally.
+
+Without a Redis cache backend (e.g. local development) matching falls back
+to a grouped query over project_tag_maps.
+"""
+import logging
+import uuid
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count
+
+from apps.projects.models import ProjectTagMap
+
+logger = logging.getLogger(__name__)
+
+TAG_KEY = 'projects:open_by_tag:{}'
+PROJECT_KEY = 'projects:open_tags_of:{}'
+SCRATCH_KEY = 'projects:skill_match:{}'
+
+DEFAULT_MATCH_LIMIT = 20
+MAX_MATCH_LIMIT = 50
+
+
+def get_redis():
+    """Raw Redis client behind the default cache, or None for other backends."""
+    try:
+        from django_redis import get_redis_connection
+        return get_redis_connection('default')
+    except (ImportError, NotImplementedError):
+        return None
+
+
+def normalize_skills(skills):
+    """Lowercased, de-duplicated skill names (matching how tags are stored)."""
+    return sorted({str(skill).strip().lower() for skill in skills or [] if str(skill).strip()})
+
+
+def _tag_key(name):
+    return cache.make_key(TAG_KEY.format(name))
+
+
+def _project_key(project_id):
+    return cache.make_key(PROJECT_KEY.format(project_id))
+
+
+def _open_tags_by_project(project_ids=None):
+    """{project ID (str): set of tag names} for open projects."""
+    rows = ProjectTagMap.objects.filter(project__status='open')
+    if project_ids is not None:
+        rows = rows.filter(project_id__in=project_ids)
+    tags = defaultdict(set)
+    for project_id, name in rows.values_list('project_id', 'tag__name').iterator(chunk_size=5000):
+        tags[str(project_id)].add(name)
+    return tags
+
+
+def sync_projects(project_ids):
+    """
+    Bring the index in line with the current tags/status of some projects.
+    
+    Closed, draft or deleted projects are removed from every tag set.
+    """
+    redis = get_redis()
+    if redis is None:
+        return
+    
+    project_ids = [str(project_id) for project_id in project_ids]
+    current = _open_tags_by_project(project_ids)
+    
+    pipe = redis.pipeline()
+    for project_id in project_ids:
+        pipe.smembers(_project_key(project_id))
+    indexed = {
+        project_id: {member.decode('utf-8') for member in members}
+        for project_id, members in zip(project_ids, pipe.execute())
+    }
+    
+    pipe = redis.pipeline()
+    for project_id in project_ids:
+        new_tags = current.get(project_id, set())
+        old_tags = indexed[project_id]
+        for name in old_tags - new_tags:
+            pipe.srem(_tag_key(name), project_id)
+        for name in new_tags - old_tags:
+            pipe.sadd(_tag_key(name), project_id)
+        pipe.delete(_project_key(project_id))
+        if new_tags:
+            pipe.sadd(_project_key(project_id), *new_tags)
+    pipe.execute()
+
+
+def rebuild_index():
+    """
+    Rebuild the whole index from open projects' tags.
+    
+    Returns:
+        int: Number of open projects indexed, or None without Redis
+    """
+    redis = get_redis()
+    if redis is None:
+        return None
+    
+    tags_by_project = _open_tags_by_project()
+    projects_by_tag = defaultdict(set)
+    for project_id, names in tags_by_project.items():
+        for name in names:
+            projects_by_tag[name].add(project_id)
+    
+    stale = list(redis.scan_iter(match=cache.make_key(TAG_KEY.format('*')), count=1000))
+    stale += list(redis.scan_iter(match=cache.make_key(PROJECT_KEY.format('*')), count=1000))
+    
+    pipe = redis.pipeline(transaction=True)
+    if stale:
+        pipe.delete(*stale)
+    for name, project_ids in projects_by_tag.items():
+        pipe.sadd(_tag_key(name), *project_ids)
+    for project_id, names in tags_by_project.items():
+        pipe.sadd(_project_key(project_id), *names)
+    pipe.execute()
+    return len(tags_by_project)
+
+
+def schedule_index_sync(*project_ids):
+    """Sync the given projects into the index once the transaction commits."""
+    def _sync():
+        try:
+            sync_projects(project_ids)
+        except Exception as e:
+            logger.warning(f"Could not update skill match index: {e}")
+    
+    transaction.on_commit(_sync)
+
+
+def match_projects(skills, limit=DEFAULT_MATCH_LIMIT, exclude_ids=()):
+    """
+    Open projects ranked by how many of the given skills they are tagged with.
+    
+    Args:
+        skills: Skill names (normalized here)
+        limit: Maximum number of projects
+        exclude_ids: Project IDs to leave out (own / already contributed)
+    
+    Returns:
+        list: (project ID, matched skill count) tuples, best first
+    """
+    skills = normalize_skills(skills)
+    if not skills:
+        return []
+    
+    redis = get_redis()
+    if redis is None:
+        return _match_projects_in_database(skills, limit, exclude_ids)
+    
+    scratch = cache.make_key(SCRATCH_KEY.format(uuid.uuid4().hex))
+    pipe = redis.pipeline()
+    # Plain sets union with a score of 1 per member, so scores count matched skills
+    pipe.zunionstore(scratch, [_tag_key(name) for name in skills])
+    if exclude_ids:
+        pipe.zrem(scratch, *[str(project_id) for project_id in exclude_ids])
+    pipe.zrevrange(scratch, 0, limit - 1, withscores=True)
+    pipe.delete(scratch)
+    results = pipe.execute()[-2]
+    return [(uuid.UUID(member.decode('utf-8')), int(score)) for member, score in results]
+
+
+def _match_projects_in_database(skills, limit, exclude_ids):
+    rows = ProjectTagMap.objects.filter(
+        tag__name__in=skills, project__status='open'
+    ).exclude(
+        project_id__in=list(exclude_ids)
+    ).values('project_id').annotate(
+        matched=Count('tag_id')
+    ).order_by('-matched')[:limit]
+    return [(row['project_id'], row['matched']) for row in rows]
@@ -0,0 +1,57 @@
+# Generated by Django 5.0 on 2026-10-16 22:36
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_contribution_counters(apps, schema_editor):
+    """Populate the counters from the existing contributions."""
+    Project = apps.get_model('projects', 'Project')
+    Contribution = apps.get_model('contributions', 'Contribution')
+
+    def count_subquery(**filters):
+        return Coalesce(
+            Subquery(
+                Contribution.objects.filter(project=OuterRef('pk'), **filters)
+                .order_by()
+                .values('project')
+                .annotate(total=Count('id'))
+                .values('total'),
+                output_field=IntegerField(),
+            ),
+            Value(0),
+        )
+
+    Project.objects.update(
+        contribution_count=count_subquery(),
+        pending_contribution_count=count_subquery(status='pending'),
+        accepted_contribution_count=count_subquery(status='accepted'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_projectnote_projectresource'),
+        ('contributions', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='accepted_contribution_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='contribution_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='pending_contribution_count',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_contribution_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,112 @@
+"""
+Maintain projects.search_vector in the database.
+
+search_vector is computed by BEFORE triggers on projects (on insert, and on
+update only when title, description or desired_outputs change) and refreshed
+by statement-level triggers on project_tag_maps so tag names are searchable
+too. Existing rows are backfilled separately with
+`python manage.py backfill_search_vectors` to avoid a long migration lock.
+"""
+from django.db import migrations
+
+FORWARD_SQL = """
+CREATE OR REPLACE FUNCTION project_search_document(
+    p_id uuid, p_title text, p_description text, p_outputs text
+) RETURNS tsvector LANGUAGE sql STABLE AS $$
+    SELECT setweight(to_tsvector('english', coalesce(p_title, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(p_description, '')), 'B')
+        || setweight(to_tsvector('english', coalesce(p_outputs, '')), 'C')
+        || setweight(to_tsvector('english', coalesce((
+            SELECT string_agg(t.name, ' ')
+            FROM project_tag_maps m
+            JOIN project_tags t ON t.id = m.tag_id
+            WHERE m.project_id = p_id
+        ), '')), 'D')
+$$;
+
+CREATE OR REPLACE FUNCTION projects_search_vector_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.search_vector := project_search_document(
+        NEW.id, NEW.title, NEW.description, NEW.desired_outputs
+    );
+    RETURN NEW;
+END
+$$;
+
+CREATE TRIGGER projects_search_vector_insert
+    BEFORE INSERT ON projects
+    FOR EACH ROW EXECUTE FUNCTION projects_search_vector_trigger();
+
+CREATE TRIGGER projects_search_vector_update
+    BEFORE UPDATE OF title, description, desired_outputs ON projects
+    FOR EACH ROW
+    WHEN (
+        OLD.title IS DISTINCT FROM NEW.title
+        OR OLD.description IS DISTINCT FROM NEW.description
+        OR OLD.desired_outputs IS DISTINCT FROM NEW.desired_outputs
+    )
+    EXECUTE FUNCTION projects_search_vector_trigger();
+
+CREATE OR REPLACE FUNCTION project_tag_maps_inserted_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE projects p
+    SET search_vector = project_search_document(p.id, p.title, p.description, p.desired_outputs)
+    WHERE p.id IN (SELECT DISTINCT project_id FROM new_rows);
+    RETURN NULL;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION project_tag_maps_deleted_trigger() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    UPDATE projects p
+    SET search_vector = project_search_document(p.id, p.title, p.description, p.desired_outputs)
+    WHERE p.id IN (SELECT DISTINCT project_id FROM old_rows);
+    RETURN NULL;
+END
+$$;
+
+CREATE TRIGGER project_tag_maps_search_vector_insert
+    AFTER INSERT ON project_tag_maps
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_tag_maps_inserted_trigger();
+
+CREATE TRIGGER project_tag_maps_search_vector_delete
+    AFTER DELETE ON project_tag_maps
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION project_tag_maps_deleted_trigger();
+"""
+
+REVERSE_SQL = """
+DROP TRIGGER IF EXISTS project_tag_maps_search_vector_delete ON project_tag_maps;
+DROP TRIGGER IF EXISTS project_tag_maps_search_vector_insert ON project_tag_maps;
+DROP TRIGGER IF EXISTS projects_search_vector_update ON projects;
+DROP TRIGGER IF EXISTS projects_search_vector_insert ON projects;
+DROP FUNCTION IF EXISTS project_tag_maps_deleted_trigger();
+DROP FUNCTION IF EXISTS project_tag_maps_inserted_trigger();
+DROP FUNCTION IF EXISTS projects_search_vector_trigger();
+DROP FUNCTION IF EXISTS project_search_document(uuid, text, text, text);
+"""
+
+
+def create_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(FORWARD_SQL)
+
+
+def drop_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(REVERSE_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_project_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_triggers, drop_triggers),
+    ]
@@ -1,14 +1,26 @@
 import uuid
 from django.db import models
-from django.contrib.postgres.search import SearchVector, SearchVectorField
-from django.contrib.postgres.indexes import GinIndex
+from django.db.models.functions import Upper
+from django.contrib.postgres.search import SearchVectorField
+from django.contrib.postgres.indexes import GinIndex, OpClass
 
+from core.models import DirtyFieldsMixin
 
-class Project(models.Model):
+
+class VisibleProjectManager(models.Manager):
+    """Project.visible: hides projects waiting for background deletion."""
+    
+    def get_queryset(self):
+        return super().get_queryset().filter(deletion_requested_at__isnull=True)
+
+
+class Project(DirtyFieldsMixin, models.Model):
     """
     Contribution request project posted by hosts.
     
     Includes full-text search via PostgreSQL GIN index on search_vector field.
+    search_vector (title, description, desired outputs and tag names) is
+    maintained by database triggers; see migration 0007_search_vector_triggers.
     """
     
     STATUS_CHOICES = [
@@ -23,6 +35,17 @@ class Project(models.Model):
         ('advanced', 'Advanced'),
     ]
     
+    COUNTER_FIELDS = (
+        'contribution_count',
+        'pending_contribution_count',
+        'accepted_contribution_count',
+    )
+    DB_MAINTAINED_FIELDS = COUNTER_FIELDS + ('search_vector',)
+    
+    # Counters (F() updates) and search_vector (database trigger) are maintained
+    # in the database; never clobber them from a full save
+    save_excluded_fields = DB_MAINTAINED_FIELDS
+    
     # Primary Key
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     
@@ -57,13 +80,27 @@ class Project(models.Model):
     estimated_time = models.CharField(max_length=50, blank=True, default='')
     github_url = models.URLField(max_length=500, blank=True, default='')
     
+    # Denormalized contribution counters (maintained by ContributionService,
+    # repaired by the reconcile_contribution_counters task)
+    contribution_count = models.IntegerField(default=0, editable=False)
+    pending_contribution_count = models.IntegerField(default=0, editable=False)
+    accepted_contribution_count = models.IntegerField(default=0, editable=False)
+    
     # Full-Text Search (PostgreSQL GIN index)
     search_vector = SearchVectorField(null=True, editable=False)
     
+    # Set when the host deletes the project; children are purged in the background
+    deletion_requested_at = models.DateTimeField(null=True, blank=True, editable=False)
+    
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    # The default manager stays unfiltered (admin, related lookups, purges);
+    # public endpoints use visible
+    objects = models.Manager()
+    visible = VisibleProjectManager()
+    
     class Meta:
         db_table = 'projects'
         verbose_name = 'Project'
@@ -79,32 +116,42 @@ class Project(models.Model):
                 name='project_status_created_idx'
             ),
             GinIndex(fields=['search_vector'], name='project_search_idx'),
+            # pg_trgm indexes on UPPER(column) serve Django's icontains lookups
+            GinIndex(
+                OpClass(Upper('title'), name='gin_trgm_ops'),
+                name='project_title_trgm_idx'
+            ),
+            GinIndex(
+                OpClass(Upper('description'), name='gin_trgm_ops'),
+                name='project_desc_trgm_idx'
+            ),
+            GinIndex(
+                OpClass(Upper('desired_outputs'), name='gin_trgm_ops'),
+                name='project_outputs_trgm_idx'
+            ),
+            models.Index(
+                fields=['deletion_requested_at'],
+                condition=models.Q(deletion_requested_at__isnull=False),
+                name='project_pending_delete_idx'
+            ),
         ]
     
     def __str__(self):
         return f"{self.title} (by {self.host_user.display_name})"
     
-    def save(self, *args, **kwargs):
-        super().save(*args, **kwargs)
-        
-        # Update search vector after save to avoid "F() expressions can only be used to update" error
-        # Check if we need to update search vector (optimize if update_fields is present)
-        update_fields = kwargs.get('update_fields', None)
-        text_fields = {'title', 'description', 'desired_outputs'}
+    @property
+    def tag_names(self):
+        """
+        List of tag names for the project.
         
-        should_update = (
-            update_fields is None or 
-            any(field in update_fields for field in text_fields)
+        Served from the prefetch cache when 'tag_maps__tag' was prefetched,
+        otherwise resolved with a single query.
+        """
+        if 'tag_maps' in getattr(self, '_prefetched_objects_cache', {}):
+            return [tag_map.tag.name for tag_map in self.tag_maps.all()]
+        return list(
+            ProjectTag.objects.filter(project_maps__project=self).values_list('name', flat=True)
         )
-        
-        if should_update and self.title and self.description:
-            vector = (
-                SearchVector('title', weight='A', config='english') +
-                SearchVector('description', weight='B', config='english') +
-                SearchVector('desired_outputs', weight='C', config='english')
-            )
-            # Use .update() to handle the expression on the DB side
-            self.__class__.objects.filter(pk=self.pk).update(search_vector=vector)
     
     @property
     def accepted_contributors(self):
@@ -121,8 +168,13 @@ class Project(models.Model):
     
     @property
     def accepted_contributors_count(self):
-        """Count of unique users with accepted contributions."""
-        return self.accepted_contributors.count()
+        """
+        Count of unique users with accepted contributions.
+        
+        Contributors may only submit once per project, so this equals the
+        maintained accepted_contribution_count counter.
+        """
+        return self.accepted_contribution_count
 
 
 class ProjectTag(models.Model):
@@ -146,6 +198,12 @@ class ProjectTag(models.Model):
         verbose_name = 'Project Tag'
         verbose_name_plural = 'Project Tags'
         ordering = ['name']
+        indexes = [
+            GinIndex(
+                OpClass(Upper('name'), name='gin_trgm_ops'),
+                name='tag_name_trgm_idx'
+            ),
+        ]
     
     def __str__(self):
         return self.name
@@ -0,0 +1,250 @@
+"""
+Related projects: precomputed tag-similarity neighbours with FTS re-ranking.
+
+For every tagged project the cache (Redis) holds its top-K most similar
+open projects by tag Jaccard similarity, as [[project_id, score], ...].
+A Celery job rebuilds the whole index from an in-memory inverted index of
+ProjectTagMap; tag writes refresh the affected project and patch its
+neighbours' lists incrementally. Lists expire after two rebuild intervals,
+so entries for projects that were deleted, or that lost all their tags,
+do not outlive the next rebuilds. Requests only re-rank the K stored
+candidates with full-text similarity to the project's title.
+"""
+import heapq
+import logging
+import uuid
+from collections import defaultdict
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count
+
+from apps.projects.models import Project, ProjectTagMap
+
+logger = logging.getLogger(__name__)
+
+INDEX_KEY = 'projects:related:{}'
+PENDING_KEY = 'projects:related:pending:{}'
+
+# Blend of tag overlap (Jaccard, 0..1) and FTS rank of the candidate against the title
+TAG_WEIGHT = 0.7
+TEXT_WEIGHT = 0.3
+
+# Title words used for the FTS part of the score
+MAX_TITLE_TERMS = 10
+
+# Debounce window for incremental updates (seconds)
+UPDATE_DELAY = 5
+
+# Neighbour lists outlive the daily rebuild, but not a deleted project for long
+INDEX_TIMEOUT = 2 * 24 * 3600
+
+# Candidates taken from each tag's open projects (newest first) by the full
+# rebuild, so very common tags cost O(cap) per project instead of O(usage)
+MAX_CANDIDATES_PER_TAG = 500
+
+DEFAULT_RELATED_LIMIT = 10
+MAX_RELATED_LIMIT = 50
+
+
+def index_key(project_id):
+    return INDEX_KEY.format(project_id)
+
+
+def top_neighbours(tag_count, overlaps, tag_counts, k):
+    """
+    Top-k neighbours by Jaccard similarity.
+    
+    Args:
+        tag_count: Number of tags on the source project
+        overlaps: {candidate ID: number of shared tags}
+        tag_counts: {candidate ID: number of tags on the candidate}
+        k: Neighbours to keep
+    
+    Returns:
+        list: [[candidate ID (str), score], ...], best first
+    """
+    scored = (
+        (shared / (tag_count + tag_counts[candidate] - shared), candidate)
+        for candidate, shared in overlaps.items()
+    )
+    return [[str(candidate), round(score, 4)] for score, candidate in heapq.nlargest(k, scored)]
+
+
+def build_related_index():
+    """
+    Recompute the neighbour lists of every tagged project.
+    
+    Returns:
+        int: Number of projects indexed
+    """
+    k = settings.RELATED_PROJECTS_INDEX_SIZE
+    tags_by_project = defaultdict(set)
+    open_projects_by_tag = defaultdict(list)
+    
+    rows = ProjectTagMap.objects.order_by('-project__created_at').values_list(
+        'project_id', 'tag_id', 'project__status'
+    )
+    for project_id, tag_id, status in rows.iterator(chunk_size=5000):
+        tags_by_project[project_id].add(tag_id)
+        if status == 'open':
+            open_projects_by_tag[tag_id].append(project_id)
+    
+    tag_counts = {project_id: len(tags) for project_id, tags in tags_by_project.items()}
+    batch = {}
+    for project_id, tags in tags_by_project.items():
+        candidates = set()
+        for tag_id in tags:
+            candidates.update(open_projects_by_tag[tag_id][:MAX_CANDIDATES_PER_TAG])
+        candidates.discard(project_id)
+        overlaps = {candidate: len(tags & tags_by_project[candidate]) for candidate in candidates}
+        
+        batch[index_key(project_id)] = top_neighbours(len(tags), overlaps, tag_counts, k)
+        if len(batch) >= 1000:
+            cache.set_many(batch, timeout=INDEX_TIMEOUT)
+            batch = {}
+    
+    if batch:
+        cache.set_many(batch, timeout=INDEX_TIMEOUT)
+    return len(tags_by_project)
+
+
+def compute_neighbours(project_id):
+    """Top-k open neighbours of one project, from two grouped queries."""
+    tag_ids = list(ProjectTagMap.objects.filter(project_id=project_id).values_list('tag_id', flat=True))
+    if not tag_ids:
+        return []
+    
+    overlaps = dict(
+        ProjectTagMap.objects.filter(
+            tag_id__in=tag_ids, project__status='open'
+        ).exclude(project_id=project_id).values('project_id').annotate(
+            shared=Count('tag_id')
+        ).values_list('project_id', 'shared')
+    )
+    tag_counts = dict(
+        ProjectTagMap.objects.filter(project_id__in=list(overlaps)).values('project_id').annotate(
+            total=Count('tag_id')
+        ).values_list('project_id', 'total')
+    )
+    return top_neighbours(len(tag_ids), overlaps, tag_counts, settings.RELATED_PROJECTS_INDEX_SIZE)
+
+
+def update_related_index(project_id):
+    """
+    Refresh one project's neighbours and patch the lists of projects that
+    had or now have it as a neighbour. A deleted project's own list is
+    removed.
+    
+    Returns:
+        list: The project's new neighbour list
+    """
+    k = settings.RELATED_PROJECTS_INDEX_SIZE
+    key = index_key(project_id)
+    previous = cache.get(key) or []
+    status = Project.visible.filter(pk=project_id).values_list('status', flat=True).first()
+    if status is None:
+        neighbours = []
+        cache.delete(key)
+    else:
+        neighbours = compute_neighbours(project_id)
+        cache.set(key, neighbours, timeout=INDEX_TIMEOUT)
+    
+    # Only open projects appear in other projects' lists
+    is_open = status == 'open'
+    scores = {candidate: score for candidate, score in neighbours}
+    affected = {candidate for candidate, _ in previous} | set(scores)
+    
+    project_key = str(project_id)
+    stored = cache.get_many([index_key(candidate) for candidate in affected])
+    patched = {}
+    for candidate in affected:
+        candidate_key = index_key(candidate)
+        if candidate_key not in stored:
+            continue
+        entries = [entry for entry in stored[candidate_key] if entry[0] != project_key]
+        if is_open and candidate in scores:
+            # Jaccard similarity is symmetric
+            entries.append([project_key, scores[candidate]])
+        patched[candidate_key] = heapq.nlargest(k, entries, key=lambda entry: entry[1])
+    if patched:
+        cache.set_many(patched, timeout=INDEX_TIMEOUT)
+    
+    return neighbours
+
+
+def schedule_related_update(project_id):
+    """Queue a debounced incremental index update after the transaction commits."""
+    def _enqueue():
+        from apps.projects.tasks import update_related_projects
+        try:
+            if cache.add(PENDING_KEY.format(project_id), 1, timeout=UPDATE_DELAY * 12):
+                update_related_projects.apply_async((str(project_id),), countdown=UPDATE_DELAY)
+        except Exception as e:
+            logger.warning(f"Could not schedule related-projects update for {project_id}: {e}")
+    
+    transaction.on_commit(_enqueue)
+
+
+def schedule_related_rebuild():
+    """Queue a full index rebuild after the transaction commits."""
+    def _enqueue():
+        from apps.projects.tasks import rebuild_related_projects_index
+        try:
+            rebuild_related_projects_index.delay()
+        except Exception as e:
+            logger.warning(f"Could not schedule related-projects rebuild: {e}")
+    
+    transaction.on_commit(_enqueue)
+
+
+def title_search_query(project):
+    """OR of the project's title words, for ranking candidates by text similarity."""
+    words = project.title.split()[:MAX_TITLE_TERMS]
+    query = None
+    for word in words:
+        term = SearchQuery(word)
+        query = term if query is None else query | term
+    return query
+
+
+def get_related_projects(project, limit=DEFAULT_RELATED_LIMIT):
+    """
+    Most similar open projects, each with a related_score attribute.
+    
+    Candidates come from the precomputed index (computed on the spot if
+    missing); on PostgreSQL they are re-ranked with FTS similarity to the
+    title. Projects without tags fall back to FTS over open projects.
+    """
+    entries = cache.get(index_key(project.pk))
+    if entries is None:
+        entries = update_related_index(project.pk)
+    tag_scores = {uuid.UUID(candidate): score for candidate, score in entries}
+    
+    queryset = Project.visible.filter(status='open').exclude(pk=project.pk).select_related(
+        'host_user'
+    ).prefetch_related('tag_maps__tag')
+    text_query = title_search_query(project) if connection.vendor == 'postgresql' else None
+    
+    if tag_scores:
+        queryset = queryset.filter(pk__in=list(tag_scores))
+        if text_query is not None:
+            queryset = queryset.annotate(text_rank=SearchRank('search_vector', text_query))
+    elif text_query is not None:
+        queryset = queryset.filter(search_vector=text_query).annotate(
+            text_rank=SearchRank('search_vector', text_query)
+        ).order_by('-text_rank')[:limit]
+    else:
+        return []
+    
+    projects = list(queryset)
+    for related in projects:
+        related.related_score = round(
+            TAG_WEIGHT * tag_scores.get(related.pk, 0) +
+            TEXT_WEIGHT * min(getattr(related, 'text_rank', 0) or 0, 1),
+            4
+        )
+    projects.sort(key=lambda related: related.related_score, reverse=True)
+    return projects[:limit]
@@ -0,0 +1,57 @@
+"""
+Project search helpers.
+
+Combines PostgreSQL full-text search (GIN index on search_vector) with
+pg_trgm-backed substring matching (GIN trigram indexes on UPPER(column),
+which is what Django's icontains renders to on PostgreSQL).
+"""
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+from django.db.models import Q
+
+from apps.projects.models import ProjectTagMap
+
+# Trigram similarity on the title is blended into the FTS rank with this weight
+TITLE_SIMILARITY_WEIGHT = 0.5
+
+
+def build_fts_query(search_query):
+    """Prefix-matching tsquery for every word of the search string, or None."""
+    words = [f"{word}:*" for word in search_query.split() if word]
+    if not words:
+        return None
+    return SearchQuery(" & ".join(words), search_type='raw')
+
+
+def search_projects(queryset, search_query):
+    """
+    Filter and rank a Project queryset by a free-text search string.
+
+    A project matches when the FTS query matches its search_vector, or the
+    string is a substring of its title, description, desired outputs or one
+    of its tag names. The project columns are served by GIN indexes; tag
+    matches are an IN (subquery) on project_tag_maps, so the OR never spans
+    a join and no ID list is pulled into Python. Ranked results are ordered
+    by -rank, newest first among ties.
+    """
+    substring_filter = (
+        Q(title__icontains=search_query) |
+        Q(description__icontains=search_query) |
+        Q(desired_outputs__icontains=search_query) |
+        Q(pk__in=ProjectTagMap.objects.filter(
+            tag__name__icontains=search_query
+        ).values('project_id'))
+    )
+
+    fts_query = build_fts_query(search_query)
+    if fts_query is None:
+        return queryset.filter(substring_filter)
+
+    # Substring-only matches get an FTS rank of 0 but still rank by title similarity
+    return queryset.filter(
+        Q(search_vector=fts_query) | substring_filter
+    ).annotate(
+        rank=(
+            SearchRank('search_vector', fts_query) +
+            TITLE_SIMILARITY_WEIGHT * TrigramWordSimilarity(search_query, 'title')
+        )
+    ).order_by('-rank', '-created_at', '-id')
@@ -3,10 +3,13 @@ Serializers for project management.
 
 Handles project creation, updates, listing, and tag management.
 """
+from django.conf import settings
 from rest_framework import serializers
-from django.contrib.postgres.search import SearchVector
-from apps.projects.models import Project, ProjectTag, ProjectTagMap, ProjectResource, ProjectNote
+from apps.projects.models import Project, ProjectTag, ProjectResource, ProjectNote
+from apps.projects.services import ProjectTagService
 from apps.users.serializers import UserProfileSerializer
+from apps.users.sideload import SideloadUsersMixin
+from core.fieldsets import SparseFieldsetsMixin
 
 
 class ProjectTagSerializer(serializers.ModelSerializer):
@@ -18,16 +21,18 @@ class ProjectTagSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at']
 
 
-class ProjectListSerializer(serializers.ModelSerializer):
+class ProjectListSerializer(SideloadUsersMixin, SparseFieldsetsMixin, serializers.ModelSerializer):
     """
     Serializer for project list view.
     
     Includes host info, tag names, and contribution count.
-    Optimized for list performance.
+    Optimized for list performance; supports ?fields= / ?omit= and ?include=users.
     """
+    sparse_field_requirements = {'tags': ['tag_maps']}
+    sideload_user_fields = {'host': 'host_user'}
     host = UserProfileSerializer(source='host_user', read_only=True)
     tags = serializers.SerializerMethodField()
-    contribution_count = serializers.SerializerMethodField()
+    contribution_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Project
@@ -47,13 +52,38 @@ class ProjectListSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'host', 'created_at', 'updated_at']
     
     def get_tags(self, obj):
-        """Get list of tag names for the project."""
-        tag_maps = ProjectTagMap.objects.filter(project=obj).select_related('tag')
-        return [tag_map.tag.name for tag_map in tag_maps]
+        """Get list of tag names for the project (uses prefetched tag_maps__tag)."""
+        return obj.tag_names
+
+
+class HostDashboardProjectSerializer(serializers.ModelSerializer):
+    """
+    Serializer for one project on the host dashboard.
+    
+    Statistics are annotations from host_dashboard_queryset().
+    """
+    pending_count = serializers.IntegerField(read_only=True)
+    accepted_count = serializers.IntegerField(read_only=True)
+    declined_count = serializers.IntegerField(read_only=True)
+    newest_pending_at = serializers.DateTimeField(read_only=True)
+    last_message_at = serializers.DateTimeField(read_only=True)
     
-    def get_contribution_count(self, obj):
-        """Get count of contributions to this project."""
-        return obj.contributions.count()
+    class Meta:
+        model = Project
+        fields = [
+            'id',
+            'title',
+            'status',
+            'difficulty',
+            'pending_count',
+            'accepted_count',
+            'declined_count',
+            'newest_pending_at',
+            'last_message_at',
+            'created_at',
+            'updated_at',
+        ]
+        read_only_fields = fields
 
 
 class ProjectDetailSerializer(serializers.ModelSerializer):
@@ -64,8 +94,9 @@ class ProjectDetailSerializer(serializers.ModelSerializer):
     """
     host = UserProfileSerializer(source='host_user', read_only=True)
     tags = serializers.SerializerMethodField()
-    contribution_count = serializers.SerializerMethodField()
+    contribution_count = serializers.IntegerField(read_only=True)
     accepted_contributors = serializers.SerializerMethodField()
+    accepted_contributors_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Project
@@ -84,23 +115,29 @@ class ProjectDetailSerializer(serializers.ModelSerializer):
             'tags',
             'contribution_count',
             'accepted_contributors',
+            'accepted_contributors_count',
             'created_at',
             'updated_at',
         ]
         read_only_fields = ['id', 'host', 'created_at', 'updated_at']
     
     def get_tags(self, obj):
-        """Get list of tag names for the project."""
-        tag_maps = ProjectTagMap.objects.filter(project=obj).select_related('tag')
-        return [tag_map.tag.name for tag_map in tag_maps]
-    
-    def get_contribution_count(self, obj):
-        """Get count of contributions to this project."""
-        return obj.contributions.count()
+        """Get list of tag names for the project (uses prefetched tag_maps__tag)."""
+        return obj.tag_names
     
     def get_accepted_contributors(self, obj):
-        """Get list of users with accepted contributions."""
-        accepted_contributions = obj.contributions.filter(status='accepted').select_related('contributor_user')
+        """
+        Most recently accepted contributors, capped at PROJECT_DETAIL_CONTRIBUTORS_LIMIT.
+        
+        Uses the view's bounded accepted_contributions_preview prefetch when present.
+        """
+        accepted_contributions = getattr(obj, 'accepted_contributions_preview', None)
+        if accepted_contributions is None:
+            accepted_contributions = obj.contributions.filter(
+                status='accepted'
+            ).select_related('contributor_user').order_by(
+                '-decided_at'
+            )[:settings.PROJECT_DETAIL_CONTRIBUTORS_LIMIT]
         return UserProfileSerializer([c.contributor_user for c in accepted_contributions], many=True).data
 
 
@@ -189,9 +226,7 @@ class ProjectCreateSerializer(serializers.ModelSerializer):
         project = Project.objects.create(**validated_data)
         
         # Create/associate tags
-        for tag_name in tags_data:
-            tag, _ = ProjectTag.objects.get_or_create(name=tag_name)
-            ProjectTagMap.objects.create(project=project, tag=tag)
+        ProjectTagService.set_project_tags(project, tags_data)
         
         return project
 
@@ -270,15 +305,9 @@ class ProjectUpdateSerializer(serializers.ModelSerializer):
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
         
-        # Update tags if provided
+        # Update tags if provided (only added/removed tags are written)
         if tags_data is not None:
-            # Remove old tag associations
-            ProjectTagMap.objects.filter(project=instance).delete()
-            
-            # Create new tag associations
-            for tag_name in tags_data:
-                tag, _ = ProjectTag.objects.get_or_create(name=tag_name)
-                ProjectTagMap.objects.create(project=instance, tag=tag)
+            ProjectTagService.set_project_tags(instance, tags_data)
         
         instance.save()
         return instance
@@ -0,0 +1,384 @@
+"""
+Project Service Layer
+
+Handles set-based tag assignment, bulk import and background deletion of
+projects.
+"""
+from collections import Counter
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from apps.projects.cache import bump_projects_version
+from apps.projects.matching import schedule_index_sync
+from apps.projects.models import Project, ProjectTag, ProjectTagMap
+from apps.projects.related import schedule_related_rebuild, schedule_related_update
+from apps.projects.tag_index import invalidate_tag_index, record_tag_usage_change
+from apps.projects.trending import schedule_trending_removal
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ProjectTagService:
+    """
+    Service class for assigning tags to projects.
+    
+    Resolves tag names in bulk and applies add/remove diffs to ProjectTagMap
+    instead of deleting and recreating every association.
+    """
+
+    @staticmethod
+    def resolve_tags(tag_names) -> dict:
+        """
+        Map tag names to tag IDs, creating missing tags.
+        
+        Existing tags are resolved with one select; missing ones are inserted
+        with a single bulk_create(ignore_conflicts=True) (safe against
+        concurrent creators) and then selected.
+        
+        Args:
+            tag_names: Iterable of normalized (lowercase) tag names
+            
+        Returns:
+            dict: {tag name: tag ID}
+        """
+        names = set(tag_names)
+        if not names:
+            return {}
+        
+        tag_ids = dict(ProjectTag.objects.filter(name__in=names).values_list('name', 'id'))
+        missing = names - tag_ids.keys()
+        if missing:
+            ProjectTag.objects.bulk_create(
+                [ProjectTag(name=name) for name in sorted(missing)],
+                ignore_conflicts=True
+            )
+            tag_ids.update(ProjectTag.objects.filter(name__in=missing).values_list('name', 'id'))
+            # bulk_create sends no signals
+            invalidate_tag_index()
+        
+        return tag_ids
+
+    @staticmethod
+    @transaction.atomic
+    def set_project_tags(project, tag_names) -> tuple:
+        """
+        Make a project's tags exactly tag_names, touching only the differences.
+        
+        Args:
+            project: Project instance
+            tag_names: Normalized tag names the project should end up with
+            
+        Returns:
+            tuple: (added tag names, removed tag names)
+        """
+        wanted = ProjectTagService.resolve_tags(tag_names)
+        current = dict(
+            ProjectTagMap.objects.filter(project=project).values_list('tag__name', 'tag_id')
+        )
+        
+        removed = current.keys() - wanted.keys()
+        added = wanted.keys() - current.keys()
+        
+        if removed:
+            ProjectTagMap.objects.filter(
+                project=project,
+                tag_id__in=[current[name] for name in removed]
+            ).delete()
+        
+        if added:
+            ProjectTagMap.objects.bulk_create([
+                ProjectTagMap(project=project, tag_id=wanted[name]) for name in added
+            ])
+            # bulk_create sends no signals, so mirror the ProjectTagMap post_save handlers
+            for name in added:
+                record_tag_usage_change(wanted[name], 1)
+            bump_projects_version()
+            schedule_related_update(project.pk)
+            schedule_index_sync(project.pk)
+        
+        if added or removed:
+            # Drop stale prefetched tags so callers see the new set
+            getattr(project, '_prefetched_objects_cache', {}).pop('tag_maps', None)
+        
+        return sorted(added), sorted(removed)
+
+    @staticmethod
+    @transaction.atomic
+    def retag_projects(project_ids, add=(), remove=()) -> dict:
+        """
+        Add and/or remove tags on many projects with set-based statements.
+        
+        Args:
+            project_ids: IDs of the projects to retag
+            add: Normalized tag names to add (existing associations are kept)
+            remove: Normalized tag names to remove
+            
+        Returns:
+            dict: Number of associations added and removed
+        """
+        project_ids = list(project_ids)
+        removed = 0
+        created = 0
+        
+        remove = set(remove) - set(add)
+        if remove and project_ids:
+            removed, _ = ProjectTagMap.objects.filter(
+                project_id__in=project_ids,
+                tag__name__in=remove
+            ).delete()
+        
+        tag_ids = ProjectTagService.resolve_tags(add)
+        if tag_ids and project_ids:
+            before = ProjectTagMap.objects.filter(
+                project_id__in=project_ids, tag_id__in=tag_ids.values()
+            ).count()
+            ProjectTagMap.objects.bulk_create(
+                [
+                    ProjectTagMap(project_id=project_id, tag_id=tag_id)
+                    for project_id in project_ids
+                    for tag_id in tag_ids.values()
+                ],
+                ignore_conflicts=True
+            )
+            created = len(project_ids) * len(tag_ids) - before
+            invalidate_tag_index()
+            bump_projects_version()
+        
+        if project_ids and (created or removed):
+            # Too many projects changed for incremental updates
+            schedule_related_rebuild()
+            schedule_index_sync(*project_ids)
+        
+        logger.info(
+            f"Retagged {len(project_ids)} project(s): "
+            f"{created} tag association(s) added, {removed} removed"
+        )
+        return {'added': created, 'removed': removed}
+
+
+class ProjectImportService:
+    """
+    Service class for importing many projects in one pass.
+    
+    Rows are validated individually, so invalid rows are reported without
+    aborting the batch. Valid projects are inserted with one bulk_create and
+    tagged with one set-based tag map insert. search_vector is filled in by
+    the database triggers, and the statement-level tag map trigger refreshes
+    every imported project in a single UPDATE.
+    """
+
+    @staticmethod
+    def import_projects(host_user, rows) -> dict:
+        """
+        Validate rows and insert the valid ones as projects hosted by host_user.
+        
+        Args:
+            host_user: User who hosts every imported project
+            rows: List of project dicts in the project create format
+            
+        Returns:
+            dict: created ({index, id}) and errors ({index, errors}) lists
+        """
+        # Imported here: the serializers module depends on this one
+        from apps.projects.serializers import ProjectCreateSerializer
+        
+        valid_rows = []
+        errors = []
+        for index, row in enumerate(rows):
+            serializer = ProjectCreateSerializer(data=row)
+            if serializer.is_valid():
+                valid_rows.append((index, serializer.validated_data))
+            else:
+                errors.append({'index': index, 'errors': serializer.errors})
+        
+        created = []
+        if valid_rows:
+            projects = ProjectImportService.insert_projects(
+                host_user, [data for _, data in valid_rows]
+            )
+            created = [
+                {'index': index, 'id': str(project.id)}
+                for (index, _), project in zip(valid_rows, projects)
+            ]
+        
+        logger.info(
+            f"Imported {len(created)} project(s) for {host_user.email}, "
+            f"{len(errors)} row(s) rejected"
+        )
+        return {'created': created, 'errors': errors}
+
+    @staticmethod
+    @transaction.atomic
+    def insert_projects(host_user, rows) -> list:
+        """
+        Insert validated project rows and their tags with set-based statements.
+        
+        Args:
+            host_user: User who hosts every project
+            rows: Validated project data, each with an optional 'tags' list
+            
+        Returns:
+            list: The created Project instances, in row order
+        """
+        projects = []
+        tag_names = []
+        for row in rows:
+            row = dict(row)
+            tag_names.append(sorted(set(row.pop('tags', []))))
+            projects.append(Project(host_user=host_user, **row))
+        Project.objects.bulk_create(projects)
+        
+        tag_ids = ProjectTagService.resolve_tags(name for names in tag_names for name in names)
+        tag_maps = [
+            ProjectTagMap(project=project, tag_id=tag_ids[name])
+            for project, names in zip(projects, tag_names)
+            for name in names
+        ]
+        if tag_maps:
+            ProjectTagMap.objects.bulk_create(tag_maps)
+        
+        # bulk_create sends no signals, so mirror the Project/ProjectTagMap handlers
+        for tag_id, count in Counter(tag_map.tag_id for tag_map in tag_maps).items():
+            record_tag_usage_change(tag_id, count)
+        bump_projects_version()
+        schedule_related_rebuild()
+        schedule_index_sync(*[project.pk for project in projects])
+        
+        return projects
+
+
+class ProjectDeletionService:
+    """
+    Service class for deleting projects without a long cascade in the request.
+    
+    Deleting marks the project pending-delete (hidden by Project.visible at
+    once) and queues a task that purges its children in bounded batches of
+    raw DELETE ... WHERE id IN (...) statements before removing the project.
+    Projects with credit ledger entries are closed instead, to preserve the
+    audit history.
+    """
+    
+    # Child tables purged before the project row, in order
+    CHILD_MODELS = (
+        ('projects', 'ProjectTagMap'),
+        ('chat', 'ChatMessage'),
+        ('projects', 'ProjectNote'),
+        ('projects', 'ProjectResource'),
+        ('contributions', 'Contribution'),
+    )
+
+    @staticmethod
+    def has_ledger_entries(project_id) -> bool:
+        from apps.credits.models import CreditLedgerEntry
+        return CreditLedgerEntry.objects.filter(project_id=project_id).exists()
+
+    @staticmethod
+    @transaction.atomic
+    def request_deletion(project) -> bool:
+        """
+        Hide a project now and schedule the purge of its data.
+        
+        Args:
+            project: Project instance to delete
+            
+        Returns:
+            bool: True if deletion was scheduled, False if the project was
+            closed instead because credits were issued for it
+        """
+        if ProjectDeletionService.has_ledger_entries(project.pk):
+            project.status = 'closed'
+            project.save()
+            return False
+        
+        project.deletion_requested_at = timezone.now()
+        project.save()
+        
+        # At most a handful of rows; removing them now (with signals) drops the
+        # project from the tag-derived and trending indexes right away
+        ProjectTagMap.objects.filter(project=project).delete()
+        schedule_related_update(project.pk)
+        schedule_index_sync(project.pk)
+        schedule_trending_removal(project.pk)
+        
+        project_id = str(project.pk)
+        
+        def _enqueue():
+            from apps.projects.tasks import purge_deleted_project
+            try:
+                purge_deleted_project.delay(project_id)
+            except Exception as e:
+                # The periodic sweep picks the project up later
+                logger.warning(f"Could not schedule purge of project {project_id}: {e}")
+        
+        transaction.on_commit(_enqueue)
+        logger.info(f"Project {project_id} marked for deletion")
+        return True
+
+    @staticmethod
+    def purge_project(project_id, batch_size=None) -> dict:
+        """
+        Delete a pending-delete project's children in batches, then the project.
+        
+        Each batch is its own short statement, so no long-held locks. If credit
+        ledger entries appeared since the request, the project is restored as
+        closed instead.
+        
+        Args:
+            project_id: ID of a project marked for deletion
+            batch_size: Rows per DELETE (default PROJECT_PURGE_BATCH_SIZE)
+            
+        Returns:
+            dict: Rows deleted per table (empty if nothing was purged)
+        """
+        from django.apps import apps
+        
+        batch_size = batch_size or settings.PROJECT_PURGE_BATCH_SIZE
+        project = Project.objects.filter(
+            pk=project_id, deletion_requested_at__isnull=False
+        ).first()
+        if project is None:
+            return {}
+        
+        if ProjectDeletionService.has_ledger_entries(project_id):
+            Project.objects.filter(pk=project_id).update(
+                deletion_requested_at=None, status='closed', updated_at=timezone.now()
+            )
+            bump_projects_version()
+            logger.warning(f"Project {project_id} has credit ledger entries; closed instead of deleted")
+            return {}
+        
+        deleted = {}
+        for app_label, model_name in ProjectDeletionService.CHILD_MODELS:
+            model = apps.get_model(app_label, model_name)
+            deleted[model._meta.db_table] = ProjectDeletionService._delete_in_batches(
+                model, project_id, batch_size
+            )
+        if deleted[ProjectTagMap._meta.db_table]:
+            invalidate_tag_index()
+        
+        # Only the bare row is left, so the collector has nothing to cascade
+        project.delete()
+        logger.info(f"Purged project {project_id}: {deleted}")
+        return deleted
+
+    @staticmethod
+    def _delete_in_batches(model, project_id, batch_size) -> int:
+        """Delete a child model's rows for a project with raw id-list DELETEs."""
+        table = connection.ops.quote_name(model._meta.db_table)
+        pk_column = connection.ops.quote_name(model._meta.pk.column)
+        total = 0
+        while True:
+            ids = list(
+                model.objects.filter(project_id=project_id)
+                .values_list('pk', flat=True)[:batch_size]
+            )
+            if not ids:
+                return total
+            placeholders = ', '.join(['%s'] * len(ids))
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'DELETE FROM {table} WHERE {pk_column} IN ({placeholders})',
+                    [model._meta.pk.get_db_prep_value(pk, connection) for pk in ids]
+                )
+                total += cursor.rowcount
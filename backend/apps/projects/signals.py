@@ -0,0 +1,101 @@
+"""
+Signal handlers for the projects app.
+
+Bump the projects cache version whenever a project, its tags or its host's
+embedded profile change, and keep the tag autocomplete, related-projects, skill-match and trending
+indexes in sync with tag usage and project status.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.credits.models import CreditLedgerEntry
+from apps.projects.cache import bump_projects_version
+from apps.projects.matching import schedule_index_sync
+from apps.projects.models import Project, ProjectTag, ProjectTagMap
+from apps.projects.related import schedule_related_update
+from apps.projects.tag_index import invalidate_tag_index, record_tag_usage_change
+from apps.projects.trending import schedule_trending_removal
+from apps.users.models import User
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+@receiver(post_save, sender=ProjectTag)
+@receiver(post_delete, sender=ProjectTag)
+@receiver(post_save, sender=ProjectTagMap)
+@receiver(post_delete, sender=ProjectTagMap)
+def invalidate_project_lists(sender, **kwargs):
+    """Invalidate cached project lists after project/tag writes."""
+    bump_projects_version()
+
+
+# User fields embedded in cached project payloads (UserProfileSerializer as host)
+HOST_PROFILE_FIELDS = {
+    'email', 'display_name', 'bio', 'skills', 'github_url', 'portfolio_url', 'email_verified',
+}
+
+
+def _hosts_projects(user_id):
+    return Project.visible.filter(host_user_id=user_id).exists()
+
+
+@receiver(post_save, sender=User)
+def host_profile_saved(sender, instance, created, update_fields=None, **kwargs):
+    """Invalidate cached project lists when a host's embedded profile changes."""
+    if created or (update_fields is not None and not HOST_PROFILE_FIELDS & set(update_fields)):
+        return
+    if _hosts_projects(instance.pk):
+        bump_projects_version()
+
+
+@receiver(post_save, sender=CreditLedgerEntry)
+def host_credits_changed(sender, instance, created, **kwargs):
+    """Invalidate cached project lists when a host's total_credits changes."""
+    if created and _hosts_projects(instance.to_user_id):
+        bump_projects_version()
+
+
+@receiver(post_save, sender=ProjectTagMap)
+def tag_map_saved(sender, instance, created, **kwargs):
+    """Add a new tag usage to the tag-derived indexes."""
+    if created:
+        record_tag_usage_change(instance.tag_id, 1)
+        schedule_related_update(instance.project_id)
+        schedule_index_sync(instance.project_id)
+
+
+@receiver(post_delete, sender=ProjectTagMap)
+def tag_map_deleted(sender, instance, **kwargs):
+    """Drop a tag usage from the tag-derived indexes."""
+    record_tag_usage_change(instance.tag_id, -1)
+    schedule_related_update(instance.project_id)
+    schedule_index_sync(instance.project_id)
+
+
+@receiver(post_save, sender=ProjectTag)
+@receiver(post_delete, sender=ProjectTag)
+def tag_changed(sender, **kwargs):
+    """Rebuild the autocomplete index when tags are added, renamed or removed."""
+    invalidate_tag_index()
+
+
+# Project fields the related-projects and skill-match indexes depend on
+INDEXED_FIELDS = {'title', 'status'}
+
+
+@receiver(post_save, sender=Project)
+def project_saved(sender, instance, created, update_fields=None, **kwargs):
+    """Refresh project indexes when an existing project's title or status changes."""
+    if created or (update_fields is not None and not INDEXED_FIELDS & update_fields):
+        return
+    schedule_related_update(instance.pk)
+    schedule_index_sync(instance.pk)
+    if instance.status != 'open':
+        schedule_trending_removal(instance.pk)
+
+
+@receiver(post_delete, sender=Project)
+def project_deleted(sender, instance, **kwargs):
+    """Remove a deleted project from the skill-match and trending indexes."""
+    schedule_index_sync(instance.pk)
+    schedule_trending_removal(instance.pk)
@@ -0,0 +1,221 @@
+"""
+In-process prefix index for tag autocomplete.
+
+Each worker process keeps a sorted array of tag names (plus usage counts)
+and answers prefix queries with bisect, without touching the database.
+
+Usage counts are shared through a Redis hash (tag ID -> count) that every
+tag-map write increments; processes re-read it at most once per
+REFRESH_INTERVAL and apply their own writes locally right away. A version
+counter is bumped only when tags are added, renamed or removed, which is
+the one change that makes processes rebuild from the database. The hash
+expires daily and is reseeded from the database by the next rebuild, which
+repairs drift from increments lost while Redis was unavailable.
+
+Without a Redis cache backend (e.g. local development) each process only
+sees its own usage changes until the next rebuild.
+"""
+import heapq
+import logging
+import threading
+import time
+from bisect import bisect_left
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count
+
+from apps.projects.matching import get_redis
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = 'projects:tags:version'
+COUNTS_KEY = 'projects:tags:usage'
+# Marks a hash written by a seed, as opposed to one created by a stray increment
+SEEDED_FIELD = 'seeded'
+
+# Seconds between checks of the shared version and counts, per process
+REFRESH_INTERVAL = 5
+
+# The shared counts are reseeded from the database at least this often
+COUNTS_TIMEOUT = 24 * 3600
+
+DEFAULT_SUGGEST_LIMIT = 10
+MAX_SUGGEST_LIMIT = 50
+
+
+def _get_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, 1, timeout=None)
+        version = cache.get(VERSION_KEY, 1)
+    return version
+
+
+def _incr_version():
+    try:
+        return cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.add(VERSION_KEY, 1, timeout=None)
+        return None
+
+
+def _counts_key():
+    return cache.make_key(COUNTS_KEY)
+
+
+class TagPrefixIndex:
+    """Sorted array of tag names with usage counts, refreshed from shared state."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._names = []
+        self._counts = {}
+        self._names_by_id = {}
+        self._version = None
+        self._checked_at = 0
+    
+    def rebuild(self, version=None):
+        """Reload every tag name and usage count from the database."""
+        from apps.projects.models import ProjectTag
+        
+        rows = ProjectTag.objects.annotate(
+            usage_count=Count('project_maps')
+        ).values_list('id', 'name', 'usage_count')
+        
+        names_by_id = {}
+        counts = {}
+        for tag_id, name, usage_count in rows:
+            names_by_id[str(tag_id)] = name
+            counts[name] = usage_count
+        
+        with self._lock:
+            self._names = sorted(counts)
+            self._counts = counts
+            self._names_by_id = names_by_id
+            self._version = version
+            self._checked_at = time.monotonic()
+        
+        try:
+            self._seed_shared_counts(names_by_id, counts)
+        except Exception as e:
+            logger.warning(f"Could not seed shared tag usage counts: {e}")
+    
+    def _seed_shared_counts(self, names_by_id, counts):
+        """Write the counts to the shared hash unless it is already seeded."""
+        redis = get_redis()
+        if redis is None or redis.hexists(_counts_key(), SEEDED_FIELD):
+            return
+        # Increments made between the query above and this write are lost
+        # until the hash expires and is reseeded
+        mapping = {tag_id: counts[name] for tag_id, name in names_by_id.items()}
+        mapping[SEEDED_FIELD] = 1
+        pipe = redis.pipeline(transaction=True)
+        pipe.delete(_counts_key())
+        pipe.hset(_counts_key(), mapping=mapping)
+        pipe.expire(_counts_key(), COUNTS_TIMEOUT)
+        pipe.execute()
+    
+    def _load_shared_counts(self):
+        """
+        Replace local counts with the shared ones.
+        
+        Returns:
+            bool: False if the shared hash is not seeded and a rebuild is needed
+        """
+        redis = get_redis()
+        if redis is None:
+            return True
+        shared = redis.hgetall(_counts_key())
+        if shared.pop(SEEDED_FIELD.encode('utf-8'), None) is None:
+            return False
+        with self._lock:
+            for tag_id, count in shared.items():
+                name = self._names_by_id.get(tag_id.decode('utf-8'))
+                if name is not None:
+                    self._counts[name] = max(0, int(count))
+        return True
+    
+    def ensure_fresh(self):
+        """Rebuild if tags changed, else pick up shared counts (throttled)."""
+        if self._version is not None and time.monotonic() - self._checked_at < REFRESH_INTERVAL:
+            return
+        try:
+            version = _get_version()
+            if version != self._version or not self._load_shared_counts():
+                self.rebuild(version)
+        except Exception as e:
+            logger.warning(f"Tag index shared state unavailable: {e}")
+            if self._version is None:
+                self.rebuild()
+        self._checked_at = time.monotonic()
+    
+    def suggest(self, prefix, limit=DEFAULT_SUGGEST_LIMIT):
+        """
+        Tags starting with prefix, most used first.
+        
+        Args:
+            prefix: Case-insensitive name prefix
+            limit: Maximum number of suggestions
+        
+        Returns:
+            list: (name, usage_count) tuples, empty for a blank prefix
+        """
+        prefix = prefix.strip().lower()
+        if not prefix:
+            # Would rank every tag in the index on each keystroke
+            return []
+        self.ensure_fresh()
+        with self._lock:
+            names, counts = self._names, self._counts
+            start = bisect_left(names, prefix)
+            # Names sharing the prefix form a contiguous run from start
+            end = bisect_left(names, prefix + '\uffff', lo=start)
+            top = heapq.nsmallest(
+                limit, names[start:end], key=lambda name: (-counts[name], name)
+            )
+            return [(name, counts[name]) for name in top]
+    
+    def apply_delta(self, tag_id, delta):
+        """Apply a usage-count change made by this process to the local index."""
+        with self._lock:
+            name = self._names_by_id.get(str(tag_id))
+            if name is None:
+                # A tag this process has not loaded yet: pick it up on the next check
+                self._version = None
+                return
+            self._counts[name] = max(0, self._counts[name] + delta)
+    
+    def invalidate(self):
+        """Force a rebuild on the next lookup."""
+        with self._lock:
+            self._version = None
+
+
+tag_index = TagPrefixIndex()
+
+
+def record_tag_usage_change(tag_id, delta):
+    """Add a usage change to the shared counts and the local index after commit."""
+    def _apply():
+        try:
+            redis = get_redis()
+            if redis is not None:
+                redis.hincrby(_counts_key(), str(tag_id), delta)
+        except Exception as e:
+            logger.warning(f"Could not update shared tag usage counts: {e}")
+        tag_index.apply_delta(tag_id, delta)
+    
+    transaction.on_commit(_apply)
+
+
+def invalidate_tag_index():
+    """Bump the shared version so every process rebuilds its index."""
+    def _apply():
+        try:
+            _incr_version()
+        except Exception as e:
+            logger.warning(f"Could not bump tag index version: {e}")
+        tag_index.invalidate()
+    
+    transaction.on_commit(_apply)
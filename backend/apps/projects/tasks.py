@@ -0,0 +1,180 @@
+"""
+Celery tasks for project-related asynchronous operations.
+
+Handles scheduled maintenance of denormalized project data.
+"""
+import logging
+from celery import shared_task
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+logger = logging.getLogger(__name__)
+
+
+def _contribution_count_subquery(**filters):
+    """Correlated COUNT(*) of a project's contributions matching filters."""
+    from apps.contributions.models import Contribution
+
+    return Coalesce(
+        Subquery(
+            Contribution.objects.filter(project=OuterRef('pk'), **filters)
+            .order_by()
+            .values('project')
+            .annotate(total=Count('id'))
+            .values('total'),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+@shared_task
+def reconcile_contribution_counters(project_ids=None):
+    """
+    Repair drift in the denormalized contribution counters on Project.
+
+    Counters are maintained with F() updates by ContributionService; cascade
+    deletes (e.g. removed users) bypass that path, so this recomputes them from
+    the contributions table and rewrites only rows that disagree.
+    Scheduled to run hourly via Celery Beat.
+
+    Args:
+        project_ids: Optional list of project IDs to restrict the repair to
+    """
+    from apps.projects.cache import bump_projects_version
+    from apps.projects.models import Project
+
+    projects = Project.objects.all()
+    if project_ids:
+        projects = projects.filter(pk__in=project_ids)
+
+    projects = projects.annotate(
+        actual_total=_contribution_count_subquery(),
+        actual_pending=_contribution_count_subquery(status='pending'),
+        actual_accepted=_contribution_count_subquery(status='accepted'),
+    )
+    drifted = projects.filter(
+        ~Q(contribution_count=F('actual_total'))
+        | ~Q(pending_contribution_count=F('actual_pending'))
+        | ~Q(accepted_contribution_count=F('actual_accepted'))
+    ).values_list('pk', flat=True)
+
+    count = Project.objects.filter(pk__in=list(drifted)).update(
+        contribution_count=_contribution_count_subquery(),
+        pending_contribution_count=_contribution_count_subquery(status='pending'),
+        accepted_contribution_count=_contribution_count_subquery(status='accepted'),
+    )
+
+    if count:
+        bump_projects_version()
+
+    logger.info(f"Reconciled contribution counters on {count} project(s)")
+    return f"Reconciled {count} projects"
+
+
+@shared_task
+def rebuild_related_projects_index():
+    """
+    Rebuild the related-projects neighbour index for every tagged project.
+
+    Incremental updates keep the index current between runs; the full
+    rebuild repairs lists skewed by concurrent updates or missed writes.
+    Scheduled to run daily via Celery Beat.
+    """
+    from apps.projects.related import build_related_index
+
+    count = build_related_index()
+    logger.info(f"Rebuilt related-projects index for {count} project(s)")
+    return f"Indexed {count} projects"
+
+
+@shared_task
+def update_related_projects(project_id):
+    """
+    Refresh one project's related-projects neighbours after a tag change.
+
+    Args:
+        project_id: ID of the project whose tags (or status) changed
+    """
+    from django.core.cache import cache
+    from apps.projects.related import PENDING_KEY, update_related_index
+
+    cache.delete(PENDING_KEY.format(project_id))
+    neighbours = update_related_index(project_id)
+    return f"Project {project_id}: {len(neighbours)} related projects"
+
+
+@shared_task
+def rebuild_skill_match_index():
+    """
+    Rebuild the Redis tag -> open projects index used for skill matching.
+
+    Signals keep the index current incrementally; the rebuild repairs
+    drift (e.g. bulk updates that bypass signals).
+    Scheduled to run daily via Celery Beat.
+    """
+    from apps.projects.matching import rebuild_index
+
+    count = rebuild_index()
+    if count is None:
+        logger.info("Skill match index skipped: cache backend is not Redis")
+        return "Skipped"
+
+    logger.info(f"Rebuilt skill match index for {count} open project(s)")
+    return f"Indexed {count} projects"
+
+
+@shared_task
+def purge_deleted_project(project_id):
+    """
+    Purge a project marked for deletion, its children in bounded batches.
+
+    Args:
+        project_id: ID of the pending-delete project
+    """
+    from apps.projects.services import ProjectDeletionService
+
+    deleted = ProjectDeletionService.purge_project(project_id)
+    return f"Project {project_id}: purged {sum(deleted.values())} child row(s)"
+
+
+@shared_task
+def purge_pending_project_deletions():
+    """
+    Purge every project still marked for deletion.
+
+    Catches projects whose purge task was never queued or failed midway.
+    Scheduled to run hourly via Celery Beat.
+    """
+    from apps.projects.models import Project
+    from apps.projects.services import ProjectDeletionService
+
+    project_ids = list(
+        Project.objects.filter(deletion_requested_at__isnull=False).values_list('pk', flat=True)
+    )
+    for project_id in project_ids:
+        ProjectDeletionService.purge_project(project_id)
+
+    logger.info(f"Purged {len(project_ids)} pending-delete project(s)")
+    return f"Purged {len(project_ids)} projects"
+
+
+@shared_task
+def refresh_trending_projects():
+    """
+    Decay the trending projects sorted set and prune closed projects.
+
+    Writes add decayed increments as events happen; this rebases the scores
+    onto the current time and seeds the set from recent contributions when
+    it is missing.
+    Scheduled to run hourly via Celery Beat.
+    """
+    from apps.projects.trending import refresh_trending
+
+    count = refresh_trending()
+    if count is None:
+        logger.info("Trending refresh skipped: cache backend is not Redis")
+        return "Skipped"
+
+    logger.info(f"Refreshed trending scores for {count} project(s)")
+    return f"Trending {count} projects"
@@ -0,0 +1,98 @@
+"""
+Tests for conditional GET (ETag / 304) on the project detail endpoint.
+"""
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.contributions.models import Contribution
+from apps.contributions.services import ContributionService
+from apps.projects.models import Project, ProjectTag, ProjectTagMap
+from apps.users.models import User
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ProjectDetailConditionalGetTests(TestCase):
+
+    def setUp(self):
+        self.host = User.objects.create(email='host@example.com', username='host', display_name='Host')
+        self.project = Project.objects.create(
+            host_user=self.host,
+            title='Conditional project',
+            description='d' * 30,
+            what_it_does='Tests ETags',
+            desired_outputs='o' * 30,
+        )
+        self.url = reverse('projects:project-detail', kwargs={'id': self.project.pk})
+
+    def get(self, etag=None):
+        headers = {'HTTP_IF_NONE_MATCH': etag} if etag else {}
+        return self.client.get(self.url, **headers)
+
+    def assertChanged(self, etag):
+        response = self.get(etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_matching_etag_returns_304(self):
+        etag = self.get()['ETag']
+
+        response = self.get(etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_stale_etag_returns_200(self):
+        response = self.get('W/"stale"')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['ETag'].startswith('W/"'))
+
+    def test_project_edit_changes_etag(self):
+        etag = self.get()['ETag']
+
+        self.project.title = 'Renamed project'
+        self.project.save()
+
+        self.assertChanged(etag)
+
+    def test_counter_change_changes_etag(self):
+        contributor = User.objects.create(
+            email='contributor@example.com', username='contributor', display_name='Contributor'
+        )
+        Contribution.objects.create(
+            project=self.project, contributor_user=contributor, title='Contribution', body='b' * 60
+        )
+        ContributionService.update_project_counters(self.project.pk, new_status='pending')
+        etag = self.get()['ETag']
+
+        ContributionService.update_project_counters(self.project.pk, 'pending', 'accepted')
+
+        self.assertChanged(etag)
+
+    def test_tag_removal_changes_etag(self):
+        tag = ProjectTag.objects.create(name='django')
+        ProjectTagMap.objects.create(project=self.project, tag=tag)
+        etag = self.get()['ETag']
+
+        ProjectTagMap.objects.filter(project=self.project).delete()
+
+        self.assertChanged(etag)
+
+    def test_host_profile_change_changes_etag(self):
+        etag = self.get()['ETag']
+
+        self.host.display_name = 'Renamed host'
+        self.host.save()
+
+        self.assertChanged(etag)
+
+    def test_project_pending_deletion_is_not_304(self):
+        etag = self.get()['ETag']
+
+        Project.objects.filter(pk=self.project.pk).update(deletion_requested_at=timezone.now())
+
+        self.assertEqual(self.get(etag).status_code, 404)
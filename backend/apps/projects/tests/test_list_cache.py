@@ -0,0 +1,53 @@
+"""
+Tests that cached project lists and facets are filled from the primary.
+"""
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.mixins import ListModelMixin
+
+from apps.projects import views
+from core.db_router import allow_replica_reads, is_pinned_to_primary, reset_replica_reads
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES, PROJECT_LIST_CACHE_ENABLED=True)
+class CacheFillRoutingTests(TestCase):
+
+    def setUp(self):
+        # Act as a replica-routed request, as ReplicaRoutingMiddleware would
+        tokens = allow_replica_reads()
+        self.addCleanup(reset_replica_reads, tokens)
+
+    def test_list_miss_reads_from_primary_and_hit_does_not_query(self):
+        pinned = []
+        real_list = ListModelMixin.list
+
+        def recording_list(view, request, *args, **kwargs):
+            pinned.append(is_pinned_to_primary())
+            return real_list(view, request, *args, **kwargs)
+
+        with mock.patch.object(ListModelMixin, 'list', recording_list):
+            miss = self.client.get(reverse('projects:project-list-create'))
+            hit = self.client.get(reverse('projects:project-list-create'))
+
+        self.assertEqual((miss['X-Cache'], hit['X-Cache']), ('MISS', 'HIT'))
+        self.assertEqual(pinned, [True])
+        self.assertFalse(is_pinned_to_primary())
+
+    def test_facets_miss_reads_from_primary(self):
+        pinned = []
+        real_facets = views.compute_project_facets
+
+        def recording_facets(*args, **kwargs):
+            pinned.append(is_pinned_to_primary())
+            return real_facets(*args, **kwargs)
+
+        with mock.patch.object(views, 'compute_project_facets', recording_facets):
+            response = self.client.get(reverse('projects:project-facets'))
+
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(pinned, [True])
+        self.assertFalse(is_pinned_to_primary())
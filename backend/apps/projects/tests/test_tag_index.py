@@ -0,0 +1,66 @@
+"""
+Tests for the in-process tag prefix index (without a shared Redis hash).
+"""
+from django.test import TestCase, override_settings
+
+from apps.projects.models import Project, ProjectTag, ProjectTagMap
+from apps.projects.tag_index import TagPrefixIndex
+from apps.users.models import User
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TagPrefixIndexTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        host = User.objects.create(email='host@example.com', username='host', display_name='Host')
+        projects = [
+            Project.objects.create(
+                host_user=host,
+                title=f'Project {index}',
+                description='d' * 30,
+                what_it_does='Tests tags',
+                desired_outputs='o' * 30,
+            )
+            for index in range(3)
+        ]
+        cls.tags = {name: ProjectTag.objects.create(name=name) for name in ('python', 'pytest', 'pandas', 'rust')}
+        for project in projects:
+            ProjectTagMap.objects.create(project=project, tag=cls.tags['pytest'])
+        ProjectTagMap.objects.create(project=projects[0], tag=cls.tags['python'])
+
+    def setUp(self):
+        self.index = TagPrefixIndex()
+
+    def test_prefix_matches_most_used_first(self):
+        self.assertEqual(self.index.suggest('py'), [('pytest', 3), ('python', 1)])
+
+    def test_prefix_is_case_insensitive_and_trimmed(self):
+        self.assertEqual(self.index.suggest('  PYTE '), [('pytest', 3)])
+
+    def test_limit_caps_suggestions(self):
+        self.assertEqual(self.index.suggest('p', limit=2), [('pytest', 3), ('python', 1)])
+
+    def test_no_match_returns_empty(self):
+        self.assertEqual(self.index.suggest('go'), [])
+
+    def test_blank_prefix_returns_empty_without_loading(self):
+        self.assertEqual(self.index.suggest('   '), [])
+        self.assertIsNone(self.index._version)
+
+    def test_local_delta_reorders_suggestions(self):
+        self.index.suggest('py')
+
+        self.index.apply_delta(self.tags['python'].pk, 5)
+
+        self.assertEqual(self.index.suggest('py'), [('python', 6), ('pytest', 3)])
+
+    def test_invalidate_picks_up_new_tags(self):
+        self.index.suggest('ru')
+        ProjectTag.objects.create(name='ruby')
+
+        self.index.invalidate()
+
+        self.assertEqual([name for name, _ in self.index.suggest('ru')], ['ruby', 'rust'])
@@ -0,0 +1,246 @@
+"""
+Tests for trending decay math and rank paging.
+
+Redis is replaced by a minimal in-memory double covering the commands the
+trending module uses.
+"""
+import math
+from unittest import mock
+
+from django.core.paginator import Paginator
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from apps.projects import trending
+from apps.projects.models import Project
+from apps.users.models import User
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+HALF_LIFE = 24 * 3600
+
+
+def _bytes(value):
+    return value if isinstance(value, bytes) else str(value).encode('utf-8')
+
+
+class FakeRedis:
+    """Strings and sorted sets, enough for apps.projects.trending."""
+
+    def __init__(self):
+        self.strings = {}
+        self.zsets = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = _bytes(value)
+        return True
+
+    def get(self, key):
+        return self.strings.get(key)
+
+    def exists(self, key):
+        return int(key in self.strings or key in self.zsets)
+
+    def delete(self, key):
+        self.strings.pop(key, None)
+        self.zsets.pop(key, None)
+
+    def zincrby(self, key, amount, member):
+        zset = self.zsets.setdefault(key, {})
+        zset[_bytes(member)] = zset.get(_bytes(member), 0) + amount
+        return zset[_bytes(member)]
+
+    def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update({_bytes(m): s for m, s in mapping.items()})
+
+    def zrem(self, key, *members):
+        for member in members:
+            self.zsets.get(key, {}).pop(_bytes(member), None)
+
+    def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+    def zscore(self, key, member):
+        return self.zsets.get(key, {}).get(_bytes(member))
+
+    def zrevrange(self, key, start, stop):
+        ranked = sorted(self.zsets.get(key, {}).items(), key=lambda item: (-item[1], item[0]))
+        stop = len(ranked) + stop if stop < 0 else stop
+        return [member for member, _ in ranked[start:stop + 1]]
+
+    def zunionstore(self, dest, keys):
+        result = {}
+        for key, weight in keys.items():
+            for member, score in self.zsets.get(key, {}).items():
+                result[member] = result.get(member, 0) + score * weight
+        self.zsets[dest] = result
+
+    def zremrangebyscore(self, key, minimum, maximum):
+        limit = float(maximum.lstrip('('))
+        self.zsets[key] = {m: s for m, s in self.zsets.get(key, {}).items() if s >= limit}
+
+    def zscan_iter(self, key, count=None):
+        return iter(list(self.zsets.get(key, {}).items()))
+
+
+class FakePipeline:
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((getattr(self.redis, name), args, kwargs))
+        return queue
+
+    def execute(self):
+        return [method(*args, **kwargs) for method, args, kwargs in self.calls]
+
+
+@override_settings(TRENDING_HALF_LIFE_HOURS=24)
+class DecayFactorTests(SimpleTestCase):
+
+    def test_no_decay_at_zero(self):
+        self.assertEqual(trending.decay_factor(0), 1)
+
+    def test_halves_every_half_life(self):
+        self.assertAlmostEqual(trending.decay_factor(HALF_LIFE), 0.5)
+        self.assertAlmostEqual(trending.decay_factor(2 * HALF_LIFE), 0.25)
+
+    def test_negative_age_grows(self):
+        self.assertAlmostEqual(trending.decay_factor(-HALF_LIFE), 2)
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHES,
+    TRENDING_HALF_LIFE_HOURS=24,
+    TRENDING_SUBMISSION_WEIGHT=3.0,
+    TRENDING_ACCEPT_WEIGHT=5.0,
+    TRENDING_VIEW_WEIGHT=1.0,
+)
+class TrendingScoreTests(TestCase):
+
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = mock.patch.object(trending, 'get_redis', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.now = 1_700_000_000.0
+        self.redis.set(trending._landmark_key(), self.now)
+
+    def score(self, project_id):
+        return self.redis.zscore(trending._trending_key(), str(project_id))
+
+    def test_event_at_landmark_adds_its_weight(self):
+        trending.record_trending_event('a', trending.SUBMISSION, at=self.now)
+
+        self.assertAlmostEqual(self.score('a'), 3.0)
+
+    def test_later_events_count_more_in_landmark_units(self):
+        trending.record_trending_event('a', trending.VIEW, at=self.now + HALF_LIFE)
+
+        self.assertAlmostEqual(self.score('a'), 2.0)
+
+    def test_recent_view_overtakes_decayed_accept(self):
+        trending.record_trending_event('old', trending.ACCEPT, at=self.now)
+        trending.record_trending_event('new', trending.VIEW, at=self.now + 3 * HALF_LIFE)
+
+        ranked = self.redis.zrevrange(trending._trending_key(), 0, -1)
+
+        # 5 * 2**-3 = 0.625 < 1
+        self.assertEqual(ranked, [b'new', b'old'])
+
+    def test_refresh_rebases_scores_onto_now(self):
+        trending.record_trending_event('a', trending.ACCEPT, at=self.now)
+        trending.record_trending_event('b', trending.VIEW, at=self.now + HALF_LIFE)
+
+        with mock.patch.object(trending, '_prune_closed'), \
+                mock.patch.object(trending.time, 'time', return_value=self.now + 2 * HALF_LIFE):
+            trending.refresh_trending()
+
+        # Equal to weight * decay(age) measured at the new landmark
+        self.assertAlmostEqual(self.score('a'), 5.0 * 0.25)
+        self.assertAlmostEqual(self.score('b'), 1.0 * 0.5)
+        self.assertAlmostEqual(float(self.redis.get(trending._landmark_key())), self.now + 2 * HALF_LIFE)
+
+    def test_refresh_prunes_scores_below_minimum(self):
+        trending.record_trending_event('a', trending.VIEW, at=self.now)
+        age = HALF_LIFE * math.ceil(math.log2(1 / trending.MIN_SCORE) + 1)
+
+        with mock.patch.object(trending, '_prune_closed'), \
+                mock.patch.object(trending.time, 'time', return_value=self.now + age):
+            trending.refresh_trending()
+
+        self.assertIsNone(self.score('a'))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TrendingPagingTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        host = User.objects.create(email='host@example.com', username='host', display_name='Host')
+        cls.projects = [
+            Project.objects.create(
+                host_user=host,
+                title=f'Project {index}',
+                description='d' * 30,
+                what_it_does='Tests trending',
+                desired_outputs='o' * 30,
+                status='open',
+            )
+            for index in range(5)
+        ]
+
+    def setUp(self):
+        self.redis = FakeRedis()
+        # Scores descending by index: project 0 ranks first
+        self.redis.zadd(trending._trending_key(), {
+            str(project.pk): 10 - index for index, project in enumerate(self.projects)
+        })
+
+    def test_len_is_the_set_size(self):
+        self.assertEqual(len(trending.TrendingProjects(self.redis, Project.objects.all())), 5)
+
+    def test_pages_come_back_in_rank_order(self):
+        paginator = Paginator(trending.TrendingProjects(self.redis, Project.objects.all()), 2)
+
+        pages = [[project.pk for project in paginator.page(number)] for number in paginator.page_range]
+
+        self.assertEqual(pages, [
+            [self.projects[0].pk, self.projects[1].pk],
+            [self.projects[2].pk, self.projects[3].pk],
+            [self.projects[4].pk],
+        ])
+
+    def test_closed_projects_are_skipped(self):
+        Project.objects.filter(pk=self.projects[1].pk).update(status='closed')
+
+        page = trending.TrendingProjects(self.redis, Project.objects.all())[0:3]
+
+        self.assertEqual([project.pk for project in page], [self.projects[0].pk, self.projects[2].pk])
+
+    def test_list_endpoint_pages_by_rank(self):
+        with mock.patch('apps.projects.views.get_redis', return_value=self.redis):
+            response = self.client.get(
+                reverse('projects:project-list-create'), {'ordering': 'trending', 'page_size': 2, 'page': 2}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 5)
+        self.assertEqual(
+            [item['id'] for item in response.data['data']],
+            [str(self.projects[2].pk), str(self.projects[3].pk)],
+        )
+
+    def test_list_endpoint_rejects_unsupported_filters(self):
+        response = self.client.get(
+            reverse('projects:project-list-create'), {'ordering': 'trending', 'search': 'x'}
+        )
+
+        self.assertEqual(response.status_code, 400)
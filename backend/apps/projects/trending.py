@@ -0,0 +1,288 @@
+"""
+Trending projects: a Redis sorted set of open projects ranked by recent activity.
+
+Contribution submissions, accepts and detail views add to a project's score
+with exponential time decay (half-life TRENDING_HALF_LIFE_HOURS). Decay uses
+a landmark time stored next to the set: an event at time t adds
+weight * 2 ** ((t - landmark) / half_life), so older increments shrink
+relative to newer ones without rewriting the set on every write. An hourly
+Celery job moves the landmark to now by scaling every score down
+(ZUNIONSTORE with a weight), which keeps the numbers small, and prunes
+projects that are no longer open or whose score has decayed away.
+
+The list view pages through the set by rank (ZREVRANGE) and hydrates each
+page with one id__in query. Without a Redis cache backend trending falls
+back to counting recent contributions in the database.
+"""
+import logging
+import time
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from apps.projects.matching import get_redis
+
+logger = logging.getLogger(__name__)
+
+TRENDING_KEY = 'projects:trending'
+LANDMARK_KEY = 'projects:trending:landmark'
+VIEWED_KEY = 'projects:trending:viewed:{}:{}'
+
+SUBMISSION = 'submission'
+ACCEPT = 'accept'
+VIEW = 'view'
+
+# Scores below this (in landmark units) are pruned by the hourly refresh
+MIN_SCORE = 0.01
+
+
+def _trending_key():
+    return cache.make_key(TRENDING_KEY)
+
+
+def _landmark_key():
+    return cache.make_key(LANDMARK_KEY)
+
+
+def event_weights():
+    return {
+        SUBMISSION: settings.TRENDING_SUBMISSION_WEIGHT,
+        ACCEPT: settings.TRENDING_ACCEPT_WEIGHT,
+        VIEW: settings.TRENDING_VIEW_WEIGHT,
+    }
+
+
+def decay_factor(seconds):
+    """Multiplier applied to a score after the given number of seconds."""
+    return 2 ** (-seconds / (settings.TRENDING_HALF_LIFE_HOURS * 3600))
+
+
+def _get_landmark(redis):
+    """Landmark timestamp of the set, initialised to now when missing."""
+    now = time.time()
+    if redis.set(_landmark_key(), now, nx=True):
+        return now
+    return float(redis.get(_landmark_key()))
+
+
+def record_trending_event(project_id, kind, at=None):
+    """
+    Add one event to a project's trending score.
+    
+    Args:
+        project_id: Project the event belongs to
+        kind: SUBMISSION, ACCEPT or VIEW
+        at: Event time as a UNIX timestamp (default now)
+    """
+    redis = get_redis()
+    if redis is None:
+        return
+
+    landmark = _get_landmark(redis)
+    at = time.time() if at is None else at
+    increment = event_weights()[kind] / decay_factor(at - landmark)
+    redis.zincrby(_trending_key(), increment, str(project_id))
+
+
+def schedule_trending_event(project_id, kind):
+    """Record a trending event once the transaction commits."""
+    def _record():
+        try:
+            record_trending_event(project_id, kind)
+        except Exception as e:
+            logger.warning(f"Could not update trending projects: {e}")
+
+    transaction.on_commit(_record)
+
+
+def record_project_view(project, request):
+    """
+    Count a detail view towards trending, once per viewer per dedupe window.
+    
+    Views of non-open projects and hosts viewing their own project are ignored.
+    """
+    user = request.user
+    if project.status != 'open' or (user.is_authenticated and user.pk == project.host_user_id):
+        return
+
+    redis = get_redis()
+    if redis is None:
+        return
+
+    from apps.moderation.services import get_client_ip
+
+    viewer = f'u{user.pk}' if user.is_authenticated else f'ip{get_client_ip(request)}'
+    seen_key = cache.make_key(VIEWED_KEY.format(project.pk, viewer))
+    try:
+        if redis.set(seen_key, 1, nx=True, ex=settings.TRENDING_VIEW_DEDUPE_SECONDS):
+            record_trending_event(project.pk, VIEW)
+    except Exception as e:
+        logger.warning(f"Could not record project view for trending: {e}")
+
+
+def remove_from_trending(*project_ids):
+    """Drop projects (closed, deleted) from the trending set."""
+    redis = get_redis()
+    if redis is None or not project_ids:
+        return
+    redis.zrem(_trending_key(), *[str(project_id) for project_id in project_ids])
+
+
+def schedule_trending_removal(*project_ids):
+    """Remove the given projects from trending once the transaction commits."""
+    def _remove():
+        try:
+            remove_from_trending(*project_ids)
+        except Exception as e:
+            logger.warning(f"Could not update trending projects: {e}")
+
+    transaction.on_commit(_remove)
+
+
+def refresh_trending():
+    """
+    Apply decay up to now and prune the trending set.
+    
+    Rebases every score onto a new landmark (now), then removes projects
+    that are no longer open and scores below MIN_SCORE. Seeds the set from
+    the database when it does not exist yet.
+    
+    Returns:
+        int: Projects left in the set, or None without Redis
+    """
+    redis = get_redis()
+    if redis is None:
+        return None
+
+    if not redis.exists(_landmark_key()):
+        return rebuild_trending()
+
+    key = _trending_key()
+    now = time.time()
+    factor = decay_factor(now - float(redis.get(_landmark_key())))
+
+    # Increments computed against the old landmark that land after this
+    # are overweighted by at most one refresh interval of decay
+    pipe = redis.pipeline(transaction=True)
+    pipe.zunionstore(key, {key: factor})
+    pipe.set(_landmark_key(), now)
+    pipe.zremrangebyscore(key, '-inf', f'({MIN_SCORE}')
+    pipe.execute()
+
+    _prune_closed(redis, key)
+    return redis.zcard(key)
+
+
+def _prune_closed(redis, key):
+    """Remove members that are not (or no longer) open projects."""
+    from apps.projects.models import Project
+
+    members = [member.decode('utf-8') for member, _ in redis.zscan_iter(key, count=1000)]
+    if not members:
+        return
+    open_ids = {
+        str(project_id) for project_id in Project.visible.filter(
+            pk__in=members, status='open'
+        ).values_list('pk', flat=True)
+    }
+    stale = [member for member in members if member not in open_ids]
+    if stale:
+        redis.zrem(key, *stale)
+
+
+def rebuild_trending():
+    """
+    Rebuild the trending set from contributions submitted and accepted in
+    the last TRENDING_WINDOW_DAYS.
+    
+    Detail views are not stored in the database, so a rebuild only restores
+    the contribution part of the scores; it runs when the set is missing.
+    
+    Returns:
+        int: Number of open projects scored, or None without Redis
+    """
+    from apps.contributions.models import Contribution
+
+    redis = get_redis()
+    if redis is None:
+        return None
+
+    now = time.time()
+    since = timezone.now() - timedelta(days=settings.TRENDING_WINDOW_DAYS)
+    weights = event_weights()
+    scores = {}
+
+    rows = Contribution.objects.filter(
+        project__status='open'
+    ).filter(
+        Q(created_at__gte=since) | Q(status='accepted', decided_at__gte=since)
+    ).values_list('project_id', 'created_at', 'status', 'decided_at')
+    for project_id, created_at, status, decided_at in rows.iterator(chunk_size=5000):
+        project_id = str(project_id)
+        if created_at >= since:
+            scores[project_id] = scores.get(project_id, 0) + (
+                weights[SUBMISSION] * decay_factor(now - created_at.timestamp())
+            )
+        if status == 'accepted' and decided_at and decided_at >= since:
+            scores[project_id] = scores.get(project_id, 0) + (
+                weights[ACCEPT] * decay_factor(now - decided_at.timestamp())
+            )
+
+    scores = {project_id: score for project_id, score in scores.items() if score >= MIN_SCORE}
+    key = _trending_key()
+    pipe = redis.pipeline(transaction=True)
+    pipe.delete(key)
+    if scores:
+        pipe.zadd(key, scores)
+    pipe.set(_landmark_key(), now)
+    pipe.execute()
+    return len(scores)
+
+
+class TrendingProjects:
+    """
+    Lazy, rank-ordered sequence of trending projects for Django's Paginator.
+    
+    len() is one ZCARD; slicing fetches that rank range with ZREVRANGE and
+    hydrates it with a single id__in query on the given queryset, returning
+    the projects in rank order. Members that are no longer open are skipped,
+    so a page can come up short until the next refresh prunes them.
+    """
+
+    def __init__(self, redis, queryset):
+        self.redis = redis
+        self.queryset = queryset
+        self._count = None
+
+    def __len__(self):
+        if self._count is None:
+            self._count = self.redis.zcard(_trending_key())
+        return self._count
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice) or index.step not in (None, 1):
+            raise TypeError('TrendingProjects only supports contiguous slices')
+        start = index.start or 0
+        stop = len(self) if index.stop is None else index.stop
+        if stop <= start:
+            return []
+
+        ids = [
+            uuid.UUID(member.decode('utf-8'))
+            for member in self.redis.zrevrange(_trending_key(), start, stop - 1)
+        ]
+        projects = self.queryset.filter(pk__in=ids, status='open').in_bulk()
+        return [projects[project_id] for project_id in ids if project_id in projects]
+
+
+def trending_in_database(queryset):
+    """Fallback ordering: open projects by contributions in the trending window."""
+    since = timezone.now() - timedelta(days=settings.TRENDING_WINDOW_DAYS)
+    return queryset.filter(status='open').annotate(
+        recent_contributions=Count('contributions', filter=Q(contributions__created_at__gte=since))
+    ).order_by('-recent_contributions', '-created_at', '-id')
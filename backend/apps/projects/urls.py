@@ -9,11 +9,18 @@ app_name = 'projects'
 urlpatterns = [
     # Project CRUD
     path('', views.ProjectListCreateView.as_view(), name='project-list-create'),
+    path('facets/', views.ProjectFacetsView.as_view(), name='project-facets'),
+    path('export/', views.ProjectExportView.as_view(), name='project-export'),
+    path('import/', views.ProjectImportView.as_view(), name='project-import'),
     path('<uuid:id>/', views.ProjectDetailView.as_view(), name='project-detail'),
     path('<uuid:id>/close/', views.CloseProjectView.as_view(), name='project-close'),
+    path('<uuid:id>/contributors/', views.ProjectContributorsView.as_view(), name='project-contributors'),
+    path('<uuid:id>/related/', views.ProjectRelatedView.as_view(), name='project-related'),
     
     # My Projects
     path('my-projects/', views.MyProjectsView.as_view(), name='my-projects'),
+    path('my-projects/dashboard/', views.HostDashboardView.as_view(), name='host-dashboard'),
+    path('for-me/', views.ProjectsForMeView.as_view(), name='projects-for-me'),
     
     # Resources & Notes (Private)
     path('<uuid:project_id>/resources/', views.ProjectResourceListCreateView.as_view(), name='project-resource-list-create'),
@@ -23,5 +30,6 @@ urlpatterns = [
 
     # Tags
     path('tags/', views.ProjectTagListView.as_view(), name='project-tags'),
+    path('tags/suggest/', views.ProjectTagSuggestView.as_view(), name='project-tag-suggest'),
 ]
 
@@ -3,30 +3,111 @@ API views for project management.
 
 Handles project CRUD operations, filtering, search, and tag management.
 """
+import logging
+from contextlib import nullcontext
+from django.conf import settings
 from rest_framework import generics, filters, status
+from rest_framework.exceptions import NotFound
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
-from django.contrib.postgres.search import SearchQuery, SearchRank
-from django.db.models import Q, Count
+from django.db.models import Count, Max, OuterRef, Prefetch, Q, Subquery
 from django_filters.rest_framework import DjangoFilterBackend
 
-from apps.projects.models import Project, ProjectTag, ProjectResource, ProjectNote
+from apps.contributions.models import Contribution
+from apps.projects.cache import get_cached_list, list_cache_key, set_cached_list
+from apps.projects.dashboard import host_dashboard_queryset
+from apps.projects.export import PROJECT_EXPORT_COLUMNS, attach_tags, export_rows_queryset
+from apps.projects.facets import DEFAULT_TAG_LIMIT, MAX_TAG_LIMIT, compute_project_facets
+from apps.projects.matching import DEFAULT_MATCH_LIMIT, MAX_MATCH_LIMIT, get_redis, match_projects, normalize_skills
+from apps.projects.models import Project, ProjectTag, ProjectTagMap, ProjectResource, ProjectNote
+from apps.projects.related import DEFAULT_RELATED_LIMIT, MAX_RELATED_LIMIT, get_related_projects
+from apps.projects.search import search_projects
+from apps.projects.services import ProjectDeletionService, ProjectImportService
+from apps.projects.tag_index import DEFAULT_SUGGEST_LIMIT, MAX_SUGGEST_LIMIT, tag_index
+from apps.projects.trending import TrendingProjects, record_project_view, trending_in_database
 from apps.projects.serializers import (
     ProjectListSerializer,
     ProjectDetailSerializer,
+    HostDashboardProjectSerializer,
     ProjectCreateSerializer,
     ProjectUpdateSerializer,
     ProjectTagSerializer,
     ProjectResourceSerializer,
     ProjectNoteSerializer
 )
+from apps.users.models import User
 from apps.users.permissions import IsAuthenticatedAndVerified, IsHostOrReadOnly, IsProjectMember
-from core.pagination import ProjectPagination
+from apps.users.serializers import UserProfileSerializer
+from apps.users.sideload import SideloadUsersViewMixin
+from core.conditional import compute_etag, not_modified_response, set_conditional_headers
+from core.db_router import use_primary
+from core.export import EXPORT_FORMATS, get_export_format, iter_chunks, streaming_export_response
+from core.fieldsets import SparseQuerysetMixin
+from core.pagination import CustomPageNumberPagination, ProjectPagination
 from core.responses import success_response, error_response, created_response, no_content_response
 
+logger = logging.getLogger(__name__)
 
-class ProjectListCreateView(generics.ListCreateAPIView):
+
+class SearchRankOrderingFilter(filters.OrderingFilter):
+    """
+    OrderingFilter that keeps relevance order for searches without ?ordering=.
+    
+    search_projects() orders ranked matches by -rank; the view's default
+    ordering only applies to lists that were not searched.
+    """
+    
+    def filter_queryset(self, request, queryset, view):
+        if not request.query_params.get(self.ordering_param) and 'rank' in queryset.query.annotations:
+            return queryset
+        return super().filter_queryset(request, queryset, view)
+
+
+class ProjectListQueryMixin:
+    """
+    Queryset building shared by the project list and facets endpoints.
+    
+    Applies status/difficulty filters, tag filtering ('tags', comma-separated)
+    and full-text + substring search ('search', handled by search_projects
+    rather than DRF's SearchFilter, whose icontains chain would drop FTS and
+    tag matches).
+    """
+    queryset = Project.visible.all()
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['status', 'difficulty']
+    
+    def get_queryset(self):
+        """
+        Get filtered queryset with optimizations.
+        
+        Supports:
+        - Full-text search via 'search' parameter
+        - Tag filtering via 'tags' parameter (comma-separated)
+        - Status and difficulty filtering via Django Filter
+        """
+        queryset = Project.visible.select_related('host_user').prefetch_related(
+            'tag_maps__tag'
+        )
+        
+        # Filter by tags if provided
+        tags_param = self.request.query_params.get('tags')
+        if tags_param:
+            tag_names = [tag.strip().lower() for tag in tags_param.split(',') if tag.strip()]
+            if tag_names:
+                queryset = queryset.filter(
+                    tag_maps__tag__name__in=tag_names
+                ).distinct()
+        
+        # Full-text search + trigram-indexed substring matching
+        search_query = self.request.query_params.get('search')
+        if search_query:
+            queryset = search_projects(queryset, search_query)
+        
+        return queryset
+
+
+class ProjectListCreateView(SideloadUsersViewMixin, SparseQuerysetMixin, ProjectListQueryMixin, generics.ListCreateAPIView):
     """
     GET /api/v1/projects/
     List all open projects with filtering and search.
@@ -39,14 +120,16 @@ class ProjectListCreateView(generics.ListCreateAPIView):
     - status: Filter by status (OPEN, CLOSED, DRAFT)
     - difficulty: Filter by difficulty (EASY, INTERMEDIATE, ADVANCED)
     - tags: Filter by tag names (comma-separated)
-    - ordering: Sort by field (e.g., -created_at, title)
+    - ordering: Sort by field (e.g., -created_at, title, -contribution_count),
+      or 'trending' for open projects ranked by recent activity. Defaults to
+      search relevance when searching, else -created_at
+    - pagination: 'cursor' for keyset pagination (newest first, uses ?cursor=)
+    - fields / omit: Comma-separated response fields to include / exclude
+    - include: 'users' to side-load host profiles into included.users
     """
-    queryset = Project.objects.all()
     pagination_class = ProjectPagination
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['status', 'difficulty']
-    search_fields = ['title', 'description', 'desired_outputs']
-    ordering_fields = ['created_at', 'updated_at', 'title']
+    filter_backends = ProjectListQueryMixin.filter_backends + [SearchRankOrderingFilter]
+    ordering_fields = ['created_at', 'updated_at', 'title', 'contribution_count']
     ordering = ['-created_at']
     
     def get_permissions(self):
@@ -61,58 +144,77 @@ class ProjectListCreateView(generics.ListCreateAPIView):
             return ProjectCreateSerializer
         return ProjectListSerializer
     
-    def get_queryset(self):
+    def list(self, request, *args, **kwargs):
         """
-        Get filtered queryset with optimizations.
+        List projects, served from the versioned Redis cache when possible.
         
-        Supports:
-        - Full-text search via 'search' parameter
-        - Tag filtering via 'tags' parameter (comma-separated)
-        - Status and difficulty filtering via Django Filter
+        Responses carry X-Cache: HIT or MISS. Cache errors fall back to the database.
+        A miss is filled from the primary: a lagging replica would otherwise
+        store pre-write data under the version key the write just bumped.
         """
-        queryset = Project.objects.select_related('host_user').prefetch_related(
-            'tag_maps__tag'
-        )
+        if request.query_params.get('ordering') == 'trending':
+            return self.list_trending(request)
         
-        # Filter by tags if provided
-        tags_param = self.request.query_params.get('tags')
-        if tags_param:
-            tag_names = [tag.strip().lower() for tag in tags_param.split(',') if tag.strip()]
-            if tag_names:
-                queryset = queryset.filter(
-                    tag_maps__tag__name__in=tag_names
-                ).distinct()
+        if not settings.PROJECT_LIST_CACHE_ENABLED:
+            return super().list(request, *args, **kwargs)
         
-        # Full-text search + Substring matching
-        search_query = self.request.query_params.get('search')
-        if search_query:
-            # 1. Full-Text Search (Prefix matching for ranking)
-            words = [f"{word}:*" for word in search_query.split() if word]
-            fts_query = None
-            if words:
-                raw_query = " & ".join(words)
-                fts_query = SearchQuery(raw_query, search_type='raw')
-            
-            # 2. Substring matching (Standard Django icontains)
-            substring_filter = (
-                Q(title__icontains=search_query) |
-                Q(description__icontains=search_query) |
-                Q(desired_outputs__icontains=search_query) |
-                Q(tag_maps__tag__name__icontains=search_query)
+        try:
+            cache_key = list_cache_key(request)
+            cached = get_cached_list(cache_key)
+        except Exception as e:
+            logger.warning(f"Project list cache unavailable: {e}")
+            return super().list(request, *args, **kwargs)
+        
+        if cached is not None:
+            return Response(cached, headers={'X-Cache': 'HIT'})
+        
+        with use_primary():
+            response = super().list(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            try:
+                set_cached_list(cache_key, response.data)
+            except Exception as e:
+                logger.warning(f"Could not cache project list: {e}")
+        response['X-Cache'] = 'MISS'
+        return response
+    
+    def list_trending(self, request):
+        """
+        List open projects by trending score (?ordering=trending).
+        
+        Pages through the Redis sorted set by rank and hydrates each page in
+        one query. Not cached, since every view moves the scores. Without
+        Redis (or if it fails) projects are ranked by recent contributions.
+        """
+        unsupported = [
+            param for param in ('search', 'tags', 'difficulty')
+            if request.query_params.get(param)
+        ]
+        if request.query_params.get('status', 'open') != 'open':
+            unsupported.append('status')
+        if request.query_params.get('pagination') == 'cursor':
+            unsupported.append('pagination')
+        if unsupported:
+            return error_response(
+                error='validation_error',
+                detail=f"ordering=trending cannot be combined with: {', '.join(unsupported)}"
             )
-            
-            # Combine them: Match if either FTS matches OR substring filter matches
-            if fts_query:
-                queryset = queryset.filter(
-                    Q(search_vector=fts_query) | substring_filter
-                ).annotate(
-                    # Annotate rank; matches that only satisfy substring_filter get rank 0
-                    rank=SearchRank('search_vector', fts_query)
-                ).order_by('-rank')
-            else:
-                queryset = queryset.filter(substring_filter)
         
-        return queryset
+        queryset = self.filter_queryset(self.get_queryset())
+        page = None
+        redis = get_redis()
+        if redis is not None:
+            try:
+                page = self.paginate_queryset(TrendingProjects(redis, queryset))
+            except NotFound:
+                raise
+            except Exception as e:
+                logger.warning(f"Trending projects unavailable, ranking in the database: {e}")
+        if page is None:
+            page = self.paginate_queryset(trending_in_database(queryset))
+        
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
     
     def create(self, request, *args, **kwargs):
         """Create a new project."""
@@ -135,6 +237,116 @@ class ProjectListCreateView(generics.ListCreateAPIView):
         )
 
 
+class ProjectFacetsView(ProjectListQueryMixin, generics.GenericAPIView):
+    """
+    GET /api/v1/projects/facets/
+    Facet counts (status, difficulty, top tags) for the current search.
+    
+    Accepts the same filter/search parameters as the project list, plus:
+    - tag_limit: Number of tags to return (default 20, max 100)
+    """
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    
+    def get(self, request):
+        """Return facet counts, served from the versioned cache when possible."""
+        try:
+            tag_limit = int(request.query_params.get('tag_limit', DEFAULT_TAG_LIMIT))
+        except ValueError:
+            return error_response(
+                error='validation_error',
+                detail='tag_limit must be an integer'
+            )
+        tag_limit = max(1, min(tag_limit, MAX_TAG_LIMIT))
+        
+        cache_key = None
+        if settings.PROJECT_LIST_CACHE_ENABLED:
+            try:
+                cache_key = list_cache_key(request, namespace='facets')
+                cached = get_cached_list(cache_key)
+            except Exception as e:
+                logger.warning(f"Project facets cache unavailable: {e}")
+                cache_key, cached = None, None
+            if cached is not None:
+                return Response(cached, headers={'X-Cache': 'HIT'})
+        
+        queryset = self.filter_queryset(self.get_queryset())
+        # Facets that get cached must not come from a lagging replica
+        with use_primary() if cache_key else nullcontext():
+            data = compute_project_facets(queryset, tag_limit)
+        response = success_response(data=data)
+        
+        if cache_key:
+            try:
+                set_cached_list(cache_key, response.data)
+            except Exception as e:
+                logger.warning(f"Could not cache project facets: {e}")
+            response['X-Cache'] = 'MISS'
+        return response
+
+
+class ProjectExportView(ProjectListQueryMixin, generics.GenericAPIView):
+    """
+    GET /api/v1/projects/export/
+    Stream every project matching the list filters as NDJSON or CSV.
+    
+    Accepts the same filter/search parameters as the project list, plus:
+    - output: 'ndjson' (default, one JSON object per line) or 'csv'
+    """
+    permission_classes = [IsAuthenticatedAndVerified]
+    
+    def get(self, request):
+        """Stream the export in server-side cursor chunks with per-chunk tag lookups."""
+        export_format = get_export_format(request)
+        if export_format is None:
+            return error_response(
+                error='validation_error',
+                detail=f"output must be one of: {', '.join(EXPORT_FORMATS)}"
+            )
+        
+        rows = export_rows_queryset(self.filter_queryset(self.get_queryset()))
+        chunks = (attach_tags(chunk) for chunk in iter_chunks(rows, settings.EXPORT_CHUNK_SIZE))
+        return streaming_export_response(request, chunks, PROJECT_EXPORT_COLUMNS, export_format, 'projects')
+
+
+class ProjectImportView(APIView):
+    """
+    POST /api/v1/projects/import/
+    Create many projects, hosted by the current user, in one request.
+    
+    Body: {"projects": [<project create payload>, ...]} (up to
+    PROJECT_IMPORT_MAX_ROWS rows). Invalid rows are reported by index and
+    do not prevent the valid ones from being imported.
+    """
+    permission_classes = [IsAuthenticatedAndVerified]
+    
+    def post(self, request):
+        """Validate every row, then insert the valid ones in bulk."""
+        rows = request.data.get('projects') if isinstance(request.data, dict) else None
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            return error_response(
+                error='validation_error',
+                detail='projects must be a list of project objects'
+            )
+        if len(rows) > settings.PROJECT_IMPORT_MAX_ROWS:
+            return error_response(
+                error='validation_error',
+                detail=f'At most {settings.PROJECT_IMPORT_MAX_ROWS} projects can be imported per request'
+            )
+        
+        result = ProjectImportService.import_projects(request.user, rows)
+        if not result['created']:
+            return error_response(
+                error='validation_error',
+                detail='No projects were imported',
+                field_errors={'projects': result['errors']}
+            )
+        
+        return created_response(
+            data=result,
+            message=f"Imported {len(result['created'])} of {len(rows)} project(s)"
+        )
+
+
 class ProjectDetailView(generics.RetrieveUpdateDestroyAPIView):
     """
     GET /api/v1/projects/<id>/
@@ -146,24 +358,82 @@ class ProjectDetailView(generics.RetrieveUpdateDestroyAPIView):
     DELETE /api/v1/projects/<id>/
     Delete project (host only, soft delete).
     """
-    queryset = Project.objects.select_related('host_user').prefetch_related(
-        'tag_maps__tag',
-        'contributions__contributor_user'
-    )
+    queryset = Project.visible.select_related('host_user').prefetch_related('tag_maps__tag')
     permission_classes = [IsHostOrReadOnly]
     lookup_field = 'id'
     
+    def get_queryset(self):
+        """Prefetch only the most recent accepted contributions (bounded per project)."""
+        queryset = super().get_queryset()
+        if self.request.method not in ('GET', 'HEAD'):
+            return queryset
+        
+        accepted_preview = Contribution.objects.filter(
+            status='accepted'
+        ).select_related('contributor_user').order_by(
+            '-decided_at'
+        )[:settings.PROJECT_DETAIL_CONTRIBUTORS_LIMIT]
+        return queryset.prefetch_related(
+            Prefetch('contributions', queryset=accepted_preview, to_attr='accepted_contributions_preview')
+        )
+    
     def get_serializer_class(self):
         """Return appropriate serializer based on request method."""
         if self.request.method in ['PUT', 'PATCH']:
             return ProjectUpdateSerializer
         return ProjectDetailSerializer
     
+    def get_conditional_validators(self):
+        """
+        ETag for the detail representation, or None if not found.
+        
+        One query on the project row (and its counters) and host profile,
+        with indexed scalar subqueries for the tag associations and accepted
+        contributors' profiles. No Last-Modified is sent: counter changes and
+        tag removals have no timestamp, so only the ETag catches them.
+        """
+        tag_maps = ProjectTagMap.objects.filter(project=OuterRef('pk')).order_by().values('project')
+        accepted = Contribution.objects.filter(
+            project=OuterRef('pk'), status='accepted'
+        ).order_by().values('project')
+        rows = list(
+            Project.visible.filter(id=self.kwargs['id']).order_by().annotate(
+                tag_count=Subquery(tag_maps.annotate(total=Count('id')).values('total')),
+                tags_modified=Subquery(tag_maps.annotate(newest=Max('created_at')).values('newest')),
+                contributors_modified=Subquery(
+                    accepted.annotate(newest=Max('contributor_user__updated_at')).values('newest')
+                ),
+            ).values(
+                'updated_at',
+                'contribution_count',
+                'pending_contribution_count',
+                'accepted_contribution_count',
+                'host_user__updated_at',
+                'tag_count',
+                'tags_modified',
+                'contributors_modified',
+            )[:1]
+        )
+        if not rows:
+            return None
+        
+        return compute_etag(self.kwargs['id'], *rows[0].values()), None
+    
     def retrieve(self, request, *args, **kwargs):
-        """Get project details."""
+        """Get project details, answering 304 if the client's copy is current."""
+        validators = self.get_conditional_validators()
+        if validators:
+            not_modified = not_modified_response(request, *validators)
+            if not_modified is not None:
+                return not_modified
+        
         instance = self.get_object()
+        record_project_view(instance, request)
         serializer = self.get_serializer(instance)
-        return success_response(data=serializer.data)
+        response = success_response(data=serializer.data)
+        if validators:
+            set_conditional_headers(response, *validators)
+        return response
     
     def update(self, request, *args, **kwargs):
         """Update project."""
@@ -208,43 +478,179 @@ class ProjectDetailView(generics.RetrieveUpdateDestroyAPIView):
                 status_code=status.HTTP_403_FORBIDDEN
             )
         
-        try:
-            # Perform hard delete
-            instance.delete()
+        # Hidden immediately; contributions, chat and notes are purged in the background
+        if ProjectDeletionService.request_deletion(instance):
             return success_response(
                 message='Project deleted successfully'
             )
-        except Exception as e:
-            instance.status = 'closed'
-            instance.save()
-            return success_response(
-                message='Project closed instead of deleted because credits have already been issued. Audit history must be preserved.'
+        
+        return success_response(
+            message='Project closed instead of deleted because credits have already been issued. Audit history must be preserved.'
+        )
+
+
+class ProjectContributorsView(generics.ListAPIView):
+    """
+    GET /api/v1/projects/<id>/contributors/
+    Paginated list of all users with accepted contributions ("see all").
+    
+    Ordered by most recent acceptance.
+    """
+    serializer_class = UserProfileSerializer
+    pagination_class = CustomPageNumberPagination
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    
+    def get_queryset(self):
+        """Accepted contributors of the project (one contribution per user per project)."""
+        project_id = self.kwargs['id']
+        if not Project.visible.filter(id=project_id).exists():
+            raise NotFound('Project not found')
+        
+        return User.objects.filter(
+            contributions__project_id=project_id,
+            contributions__status='accepted'
+        ).order_by('-contributions__decided_at', 'id')
+
+
+class ProjectRelatedView(APIView):
+    """
+    GET /api/v1/projects/<id>/related/
+    Most similar open projects by tag overlap and text similarity.
+    
+    Query Parameters:
+    - limit: Number of projects (default 10, max 50)
+    """
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    
+    def get(self, request, id):
+        """Return related projects, best match first, each with a related_score."""
+        try:
+            project = Project.visible.get(id=id)
+        except Project.DoesNotExist:
+            return error_response(
+                error='not_found',
+                detail='Project not found',
+                status_code=status.HTTP_404_NOT_FOUND
             )
+        
+        try:
+            limit = int(request.query_params.get('limit', DEFAULT_RELATED_LIMIT))
+        except ValueError:
+            return error_response(
+                error='validation_error',
+                detail='limit must be an integer'
+            )
+        limit = max(1, min(limit, MAX_RELATED_LIMIT))
+        
+        related = get_related_projects(project, limit)
+        data = ProjectListSerializer(related, many=True, context={'request': request}).data
+        for item, related_project in zip(data, related):
+            item['related_score'] = related_project.related_score
+        return success_response(data=data)
 
 
-class MyProjectsView(generics.ListAPIView):
+class ProjectsForMeView(APIView):
+    """
+    GET /api/v1/projects/for-me/
+    Open projects ranked by overlap between their tags and the user's skills.
+    
+    Excludes the user's own projects and projects they already contributed to.
+    
+    Query Parameters:
+    - limit: Number of projects (default 20, max 50)
+    """
+    permission_classes = [IsAuthenticatedAndVerified]
+    
+    def get(self, request):
+        """Return matching projects, best match first, with matched_skills."""
+        try:
+            limit = int(request.query_params.get('limit', DEFAULT_MATCH_LIMIT))
+        except ValueError:
+            return error_response(
+                error='validation_error',
+                detail='limit must be an integer'
+            )
+        limit = max(1, min(limit, MAX_MATCH_LIMIT))
+        
+        user = request.user
+        exclude_ids = set(
+            Project.objects.filter(host_user=user).values_list('id', flat=True)
+        ) | set(
+            Contribution.objects.filter(contributor_user=user).values_list('project_id', flat=True)
+        )
+        matches = match_projects(user.skills, limit, exclude_ids)
+        
+        # Hydrate in one query, keeping the ranking order
+        projects = Project.visible.filter(
+            id__in=[project_id for project_id, _ in matches], status='open'
+        ).select_related('host_user').prefetch_related('tag_maps__tag').in_bulk()
+        ranked = [projects[project_id] for project_id, _ in matches if project_id in projects]
+        
+        skills = set(normalize_skills(user.skills))
+        data = ProjectListSerializer(ranked, many=True, context={'request': request}).data
+        for item, project in zip(data, ranked):
+            item['matched_skills'] = sorted(skills.intersection(project.tag_names))
+            item['match_score'] = len(item['matched_skills'])
+        return success_response(data=data)
+
+
+class MyProjectsView(SideloadUsersViewMixin, SparseQuerysetMixin, generics.ListAPIView):
     """
     GET /api/v1/projects/my-projects/
     List projects created by the authenticated user.
     
     Query Parameters:
     - status: Filter by status (OPEN, closed, DRAFT)
+    - fields / omit: Comma-separated response fields to include / exclude
+    - include: 'users' to side-load host profiles into included.users
     """
     serializer_class = ProjectListSerializer
     permission_classes = [IsAuthenticatedAndVerified]
     pagination_class = ProjectPagination
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['status', 'difficulty']
-    ordering_fields = ['created_at', 'updated_at', 'title']
+    ordering_fields = ['created_at', 'updated_at', 'title', 'contribution_count']
     ordering = ['-created_at']
     
     def get_queryset(self):
         """Get projects created by current user."""
-        return Project.objects.filter(
+        return Project.visible.filter(
             host_user=self.request.user
         ).select_related('host_user').prefetch_related('tag_maps__tag')
 
 
+class HostDashboardView(APIView):
+    """
+    GET /api/v1/projects/my-projects/dashboard/
+    The authenticated host's projects with per-project activity statistics.
+    
+    Each project carries pending/accepted/declined contribution counts, the
+    newest pending submission time and the latest chat message time, all
+    loaded in a single query.
+    
+    Query Parameters:
+    - status: Only projects with this status (open, closed, draft)
+    """
+    permission_classes = [IsAuthenticatedAndVerified]
+    
+    def get(self, request):
+        queryset = host_dashboard_queryset(request.user)
+        status_filter = request.query_params.get('status')
+        if status_filter:
+            queryset = queryset.filter(status=status_filter.lower())
+        
+        projects = HostDashboardProjectSerializer(queryset, many=True).data
+        return success_response(data={
+            'summary': {
+                'projects': len(projects),
+                'pending': sum(project['pending_count'] for project in projects),
+                'accepted': sum(project['accepted_count'] for project in projects),
+                'declined': sum(project['declined_count'] for project in projects),
+            },
+            'projects': projects,
+        })
+
+
 class ProjectTagListView(generics.ListAPIView):
     """
     GET /api/v1/projects/tags/
@@ -259,6 +665,37 @@ class ProjectTagListView(generics.ListAPIView):
     permission_classes = [IsAuthenticatedOrReadOnly]
 
 
+class ProjectTagSuggestView(APIView):
+    """
+    GET /api/v1/projects/tags/suggest/?q=<prefix>
+    Tag autocomplete, most used tags first.
+    
+    Served from the in-process tag prefix index, not the database.
+    
+    Query Parameters:
+    - q: Tag name prefix (case-insensitive; a blank prefix returns no suggestions)
+    - limit: Number of suggestions (default 10, max 50)
+    """
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    
+    def get(self, request):
+        """Return tag suggestions for the given prefix."""
+        try:
+            limit = int(request.query_params.get('limit', DEFAULT_SUGGEST_LIMIT))
+        except ValueError:
+            return error_response(
+                error='validation_error',
+                detail='limit must be an integer'
+            )
+        limit = max(1, min(limit, MAX_SUGGEST_LIMIT))
+        
+        suggestions = tag_index.suggest(request.query_params.get('q', ''), limit)
+        return success_response(data=[
+            {'name': name, 'usage_count': usage_count}
+            for name, usage_count in suggestions
+        ])
+
+
 class CloseProjectView(APIView):
     """
     POST /api/v1/projects/<id>/close/
@@ -271,7 +708,7 @@ class CloseProjectView(APIView):
     def post(self, request, id):
         """Close project."""
         try:
-            project = Project.objects.get(id=id)
+            project = Project.visible.get(id=id)
         except Project.DoesNotExist:
             return error_response(
                 error='not_found',
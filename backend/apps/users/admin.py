@@ -36,6 +36,9 @@ class UserAdmin(BaseUserAdmin):
         ('Profile', {
             'fields': ('display_name', 'bio', 'skills', 'github_url', 'portfolio_url')
         }),
+        ('Credits', {
+            'fields': ('credit_balance',)
+        }),
         ('Permissions', {
             'fields': ('is_active', 'is_staff', 'is_superuser', 'is_admin')
         }),
@@ -52,7 +55,8 @@ class UserAdmin(BaseUserAdmin):
         'updated_at',
         'date_joined',
         'email_verified_at',
-        'data_anonymized_at'
+        'data_anonymized_at',
+        'credit_balance'
     ]
     
     add_fieldsets = (
@@ -0,0 +1,36 @@
+# Generated by Django 5.0 on 2026-10-16 22:34
+
+from django.db import migrations, models
+from django.db.models import Case, F, OuterRef, Subquery, Sum, When
+from django.db.models.functions import Coalesce
+
+
+def backfill_credit_balance(apps, schema_editor):
+    """Populate credit_balance from the existing ledger."""
+    User = apps.get_model('users', 'User')
+    CreditLedgerEntry = apps.get_model('credits', 'CreditLedgerEntry')
+
+    ledger_balance = CreditLedgerEntry.objects.filter(
+        to_user=OuterRef('pk')
+    ).values('to_user').annotate(
+        total=Sum(Case(When(entry_type='reversal', then=-F('amount')), default=F('amount')))
+    ).values('total')
+
+    User.objects.update(credit_balance=Coalesce(Subquery(ledger_balance), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+        ('credits', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='credit_balance',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_credit_balance, migrations.RunPython.noop),
+    ]
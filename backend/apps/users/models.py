@@ -3,8 +3,10 @@ from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.utils import timezone
 
+from core.models import DirtyFieldsMixin
 
-class User(AbstractUser):
+
+class User(DirtyFieldsMixin, AbstractUser):
     """
     Custom User model extending Django's AbstractUser.
     
@@ -35,6 +37,13 @@ class User(AbstractUser):
     github_url = models.URLField(max_length=500, blank=True, default='')
     portfolio_url = models.URLField(max_length=500, blank=True, default='')
     
+    # Denormalized credit balance (maintained by CreditLedgerEntry.save, rebuildable from ledger)
+    credit_balance = models.IntegerField(default=0, editable=False)
+    
+    # Never write credit_balance from a full save: the in-memory value may be
+    # stale and would clobber concurrent F() updates from the credit ledger.
+    save_excluded_fields = ('credit_balance',)
+    
     # Permissions (is_superuser, is_staff inherited from AbstractUser)
     is_admin = models.BooleanField(default=False)
     
@@ -88,6 +97,7 @@ class User(AbstractUser):
             while User.objects.filter(username=self.username).exists():
                 self.username = f"{base_username}{counter}"
                 counter += 1
+
         super().save(*args, **kwargs)
     
     def anonymize(self):
@@ -111,21 +121,10 @@ class User(AbstractUser):
     @property
     def total_credits(self):
         """
-        Calculate total credits from ledger (computed property).
+        Net credit balance (Awards + Adjustments - Reversals).
         
-        Returns sum of amounts for this user (Awards + Adjustments - Reversals).
+        Served from the denormalized credit_balance column so nested profiles
+        don't run a ledger aggregate per row. Use
+        CreditService.get_user_credit_balance() for the ledger-computed value.
         """
-        from apps.credits.models import CreditLedgerEntry
-        from django.db.models import Sum, Q
-        
-        stats = CreditLedgerEntry.objects.filter(to_user=self).aggregate(
-            awards=Sum('amount', filter=Q(entry_type='award')),
-            reversals=Sum('amount', filter=Q(entry_type='reversal')),
-            adjustments=Sum('amount', filter=Q(entry_type='adjustment'))
-        )
-        
-        awards = stats['awards'] or 0
-        reversals = stats['reversals'] or 0
-        adjustments = stats['adjustments'] or 0
-        
-        return awards - reversals + adjustments
+        return self.credit_balance
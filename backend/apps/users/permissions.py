@@ -162,7 +162,7 @@ class IsProjectMember(permissions.BasePermission):
             
         from apps.projects.models import Project
         try:
-            project = Project.objects.get(id=project_id)
+            project = Project.visible.get(id=project_id)
         except Project.DoesNotExist:
             return False
             
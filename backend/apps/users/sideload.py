@@ -0,0 +1,75 @@
+"""
+Side-loaded ("normalized") user profiles for list endpoints.
+
+With ?include=users, rows carry user IDs instead of embedded profiles and
+the response envelope gains a deduplicated map of those users, loaded with
+one batched query:
+
+    {"data": [{"id": "...", "host": "<user id>", ...}],
+     "included": {"users": {"<user id>": {...profile...}}}}
+"""
+from rest_framework import serializers
+
+from apps.users.models import User
+from apps.users.serializers import UserProfileSerializer
+from core.fieldsets import SAFE_METHODS, flatten_select_related, parse_field_list
+
+INCLUDE_PARAM = 'include'
+
+
+def wants_sideloaded_users(request):
+    """True if the request asked for ?include=users."""
+    return (
+        request is not None and
+        request.method in SAFE_METHODS and
+        'users' in parse_field_list(request.query_params.get(INCLUDE_PARAM))
+    )
+
+
+class SideloadUsersMixin:
+    """
+    Serializer mixin rendering user relations as IDs under ?include=users.
+    
+    sideload_user_fields maps serializer field names to the model's user
+    foreign keys, e.g. {'host': 'host_user'}.
+    """
+    sideload_user_fields = {}
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if wants_sideloaded_users(self.context.get('request')):
+            for name, relation in self.sideload_user_fields.items():
+                if name in self.fields:
+                    self.fields[name] = serializers.PrimaryKeyRelatedField(source=relation, read_only=True)
+
+
+class SideloadUsersViewMixin:
+    """
+    List view mixin adding included.users to paginated responses under ?include=users.
+    
+    The user joins are dropped from the queryset; profiles are loaded once
+    per page for the distinct IDs referenced by the rows.
+    """
+    
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        serializer_class = self.get_serializer_class()
+        relations = set(getattr(serializer_class, 'sideload_user_fields', {}).values())
+        select_related = queryset.query.select_related
+        if not relations or not wants_sideloaded_users(self.request) or not isinstance(select_related, dict):
+            return queryset
+        
+        paths = [path for path in flatten_select_related(select_related) if path.split('__')[0] not in relations]
+        queryset = queryset.select_related(None)
+        return queryset.select_related(*paths) if paths else queryset
+    
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if wants_sideloaded_users(self.request):
+            fields = getattr(self.get_serializer_class(), 'sideload_user_fields', {})
+            user_ids = {row[name] for row in data for name in fields if row.get(name)}
+            profiles = UserProfileSerializer(User.objects.filter(id__in=user_ids), many=True).data
+            response.data['included'] = {
+                'users': {profile['id']: profile for profile in profiles}
+            }
+        return response
@@ -0,0 +1,34 @@
+"""
+Tests for conditional GET (ETag / 304) on public profiles.
+"""
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.users.models import User
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class PublicProfileConditionalGetTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(email='user@example.com', username='user', display_name='User')
+        self.url = reverse('users:public-profile', kwargs={'user_id': self.user.pk})
+
+    def test_matching_etag_returns_304(self):
+        etag = self.client.get(self.url)['ETag']
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_credit_balance_change_changes_etag(self):
+        etag = self.client.get(self.url)['ETag']
+
+        # A balance update that does not touch updated_at must still invalidate
+        User.objects.filter(pk=self.user.pk).update(credit_balance=3)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
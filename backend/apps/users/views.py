@@ -24,6 +24,7 @@ from apps.users.serializers import (
     PublicUserProfileSerializer
 )
 from core.responses import success_response, error_response, created_response
+from core.conditional import compute_etag, not_modified_response, set_conditional_headers
 from core.exceptions import InvalidTokenException
 
 
@@ -386,10 +387,23 @@ class PublicUserProfileView(APIView):
     permission_classes = [AllowAny]
     
     def get(self, request, user_id):
+        # Answer 304 from an indexed lookup before loading/serializing the user
+        row = User.objects.filter(id=user_id, is_deleted=False).values(
+            'updated_at', 'credit_balance'
+        ).first()
+        if row is not None:
+            etag = compute_etag(user_id, row['updated_at'], row['credit_balance'])
+            not_modified = not_modified_response(request, etag, row['updated_at'])
+            if not_modified is not None:
+                return not_modified
+        
         try:
             user = User.objects.get(id=user_id, is_deleted=False)
             serializer = PublicUserProfileSerializer(user)
-            return success_response(data=serializer.data)
+            response = success_response(data=serializer.data)
+            if row is not None:
+                set_conditional_headers(response, etag, row['updated_at'])
+            return response
         except User.DoesNotExist:
             return error_response(
                 error='user_not_found',
@@ -24,6 +24,26 @@ app.conf.beat_schedule = {
         'task': 'apps.users.tasks.anonymize_deleted_users',
         'schedule': crontab(hour=3, minute=0),  # Run daily at 3:00 AM
     },
+    'reconcile-contribution-counters-hourly': {
+        'task': 'apps.projects.tasks.reconcile_contribution_counters',
+        'schedule': crontab(minute=15),  # Run hourly at :15
+    },
+    'rebuild-related-projects-index-daily': {
+        'task': 'apps.projects.tasks.rebuild_related_projects_index',
+        'schedule': crontab(hour=4, minute=30),  # Run daily at 4:30 AM
+    },
+    'rebuild-skill-match-index-daily': {
+        'task': 'apps.projects.tasks.rebuild_skill_match_index',
+        'schedule': crontab(hour=4, minute=45),  # Run daily at 4:45 AM
+    },
+    'purge-pending-project-deletions-hourly': {
+        'task': 'apps.projects.tasks.purge_pending_project_deletions',
+        'schedule': crontab(minute=40),  # Run hourly at :40
+    },
+    'refresh-trending-projects-hourly': {
+        'task': 'apps.projects.tasks.refresh_trending_projects',
+        'schedule': crontab(minute=5),  # Run hourly at :05
+    },
 }
 
 # Celery configuration
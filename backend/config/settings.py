@@ -68,6 +68,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -113,6 +114,51 @@ else:
         }
     }
 
+# Read replicas (comma-separated URLs); safe-method requests read from them
+DATABASE_REPLICA_URLS = config('DATABASE_REPLICA_URLS', default='', cast=Csv())
+
+if DATABASE_URL and DATABASE_REPLICA_URLS:
+    for index, replica_url in enumerate(DATABASE_REPLICA_URLS, start=1):
+        DATABASES[f'replica_{index}'] = dj_database_url.parse(replica_url, conn_max_age=600)
+        DATABASES[f'replica_{index}']['TEST'] = {'MIRROR': 'default'}
+    DATABASE_ROUTERS = ['core.db_router.PrimaryReplicaRouter']
+
+# Connection pooling for PostgreSQL (primary and replicas):
+#   'none'      - persistent per-thread connections (conn_max_age above)
+#   'pool'      - in-process pool per worker (core.backends.pooled_postgresql)
+#   'pgbouncer' - an external transaction-mode pooler in front of the database
+DATABASE_POOL_MODE = config('DATABASE_POOL_MODE', default='none')
+DATABASE_POOL_SIZE = config('DATABASE_POOL_SIZE', default=10, cast=int)
+DATABASE_POOL_TIMEOUT = config('DATABASE_POOL_TIMEOUT', default=10, cast=float)
+DATABASE_POOL_MAX_LIFETIME = config('DATABASE_POOL_MAX_LIFETIME', default=1800, cast=int)
+# Idle pooled connections are closed after MAX_IDLE seconds, pinged before reuse after CHECK_AFTER
+DATABASE_POOL_MAX_IDLE = config('DATABASE_POOL_MAX_IDLE', default=600, cast=int)
+DATABASE_POOL_CHECK_AFTER = config('DATABASE_POOL_CHECK_AFTER', default=30, cast=int)
+
+if DATABASE_POOL_MODE not in ('none', 'pool', 'pgbouncer'):
+    raise ValueError(f"DATABASE_POOL_MODE must be 'none', 'pool' or 'pgbouncer', not {DATABASE_POOL_MODE!r}")
+
+if DATABASE_URL and DATABASE_POOL_MODE != 'none':
+    for database in DATABASES.values():
+        # The pooler owns connection reuse; Django releases after each request
+        database['CONN_MAX_AGE'] = 0
+        if DATABASE_POOL_MODE == 'pool':
+            database['ENGINE'] = 'core.backends.pooled_postgresql'
+            database['POOL'] = {
+                'MAX_SIZE': DATABASE_POOL_SIZE,
+                'TIMEOUT': DATABASE_POOL_TIMEOUT,
+                'MAX_LIFETIME': DATABASE_POOL_MAX_LIFETIME,
+                'MAX_IDLE': DATABASE_POOL_MAX_IDLE,
+                'CHECK_AFTER': DATABASE_POOL_CHECK_AFTER,
+            }
+        else:
+            # Named cursors do not survive transaction pooling
+            database['DISABLE_SERVER_SIDE_CURSORS'] = True
+
+# After a write, the client's reads stay on the primary for this long (replication lag)
+REPLICA_PIN_COOKIE = 'db_primary_pin'
+REPLICA_PIN_SECONDS = config('REPLICA_PIN_SECONDS', default=5, cast=int)
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.0/topics/i18n/
@@ -262,6 +308,26 @@ CACHES = {
     }
 }
 
+# Project list/search response cache (invalidated by the projects version counter)
+PROJECT_LIST_CACHE_ENABLED = config('PROJECT_LIST_CACHE_ENABLED', default=True, cast=bool)
+PROJECT_LIST_CACHE_TIMEOUT = config('PROJECT_LIST_CACHE_TIMEOUT', default=120, cast=int)
+
+# Accepted contributors embedded in project detail (the rest via /projects/<id>/contributors/)
+PROJECT_DETAIL_CONTRIBUTORS_LIMIT = config('PROJECT_DETAIL_CONTRIBUTORS_LIMIT', default=20, cast=int)
+
+# Neighbours stored per project in the related-projects index
+RELATED_PROJECTS_INDEX_SIZE = config('RELATED_PROJECTS_INDEX_SIZE', default=50, cast=int)
+
+# Trending projects (Redis sorted set): score decay half-life and event weights
+TRENDING_HALF_LIFE_HOURS = config('TRENDING_HALF_LIFE_HOURS', default=24, cast=float)
+TRENDING_SUBMISSION_WEIGHT = config('TRENDING_SUBMISSION_WEIGHT', default=3.0, cast=float)
+TRENDING_ACCEPT_WEIGHT = config('TRENDING_ACCEPT_WEIGHT', default=5.0, cast=float)
+TRENDING_VIEW_WEIGHT = config('TRENDING_VIEW_WEIGHT', default=1.0, cast=float)
+# A viewer's repeated detail views of a project count once per window (seconds)
+TRENDING_VIEW_DEDUPE_SECONDS = config('TRENDING_VIEW_DEDUPE_SECONDS', default=3600, cast=int)
+# Contributions older than this are ignored when the set is rebuilt from the database
+TRENDING_WINDOW_DAYS = config('TRENDING_WINDOW_DAYS', default=7, cast=int)
+
 # ==============================================================================
 # CHANNEL LAYERS (Redis)
 # ==============================================================================
@@ -377,3 +443,12 @@ LOGGING = {
 # ==============================================================================
 
 FRONTEND_URL = config('FRONTEND_URL', default='http://localhost:5173')
+
+# Rows fetched per server-side cursor round trip by the streaming exports
+EXPORT_CHUNK_SIZE = config('EXPORT_CHUNK_SIZE', default=2000, cast=int)
+
+# Maximum projects accepted by one POST /api/v1/projects/import/ request
+PROJECT_IMPORT_MAX_ROWS = config('PROJECT_IMPORT_MAX_ROWS', default=500, cast=int)
+
+# Rows removed per DELETE statement when purging a deleted project's children
+PROJECT_PURGE_BATCH_SIZE = config('PROJECT_PURGE_BATCH_SIZE', default=1000, cast=int)
@@ -0,0 +1,51 @@
+"""
+PostgreSQL backend that borrows connections from a per-process pool.
+
+Enabled with DATABASE_POOL_MODE=pool. Pool options come from the
+database's ``POOL`` settings key (``MAX_SIZE``, ``TIMEOUT``,
+``MAX_LIFETIME``, ``MAX_IDLE``, ``CHECK_AFTER``); CONN_MAX_AGE must be 0
+so Django releases the connection after every request and every
+``database_sync_to_async`` call.
+"""
+from django.db.backends.postgresql import base
+from django.db.backends.postgresql.psycopg_any import IsolationLevel
+from django.utils.asyncio import async_unsafe
+
+from core import db_pool
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+
+    def get_pool(self):
+        options = self.settings_dict.get('POOL') or {}
+        return db_pool.get_pool(
+            self.alias,
+            max_size=options.get('MAX_SIZE', db_pool.DEFAULT_POOL_SIZE),
+            timeout=options.get('TIMEOUT', db_pool.DEFAULT_POOL_TIMEOUT),
+            max_lifetime=options.get('MAX_LIFETIME', db_pool.DEFAULT_POOL_MAX_LIFETIME),
+            max_idle=options.get('MAX_IDLE', db_pool.DEFAULT_POOL_MAX_IDLE),
+            check_after=options.get('CHECK_AFTER', db_pool.DEFAULT_POOL_CHECK_AFTER),
+        )
+
+    @async_unsafe
+    def get_new_connection(self, conn_params):
+        try:
+            connection = self.get_pool().checkout(
+                lambda: super(DatabaseWrapper, self).get_new_connection(conn_params)
+            )
+        except db_pool.PoolTimeout as e:
+            raise self.Database.OperationalError(str(e)) from e
+
+        # A reused connection skipped the parent's setup of isolation_level
+        isolation_level = self.settings_dict['OPTIONS'].get('isolation_level')
+        self.isolation_level = (
+            IsolationLevel.READ_COMMITTED if isolation_level is None
+            else IsolationLevel(isolation_level)
+        )
+        return connection
+
+    def _close(self):
+        if self.connection is not None:
+            # Closed inside an atomic block the wrapper keeps its reference,
+            # so the connection must not be handed to anyone else
+            self.get_pool().checkin(self.connection, discard=self.in_atomic_block)
@@ -0,0 +1,51 @@
+"""
+Conditional GET helpers (ETag / Last-Modified).
+
+Detail views compute validators from a cheap indexed lookup and answer
+304 Not Modified before doing any serializer work.
+"""
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+def compute_etag(*parts):
+    """Weak ETag from the representation's version parts."""
+    digest = hashlib.sha1('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+    return f'W/"{digest}"'
+
+
+def latest(*timestamps):
+    """Most recent of the given datetimes, ignoring None."""
+    values = [value for value in timestamps if value is not None]
+    return max(values) if values else None
+
+
+def not_modified_response(request, etag, last_modified):
+    """
+    Return a 304 response if the client's cached copy is current, else None.
+    
+    Args:
+        request: Incoming request
+        etag: ETag of the current representation
+        last_modified: datetime of the last change (or None)
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return None
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+    if response is not None:
+        set_conditional_headers(response, etag, last_modified)
+    return response
+
+
+def set_conditional_headers(response, etag, last_modified):
+    """Attach ETag / Last-Modified to a response."""
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    return response
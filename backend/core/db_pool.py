@@ -0,0 +1,295 @@
+"""
+In-process PostgreSQL connection pool.
+
+Used by the ``core.backends.pooled_postgresql`` database backend. Django
+"closes" its connection at the end of every request and around every
+``database_sync_to_async`` call (CONN_MAX_AGE=0); the backend hands the
+connection back here instead of tearing it down, so daphne's executor
+threads share a bounded set of server connections rather than each
+holding (or repeatedly opening) their own.
+
+Pools are per process and per database alias. A pool inherited across a
+fork (Celery prefork, gunicorn preload) is discarded and rebuilt in the
+child so sockets are never shared between processes.
+
+Idle connections are checked before reuse: one idle longer than
+``max_idle`` is closed (the server or a firewall may already have dropped
+it), and one idle longer than ``check_after`` is pinged with ``SELECT 1``.
+A connection that fails the ping is discarded and the checkout moves on
+to the next idle connection or opens a new one.
+"""
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+import psycopg2.extensions
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_POOL_TIMEOUT = 10
+DEFAULT_POOL_MAX_LIFETIME = 1800
+DEFAULT_POOL_MAX_IDLE = 600
+DEFAULT_POOL_CHECK_AFTER = 30
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class PoolTimeout(Exception):
+    """No connection became available within the checkout timeout."""
+
+
+class ConnectionPool:
+    """
+    Bounded LIFO pool of open DB-API connections.
+
+    Callers pass ``checkout()`` a function that opens a new, fully
+    initialised connection for when the pool must grow. At most
+    ``max_size`` connections are open at once; a checkout beyond that
+    waits up to ``timeout`` seconds for one to be returned. Connections
+    older than ``max_lifetime`` seconds are closed when returned, ones idle
+    longer than ``max_idle`` seconds are closed instead of reused, and ones
+    idle longer than ``check_after`` seconds are pinged before reuse.
+    """
+
+    def __init__(self, alias, max_size=DEFAULT_POOL_SIZE,
+                 timeout=DEFAULT_POOL_TIMEOUT, max_lifetime=DEFAULT_POOL_MAX_LIFETIME,
+                 max_idle=DEFAULT_POOL_MAX_IDLE, check_after=DEFAULT_POOL_CHECK_AFTER):
+        self.alias = alias
+        self.pid = os.getpid()
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.max_idle = max_idle
+        self.check_after = check_after
+        # (connection, returned_at) pairs, most recently returned last
+        self._idle = deque()
+        self._opened_at = {}
+        self._opening = 0
+        self._condition = threading.Condition()
+        self._counters = {
+            'checkouts': 0,
+            'waits': 0,
+            'timeouts': 0,
+            'connections_opened': 0,
+            'connections_closed': 0,
+            'idle_evictions': 0,
+            'failed_checks': 0,
+        }
+        self._wait_seconds = 0.0
+        self._max_in_use = 0
+
+    @property
+    def size(self):
+        return len(self._opened_at) + self._opening
+
+    def checkout(self, connect):
+        """
+        Return a live idle connection, opening one if under max_size.
+
+        Idle connections that fail the liveness check are discarded and the
+        checkout retries with the next one (or a new connection).
+        """
+        started = time.monotonic()
+        deadline = started + self.timeout
+        waited = False
+        while True:
+            conn, idle_for, expired, waited_now = self._acquire(deadline)
+            waited = waited or waited_now
+            for stale in expired:
+                self._close(stale)
+            if conn is None:
+                break
+            if idle_for <= self.check_after or self._is_alive(conn):
+                with self._condition:
+                    self._checked_out(started, waited)
+                return conn
+            with self._condition:
+                self._counters['failed_checks'] += 1
+                self._forget(conn)
+                self._condition.notify()
+            self._close(conn)
+
+        try:
+            conn = connect()
+        except Exception:
+            with self._condition:
+                self._opening -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._opening -= 1
+            self._opened_at[conn] = time.monotonic()
+            self._counters['connections_opened'] += 1
+            self._checked_out(started, waited)
+        return conn
+
+    def _acquire(self, deadline):
+        """
+        Take an idle connection or reserve a slot for a new one.
+
+        Returns:
+            tuple: (connection or None, seconds it was idle, expired
+            connections to close, whether it had to wait). A None
+            connection means a slot was reserved for the caller to open.
+        """
+        expired = []
+        waited = False
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                # The oldest idle connections sit at the left end
+                while self._idle and now - self._idle[0][1] > self.max_idle:
+                    conn, _ = self._idle.popleft()
+                    self._forget(conn)
+                    self._counters['idle_evictions'] += 1
+                    expired.append(conn)
+
+                while self._idle:
+                    conn, returned_at = self._idle.pop()
+                    if conn.closed:
+                        self._forget(conn)
+                        continue
+                    return conn, now - returned_at, expired, waited
+
+                if self.size < self.max_size:
+                    # Reserve the slot now, open the connection outside the lock
+                    self._opening += 1
+                    return None, 0, expired, waited
+
+                remaining = deadline - now
+                if remaining <= 0:
+                    self._counters['timeouts'] += 1
+                    raise PoolTimeout(
+                        f"No connection available in pool '{self.alias}' "
+                        f"after {self.timeout}s ({self.max_size} in use)"
+                    )
+                waited = True
+                self._condition.wait(remaining)
+
+    def checkin(self, conn, discard=False):
+        """Return a connection; it is closed instead if broken, dirty or too old."""
+        reusable = not discard and self._reset(conn)
+        with self._condition:
+            opened_at = self._opened_at.get(conn)
+            if opened_at is None:
+                # Not ours (pool rebuilt after a fork or a reconfiguration)
+                reusable = False
+            elif time.monotonic() - opened_at > self.max_lifetime:
+                reusable = False
+
+            if reusable:
+                self._idle.append((conn, time.monotonic()))
+            else:
+                self._forget(conn)
+            self._condition.notify()
+
+        if not reusable:
+            self._close(conn)
+
+    def close_idle(self):
+        """Close every idle connection (checked-out ones close on return)."""
+        with self._condition:
+            idle = [conn for conn, _ in self._idle]
+            self._idle.clear()
+            for conn in idle:
+                self._forget(conn)
+            self._condition.notify_all()
+        for conn in idle:
+            self._close(conn)
+
+    def stats(self):
+        with self._condition:
+            idle = len(self._idle)
+            checkouts = self._counters['checkouts']
+            return {
+                'alias': self.alias,
+                'pid': self.pid,
+                'max_size': self.max_size,
+                'size': self.size,
+                'idle': idle,
+                'in_use': self.size - idle,
+                'max_in_use': self._max_in_use,
+                **self._counters,
+                'avg_wait_ms': round(self._wait_seconds * 1000 / checkouts, 3) if checkouts else 0.0,
+            }
+
+    def _checked_out(self, started, waited):
+        self._counters['checkouts'] += 1
+        if waited:
+            self._counters['waits'] += 1
+        self._wait_seconds += time.monotonic() - started
+        self._max_in_use = max(self._max_in_use, self.size - len(self._idle))
+
+    def _forget(self, conn):
+        if self._opened_at.pop(conn, None) is not None:
+            self._counters['connections_closed'] += 1
+
+    @staticmethod
+    def _is_alive(conn):
+        """Round-trip a trivial query; False if the connection is dead."""
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            # Leave the connection idle, as checkin did
+            conn.rollback()
+            return True
+        except Exception as e:
+            logger.info(f"Discarding pooled connection that failed a liveness check: {e}")
+            return False
+
+    @staticmethod
+    def _reset(conn):
+        """Roll back any open transaction; False if the connection is unusable."""
+        if conn.closed:
+            return False
+        try:
+            status = conn.info.transaction_status
+            if status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+                return False
+            if status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+            return True
+        except Exception as e:
+            logger.warning(f"Discarding pooled connection that failed to reset: {e}")
+            return False
+
+    @staticmethod
+    def _close(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+def get_pool(alias, **options):
+    """The current process's pool for a database alias, created on first use."""
+    pool = _pools.get(alias)
+    if pool is not None and pool.pid == os.getpid():
+        return pool
+    with _pools_lock:
+        pool = _pools.get(alias)
+        if pool is None or pool.pid != os.getpid():
+            pool = ConnectionPool(alias, **options)
+            _pools[alias] = pool
+    return pool
+
+
+def get_pool_stats():
+    """Metrics for every pool opened by this process, keyed by alias."""
+    return {
+        alias: pool.stats()
+        for alias, pool in list(_pools.items())
+        if pool.pid == os.getpid()
+    }
+
+
+def close_pools():
+    """Close idle connections in every pool of this process."""
+    for pool in list(_pools.values()):
+        if pool.pid == os.getpid():
+            pool.close_idle()
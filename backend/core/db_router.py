@@ -0,0 +1,76 @@
+"""
+Primary/replica database routing.
+
+Reads go to a replica only while ReplicaRoutingMiddleware has marked the
+current request as replica-safe (GET/HEAD/OPTIONS without a recent write
+from the same client). Any write pins the rest of the request to the
+primary so reads-after-write see their own changes. Everything outside a
+request (Celery tasks, management commands, websocket consumers) uses the
+primary.
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+
+PRIMARY_DB = 'default'
+
+_replicas_allowed = ContextVar('replicas_allowed', default=False)
+_pinned_to_primary = ContextVar('pinned_to_primary', default=False)
+
+
+def get_replica_aliases():
+    """Configured replica database aliases."""
+    return [alias for alias in settings.DATABASES if alias != PRIMARY_DB]
+
+
+def allow_replica_reads():
+    """Let reads in the current context use replicas; returns reset tokens."""
+    return _replicas_allowed.set(True), _pinned_to_primary.set(False)
+
+
+def reset_replica_reads(tokens):
+    allowed_token, pinned_token = tokens
+    _replicas_allowed.reset(allowed_token)
+    _pinned_to_primary.reset(pinned_token)
+
+
+def pin_to_primary():
+    """Send all further reads in the current context to the primary."""
+    _pinned_to_primary.set(True)
+
+
+def is_pinned_to_primary():
+    return _pinned_to_primary.get()
+
+
+@contextmanager
+def use_primary():
+    """Force reads inside the block to the primary (e.g. right after a write elsewhere)."""
+    token = _pinned_to_primary.set(True)
+    try:
+        yield
+    finally:
+        _pinned_to_primary.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """Route reads to a random replica when allowed, everything else to the primary."""
+    
+    def db_for_read(self, model, **hints):
+        if not _replicas_allowed.get() or _pinned_to_primary.get():
+            return PRIMARY_DB
+        replicas = get_replica_aliases()
+        return random.choice(replicas) if replicas else PRIMARY_DB
+    
+    def db_for_write(self, model, **hints):
+        pin_to_primary()
+        return PRIMARY_DB
+    
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas mirror the primary, so objects from any alias may be related
+        return True
+    
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == PRIMARY_DB
@@ -0,0 +1,182 @@
+"""
+Sparse fieldsets (?fields= / ?omit=) for list endpoints.
+
+SparseFieldsetsMixin drops unrequested fields from a serializer.
+SparseQuerysetMixin prunes the list view's queryset to match: .only() on
+the columns the remaining fields read, and select_related/prefetch_related
+only for the relations they traverse.
+
+Example: GET /api/v1/projects/?fields=id,title,status,tags
+"""
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework.serializers import BaseSerializer
+
+FIELDS_PARAM = 'fields'
+OMIT_PARAM = 'omit'
+SAFE_METHODS = ('GET', 'HEAD')
+
+
+def parse_field_list(value):
+    """Split a comma-separated field list."""
+    return {name.strip() for name in (value or '').split(',') if name.strip()}
+
+
+def get_requested_fields(request, available):
+    """
+    Serializer field names to render for this request, or None for all.
+    
+    Unknown names are ignored and 'id' is always kept.
+    """
+    if request is None or request.method not in SAFE_METHODS:
+        return None
+    
+    fields = parse_field_list(request.query_params.get(FIELDS_PARAM))
+    omit = parse_field_list(request.query_params.get(OMIT_PARAM))
+    if not fields and not omit:
+        return None
+    
+    return [
+        name for name in available
+        if name == 'id' or ((not fields or name in fields) and name not in omit)
+    ]
+
+
+class SparseFieldsetsMixin:
+    """
+    Serializer mixin honouring ?fields= and ?omit= on the request in context.
+    
+    sparse_field_requirements maps field names whose model access cannot be
+    inferred from their source (method fields, properties) to the model
+    fields/relations they read, e.g. {'tags': ['tag_maps']}.
+    """
+    sparse_field_requirements = {}
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        selected = get_requested_fields(self.context.get('request'), list(self.fields))
+        if selected is not None:
+            for name in set(self.fields) - set(selected):
+                self.fields.pop(name)
+    
+    @classmethod
+    def get_sparse_requirements(cls, field_names):
+        """
+        Model columns and relations read by the given serializer fields.
+        
+        Returns:
+            tuple: (columns, relations), or None if some field's needs are unknown
+        """
+        model = cls.Meta.model
+        fields = cls().fields
+        columns, relations = set(), set()
+        
+        for name in field_names:
+            if name in cls.sparse_field_requirements:
+                for requirement in cls.sparse_field_requirements[name]:
+                    if not _add_requirement(model, requirement, columns, relations, traverse=True):
+                        return None
+                continue
+            
+            field = fields[name]
+            if not field.source_attrs:
+                return None
+            traverse = len(field.source_attrs) > 1 or isinstance(field, BaseSerializer)
+            if not _add_requirement(model, field.source_attrs[0], columns, relations, traverse):
+                return None
+        
+        return columns, relations
+    
+    @classmethod
+    def prune_queryset(cls, queryset, request, always_load=()):
+        """Restrict queryset loading to what the requested fields need."""
+        selected = get_requested_fields(request, list(cls().fields))
+        if selected is None:
+            return queryset
+        
+        requirements = cls.get_sparse_requirements(selected)
+        if requirements is None:
+            return queryset
+        columns, relations = requirements
+        
+        meta = queryset.model._meta
+        columns.add(meta.pk.name)
+        # Ordering columns must stay loaded (SELECT DISTINCT needs them, cursors read them)
+        ordering = list(queryset.query.order_by) or list(meta.ordering)
+        for name in [*ordering, *always_load]:
+            if isinstance(name, str) and _is_column(meta, name.lstrip('-')):
+                columns.add(name.lstrip('-'))
+        
+        select_related = queryset.query.select_related
+        if isinstance(select_related, dict):
+            paths = [path for path in flatten_select_related(select_related) if path.split('__')[0] in relations]
+            queryset = queryset.select_related(None)
+            if paths:
+                queryset = queryset.select_related(*paths)
+        
+        lookups = [
+            lookup for lookup in queryset._prefetch_related_lookups
+            if _lookup_path(lookup).split('__')[0] in relations
+        ]
+        queryset = queryset.prefetch_related(None)
+        if lookups:
+            queryset = queryset.prefetch_related(*lookups)
+        
+        return queryset.only(*columns)
+
+
+class SparseQuerysetMixin:
+    """
+    List view mixin pruning the queryset to the fields requested with ?fields= / ?omit=.
+    
+    Runs after filtering and ordering so ordering columns stay loaded.
+    """
+    # Loaded even when not requested (keyset pagination cursors read created_at)
+    sparse_always_load = ('created_at',)
+    
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        serializer_class = self.get_serializer_class()
+        if self.request.method not in SAFE_METHODS or not issubclass(serializer_class, SparseFieldsetsMixin):
+            return queryset
+        return serializer_class.prune_queryset(queryset, self.request, self.sparse_always_load)
+
+
+def _add_requirement(model, name, columns, relations, traverse):
+    """Classify a model attribute as a column and/or relation; False if unknown."""
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    
+    if not field.is_relation:
+        columns.add(name)
+    elif field.concrete:
+        # Forward FK: the column is enough for PK-only fields; traversal needs the join
+        columns.add(name)
+        if traverse:
+            relations.add(name)
+    else:
+        relations.add(name)
+    return True
+
+
+def _is_column(meta, name):
+    try:
+        return meta.get_field(name).concrete
+    except FieldDoesNotExist:
+        return False
+
+
+def flatten_select_related(tree, prefix=''):
+    """Turn Query.select_related's nested dict into lookup paths."""
+    paths = []
+    for name, children in tree.items():
+        path = f'{prefix}{name}'
+        nested = flatten_select_related(children, f'{path}__')
+        paths.extend(nested or [path])
+    return paths
+
+
+def _lookup_path(lookup):
+    return lookup.prefetch_through if isinstance(lookup, Prefetch) else lookup
@@ -0,0 +1,105 @@
+"""
+Request middleware for database routing.
+"""
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+from core.db_router import allow_replica_reads, get_replica_aliases, is_pinned_to_primary, reset_replica_reads
+
+logger = logging.getLogger(__name__)
+
+REPLICA_SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+PIN_KEY = 'db:primary_pin:{}'
+
+
+def get_pin_identity(request):
+    """
+    Stable identity for read-your-writes pinning, or None for anonymous clients.
+
+    JWT clients are identified by the token's user ID (signature checked, no
+    database lookup), session clients by their user ID.
+    """
+    authentication = JWTAuthentication()
+    header = authentication.get_header(request)
+    raw_token = authentication.get_raw_token(header) if header else None
+    if raw_token is not None:
+        try:
+            token = authentication.get_validated_token(raw_token)
+            return f"user:{token[settings.SIMPLE_JWT['USER_ID_CLAIM']]}"
+        except (InvalidToken, TokenError, KeyError):
+            return None
+
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return f'user:{user.pk}'
+    return None
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Allow replica reads for safe-method requests.
+    
+    After a request that wrote to the primary, the client's next requests
+    stay on the primary for REPLICA_PIN_SECONDS, so it reads its own writes
+    despite replication lag. Authenticated clients are pinned by user ID in
+    the cache (cross-origin JWT clients never send cookies back); a
+    short-lived cookie covers anonymous and same-site clients.
+    """
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+    
+    def __call__(self, request):
+        if not get_replica_aliases():
+            return self.get_response(request)
+        
+        identity = get_pin_identity(request)
+        use_replicas = (
+            request.method in REPLICA_SAFE_METHODS and
+            settings.REPLICA_PIN_COOKIE not in request.COOKIES and
+            not self.is_pinned(identity)
+        )
+        if not use_replicas:
+            response = self.get_response(request)
+            if request.method not in REPLICA_SAFE_METHODS:
+                self.pin(response, identity)
+            return response
+        
+        tokens = allow_replica_reads()
+        try:
+            response = self.get_response(request)
+            if is_pinned_to_primary():
+                # A safe-method request that wrote also pins the client
+                self.pin(response, identity)
+            return response
+        finally:
+            reset_replica_reads(tokens)
+    
+    def is_pinned(self, identity):
+        """Whether the identity wrote recently (primary on cache errors)."""
+        if identity is None:
+            return False
+        try:
+            return cache.get(PIN_KEY.format(identity)) is not None
+        except Exception as e:
+            logger.warning(f"Replica pin lookup failed, reading from primary: {e}")
+            return True
+    
+    def pin(self, response, identity):
+        """Keep the client on the primary for REPLICA_PIN_SECONDS."""
+        if identity is not None:
+            try:
+                cache.set(PIN_KEY.format(identity), 1, timeout=settings.REPLICA_PIN_SECONDS)
+            except Exception as e:
+                logger.warning(f"Could not pin {identity} to the primary: {e}")
+        response.set_cookie(
+            settings.REPLICA_PIN_COOKIE,
+            '1',
+            max_age=settings.REPLICA_PIN_SECONDS,
+            httponly=True,
+            samesite='Lax',
+        )
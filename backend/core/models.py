@@ -0,0 +1,73 @@
+"""
+Shared model mixins.
+"""
+import copy
+
+
+class DirtyFieldsMixin:
+    """
+    Track the field values loaded from the database so saves only write changes.
+
+    A full save() of a loaded instance is turned into
+    save(update_fields=<changed fields + auto_now fields>), so unchanged
+    columns (and the indexes and triggers on them) are left alone. Fields in
+    save_excluded_fields are maintained in the database and never written by
+    a full save. Instances without a snapshot (e.g. built by bulk_create)
+    fall back to writing every other field.
+    """
+    save_excluded_fields = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_fields()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        self._snapshot_fields(None if fields is None else set(fields))
+
+    def get_dirty_fields(self):
+        """Names of loaded fields whose value changed since they were loaded or saved."""
+        loaded = self.__dict__.get('_loaded_values', {})
+        deferred = self.get_deferred_fields()
+        return [
+            field.name for field in self._meta.concrete_fields
+            if not field.primary_key and field.attname not in deferred and (
+                field.attname not in loaded or getattr(self, field.attname) != loaded[field.attname]
+            )
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = self._get_save_fields()
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        self._snapshot_fields(None if update_fields is None else set(update_fields))
+
+    def _get_save_fields(self):
+        if '_loaded_values' in self.__dict__:
+            fields = self.get_dirty_fields() + [
+                field.name for field in self._meta.concrete_fields
+                if getattr(field, 'auto_now', False)
+            ]
+        else:
+            fields = [field.name for field in self._meta.concrete_fields if not field.primary_key]
+        return [name for name in dict.fromkeys(fields) if name not in self.save_excluded_fields]
+
+    def _snapshot_fields(self, fields=None):
+        """Record the current value of the given (default: every loaded) field."""
+        if fields is None:
+            self._loaded_values = {}
+        elif '_loaded_values' not in self.__dict__:
+            # Never loaded as a whole: keep the write-everything fallback
+            return
+        deferred = self.get_deferred_fields()
+        for field in self._meta.concrete_fields:
+            if field.attname in deferred:
+                continue
+            if fields is not None and field.name not in fields and field.attname not in fields:
+                continue
+            value = getattr(self, field.attname)
+            # JSON values are mutable; copy them so in-place edits count as changes
+            self._loaded_values[field.attname] = copy.deepcopy(value) if isinstance(value, (dict, list)) else value
@@ -1,8 +1,186 @@
 """
 Custom pagination classes for DRF.
 """
-from rest_framework.pagination import PageNumberPagination
+import base64
+import json
+import uuid
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class ApproximatePage(Page):
+    """Page whose has_next() comes from an over-fetched row, not from the count."""
+
+    def __init__(self, object_list, number, paginator, has_more):
+        super().__init__(object_list, number, paginator)
+        self._has_more = has_more
+
+    def has_next(self):
+        return self._has_more
+
+
+class ApproximateCountPaginator(Paginator):
+    """
+    Django paginator that avoids exact COUNT(*) on large result sets.
+    
+    The count query reads at most count_cap + 1 rows (COUNT over a LIMIT
+    subquery); beyond that the count is reported as count_cap ("more than
+    N"). A planner estimate from pg_class.reltuples is not used: the lists
+    are always filtered (visible projects, status, search), so the table's
+    row count would not describe the result.
+    
+    count_is_approximate is set once the count has been evaluated. Approximate
+    pages over-fetch one row to decide has_next() and may go past num_pages.
+    """
+    count_cap = 10000
+
+    count_is_approximate = False
+
+    @cached_property
+    def count(self):
+        if not isinstance(self.object_list, QuerySet):
+            return len(self.object_list)
+
+        capped = self.object_list[:self.count_cap + 1].count()
+        if capped > self.count_cap:
+            self.count_is_approximate = True
+            return self.count_cap
+        return capped
+
+    def validate_number(self, number):
+        if not self.count_is_approximate:
+            return super().validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger('That page number is not an integer')
+        if number < 1:
+            raise EmptyPage('That page number is less than 1')
+        return number
+
+    def page(self, number):
+        # Evaluate the count first so validate_number knows which mode applies
+        self.count
+        if not self.count_is_approximate:
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        object_list = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not object_list and number > 1:
+            raise EmptyPage('That page contains no results')
+        has_more = len(object_list) > self.per_page
+        return ApproximatePage(object_list[:self.per_page], number, self, has_more)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination on (created_at, id), newest first.
+
+    Each page is a range query on created_at, so it is served by the
+    created_at indexes without COUNT(*) or OFFSET scans. The response keeps
+    the standard envelope; count, total_pages and current_page are null.
+    """
+    cursor_query_param = 'cursor'
+    page_size = 30
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        created_at, pk, reverse = self.decode_cursor(request)
+
+        if reverse:
+            queryset = queryset.order_by('created_at', 'id')
+        else:
+            queryset = queryset.order_by('-created_at', '-id')
+
+        if created_at is not None:
+            # The redundant created_at bound gives the planner a single range
+            # on the (created_at, id) index; the OR alone is not sargable
+            if reverse:
+                position = Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+                queryset = queryset.filter(position, created_at__gte=created_at)
+            else:
+                position = Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+                queryset = queryset.filter(position, created_at__lte=created_at)
+
+        # Fetch one extra row to know whether another page follows
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+
+        self.page = results
+        self.has_next = has_more if not reverse else created_at is not None
+        self.has_previous = has_more if reverse else created_at is not None
+        return results
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+            if page_size > 0:
+                return min(page_size, self.max_page_size)
+        except (KeyError, ValueError):
+            pass
+        return self.page_size
+
+    def decode_cursor(self, request):
+        """Return (created_at, id, reverse) from the cursor parameter."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, None, False
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            created_at = parse_datetime(payload['t'])
+            if created_at is None:
+                raise ValueError
+            return created_at, uuid.UUID(payload['id']), bool(payload.get('r', False))
+        except (TypeError, ValueError, KeyError, AttributeError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, obj, reverse=False):
+        payload = {'t': obj.created_at.isoformat(), 'id': str(obj.pk)}
+        if reverse:
+            payload['r'] = True
+        encoded = base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii')
+        url = remove_query_param(self.request.build_absolute_uri(), 'page')
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1])
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        """Standardize paginated response envelope."""
+        return Response({
+            'success': True,
+            'status_code': 200,
+            'message': 'Data retrieved successfully',
+            'count': None,
+            'count_is_approximate': False,
+            'total_pages': None,
+            'current_page': None,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'data': data
+        })
 
 
 class CustomPageNumberPagination(PageNumberPagination):
@@ -11,18 +189,42 @@ class CustomPageNumberPagination(PageNumberPagination):
     
     Default: 30 items per page
     Max: 100 items per page
+    
+    Counts come from ApproximateCountPaginator: exact for small result sets,
+    capped otherwise (flagged by count_is_approximate).
+    
+    Pass ?pagination=cursor to switch to keyset pagination on (created_at, id).
     """
+    django_paginator_class = ApproximateCountPaginator
     page_size = 30
     page_size_query_param = 'page_size'
     max_page_size = 100
+    pagination_query_param = 'pagination'
+    keyset_pagination_class = KeysetPagination
+
+    keyset = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if request.query_params.get(self.pagination_query_param) == 'cursor':
+            self.keyset = self.keyset_pagination_class()
+            self.keyset.page_size = self.page_size
+            self.keyset.max_page_size = self.max_page_size
+            return self.keyset.paginate_queryset(queryset, request, view)
+
+        self.keyset = None
+        return super().paginate_queryset(queryset, request, view)
 
     def get_paginated_response(self, data):
         """Standardize paginated response envelope."""
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+
         return Response({
             'success': True,
             'status_code': 200,
             'message': 'Data retrieved successfully',
             'count': self.page.paginator.count,
+            'count_is_approximate': getattr(self.page.paginator, 'count_is_approximate', False),
             'total_pages': self.page.paginator.num_pages,
             'current_page': self.page.number,
             'next': self.get_next_link(),
@@ -0,0 +1,206 @@
+"""
+Tests for the in-process connection pool, using fake DB-API connections.
+"""
+import threading
+import time
+from unittest import TestCase
+
+import psycopg2.extensions
+
+from core.db_pool import ConnectionPool, PoolTimeout
+
+
+class FakeCursor:
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, sql):
+        self.connection.queries.append(sql)
+        if not self.connection.alive:
+            raise psycopg2.OperationalError('server closed the connection unexpectedly')
+
+
+class FakeInfo:
+    transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+
+class FakeConnection:
+
+    def __init__(self):
+        self.closed = 0
+        self.alive = True
+        self.queries = []
+        self.rollbacks = 0
+        self.info = FakeInfo()
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+
+def age_idle(pool, seconds):
+    """Pretend every idle connection was returned seconds ago."""
+    pool._idle = type(pool._idle)((conn, returned_at - seconds) for conn, returned_at in pool._idle)
+
+
+class ConnectionPoolTests(TestCase):
+
+    def make_pool(self, **options):
+        options.setdefault('max_size', 2)
+        options.setdefault('timeout', 0.2)
+        return ConnectionPool('test', **options)
+
+    def test_checkin_makes_connection_reusable(self):
+        pool = self.make_pool()
+        conn = pool.checkout(FakeConnection)
+        pool.checkin(conn)
+
+        self.assertIs(pool.checkout(FakeConnection), conn)
+        self.assertEqual(pool.stats()['connections_opened'], 1)
+
+    def test_reuse_is_lifo(self):
+        pool = self.make_pool()
+        first, second = pool.checkout(FakeConnection), pool.checkout(FakeConnection)
+        pool.checkin(first)
+        pool.checkin(second)
+
+        self.assertIs(pool.checkout(FakeConnection), second)
+
+    def test_checkin_rolls_back_open_transaction(self):
+        pool = self.make_pool()
+        conn = pool.checkout(FakeConnection)
+        conn.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_INTRANS
+
+        pool.checkin(conn)
+
+        self.assertEqual(conn.rollbacks, 1)
+        self.assertIs(pool.checkout(FakeConnection), conn)
+
+    def test_discarded_and_broken_connections_are_closed(self):
+        pool = self.make_pool()
+        discarded, broken = pool.checkout(FakeConnection), pool.checkout(FakeConnection)
+        broken.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN
+
+        pool.checkin(discarded, discard=True)
+        pool.checkin(broken)
+
+        self.assertTrue(discarded.closed and broken.closed)
+        self.assertEqual(pool.stats()['size'], 0)
+
+    def test_connections_past_max_lifetime_are_closed_on_checkin(self):
+        pool = self.make_pool(max_lifetime=0)
+        conn = pool.checkout(FakeConnection)
+        time.sleep(0.01)
+
+        pool.checkin(conn)
+
+        self.assertTrue(conn.closed)
+        self.assertIsNot(pool.checkout(FakeConnection), conn)
+
+    def test_checkout_times_out_when_exhausted(self):
+        pool = self.make_pool()
+        pool.checkout(FakeConnection)
+        pool.checkout(FakeConnection)
+
+        with self.assertRaises(PoolTimeout):
+            pool.checkout(FakeConnection)
+        self.assertEqual(pool.stats()['timeouts'], 1)
+
+    def test_waiting_checkout_gets_returned_connection(self):
+        pool = self.make_pool(max_size=1, timeout=2)
+        conn = pool.checkout(FakeConnection)
+        timer = threading.Timer(0.05, pool.checkin, args=[conn])
+        timer.start()
+
+        self.assertIs(pool.checkout(FakeConnection), conn)
+        timer.join()
+        self.assertEqual(pool.stats()['waits'], 1)
+
+    def test_failed_connect_releases_its_slot(self):
+        pool = self.make_pool(max_size=1)
+
+        def refuse():
+            raise psycopg2.OperationalError('connection refused')
+
+        with self.assertRaises(psycopg2.OperationalError):
+            pool.checkout(refuse)
+        self.assertIsInstance(pool.checkout(FakeConnection), FakeConnection)
+
+    def test_recently_returned_connection_is_not_pinged(self):
+        pool = self.make_pool(check_after=30)
+        conn = pool.checkout(FakeConnection)
+        pool.checkin(conn)
+
+        pool.checkout(FakeConnection)
+
+        self.assertEqual(conn.queries, [])
+
+    def test_idle_connection_is_pinged_before_reuse(self):
+        pool = self.make_pool(check_after=30)
+        conn = pool.checkout(FakeConnection)
+        pool.checkin(conn)
+        age_idle(pool, 60)
+
+        self.assertIs(pool.checkout(FakeConnection), conn)
+        self.assertEqual(conn.queries, ['SELECT 1'])
+
+    def test_dead_idle_connection_is_replaced(self):
+        pool = self.make_pool(check_after=30)
+        dead, live = pool.checkout(FakeConnection), pool.checkout(FakeConnection)
+        pool.checkin(live)
+        pool.checkin(dead)
+        age_idle(pool, 60)
+        dead.alive = False
+
+        self.assertIs(pool.checkout(FakeConnection), live)
+        self.assertTrue(dead.closed)
+        self.assertEqual(pool.stats()['failed_checks'], 1)
+
+    def test_dead_connection_retries_with_new_connection(self):
+        pool = self.make_pool(max_size=1, check_after=30)
+        dead = pool.checkout(FakeConnection)
+        pool.checkin(dead)
+        age_idle(pool, 60)
+        dead.alive = False
+
+        conn = pool.checkout(FakeConnection)
+
+        self.assertIsNot(conn, dead)
+        self.assertEqual(pool.stats()['connections_opened'], 2)
+
+    def test_connections_idle_past_max_idle_are_evicted(self):
+        pool = self.make_pool(max_idle=300)
+        conn = pool.checkout(FakeConnection)
+        pool.checkin(conn)
+        age_idle(pool, 600)
+
+        replacement = pool.checkout(FakeConnection)
+
+        self.assertIsNot(replacement, conn)
+        self.assertTrue(conn.closed)
+        self.assertEqual(conn.queries, [])
+        self.assertEqual(pool.stats()['idle_evictions'], 1)
+
+    def test_close_idle_closes_only_idle_connections(self):
+        pool = self.make_pool()
+        idle, in_use = pool.checkout(FakeConnection), pool.checkout(FakeConnection)
+        pool.checkin(idle)
+
+        pool.close_idle()
+
+        self.assertTrue(idle.closed)
+        self.assertFalse(in_use.closed)
+        self.assertEqual(pool.stats()['in_use'], 1)
@@ -0,0 +1,52 @@
+"""
+Tests for chunked export reads.
+"""
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.projects.export import export_rows_queryset
+from apps.projects.models import Project
+from apps.users.models import User
+from core.export import iter_chunks
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class IterChunksTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        host = User.objects.create(email='host@example.com', username='host', display_name='Host')
+        created_at = timezone.now()
+        # Identical timestamps force the keyset batches to break ties on id
+        Project.objects.bulk_create([
+            Project(
+                host_user=host,
+                title=f'Project {index}',
+                description='d' * 30,
+                what_it_does='Tests exports',
+                desired_outputs='o' * 30,
+                created_at=created_at,
+            )
+            for index in range(7)
+        ])
+
+    def chunk_ids(self):
+        return [[row['id'] for row in chunk] for chunk in iter_chunks(export_rows_queryset(Project.objects.all()), 3)]
+
+    def test_cursor_chunks_have_fixed_size(self):
+        self.assertEqual([len(chunk) for chunk in self.chunk_ids()], [3, 3, 1])
+
+    def test_keyset_chunks_match_cursor_chunks(self):
+        expected = self.chunk_ids()
+
+        with mock.patch.dict(connection.settings_dict, {'DISABLE_SERVER_SIDE_CURSORS': True}):
+            # One LIMIT query per chunk
+            with self.assertNumQueries(3):
+                chunks = self.chunk_ids()
+
+        self.assertEqual(chunks, expected)
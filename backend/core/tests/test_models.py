@@ -0,0 +1,130 @@
+"""
+Tests for DirtyFieldsMixin: full saves write only the changed columns.
+"""
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from apps.projects.models import Project
+from apps.users.models import User
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class DirtyFieldsMixinTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.host = User.objects.create(email='host@example.com', username='host', display_name='Host')
+        cls.project_id = Project.objects.create(
+            host_user=cls.host,
+            title='Dirty fields project',
+            description='d' * 30,
+            what_it_does='Tests dirty fields',
+            desired_outputs='o' * 30,
+        ).pk
+
+    def update_sql(self, instance, **kwargs):
+        """SQL of the UPDATE statements issued by instance.save()."""
+        with CaptureQueriesContext(connection) as queries:
+            instance.save(**kwargs)
+        return [query['sql'] for query in queries.captured_queries if query['sql'].startswith('UPDATE')]
+
+    def test_loaded_instance_is_clean(self):
+        project = Project.objects.get(pk=self.project_id)
+
+        self.assertEqual(project.get_dirty_fields(), [])
+
+    def test_changed_field_is_dirty(self):
+        project = Project.objects.get(pk=self.project_id)
+
+        project.title = 'New title'
+
+        self.assertEqual(project.get_dirty_fields(), ['title'])
+
+    def test_full_save_writes_changed_and_auto_now_fields_only(self):
+        project = Project.objects.get(pk=self.project_id)
+        project.title = 'New title'
+
+        [sql] = self.update_sql(project)
+
+        self.assertIn('"title"', sql)
+        self.assertIn('"updated_at"', sql)
+        self.assertNotIn('"description"', sql)
+        self.assertNotIn('"contribution_count"', sql)
+
+    def test_save_resets_snapshot(self):
+        project = Project.objects.get(pk=self.project_id)
+        project.title = 'New title'
+        project.save()
+
+        self.assertEqual(project.get_dirty_fields(), [])
+
+    def test_stale_instance_does_not_clobber_db_maintained_counters(self):
+        project = Project.objects.get(pk=self.project_id)
+        Project.objects.filter(pk=self.project_id).update(contribution_count=5)
+
+        project.status = 'closed'
+        project.save()
+
+        self.assertEqual(Project.objects.get(pk=self.project_id).contribution_count, 5)
+
+    def test_stale_instance_does_not_clobber_concurrent_column_update(self):
+        project = Project.objects.get(pk=self.project_id)
+        Project.objects.filter(pk=self.project_id).update(description='e' * 30)
+
+        project.title = 'New title'
+        project.save()
+
+        saved = Project.objects.get(pk=self.project_id)
+        self.assertEqual((saved.title, saved.description), ('New title', 'e' * 30))
+
+    def test_in_place_json_edit_is_dirty(self):
+        user = User.objects.get(pk=self.host.pk)
+
+        user.skills.append('python')
+
+        self.assertEqual(user.get_dirty_fields(), ['skills'])
+        user.save()
+        self.assertEqual(User.objects.get(pk=self.host.pk).skills, ['python'])
+
+    def test_explicit_update_fields_are_respected(self):
+        project = Project.objects.get(pk=self.project_id)
+        project.title = 'New title'
+        project.description = 'f' * 30
+
+        [sql] = self.update_sql(project, update_fields=['description'])
+
+        self.assertNotIn('"title"', sql)
+        self.assertEqual(project.get_dirty_fields(), ['title'])
+
+    def test_deferred_fields_are_not_written(self):
+        project = Project.objects.only('id', 'title').get(pk=self.project_id)
+        project.title = 'New title'
+
+        [sql] = self.update_sql(project)
+
+        self.assertNotIn('"description"', sql)
+
+    def test_refresh_from_db_snapshots_refreshed_fields(self):
+        project = Project.objects.get(pk=self.project_id)
+        project.title = 'Local change'
+        Project.objects.filter(pk=self.project_id).update(status='closed')
+
+        project.refresh_from_db(fields=['status'])
+
+        self.assertEqual(project.get_dirty_fields(), ['title'])
+
+    def test_bulk_created_instance_writes_every_field_but_excluded(self):
+        [project] = Project.objects.bulk_create([Project(
+            host_user=self.host, title='Bulk', description='d' * 30,
+            what_it_does='x', desired_outputs='o' * 30,
+        )])
+        project.title = 'Bulk renamed'
+
+        [sql] = self.update_sql(project)
+
+        self.assertIn('"description"', sql)
+        self.assertNotIn('"contribution_count"', sql)
+        self.assertNotIn('"search_vector"', sql)
@@ -0,0 +1,151 @@
+"""
+Tests for keyset (cursor) pagination and capped page counts.
+"""
+import base64
+import json
+from datetime import timedelta
+from urllib.parse import parse_qs, urlparse
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.projects.models import Project
+from apps.users.models import User
+from core.pagination import ApproximateCountPaginator, KeysetPagination
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+def cursor_from(url):
+    return parse_qs(urlparse(url).query)['cursor'][0]
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class KeysetPaginationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        host = User.objects.create(email='host@example.com', username='host', display_name='host')
+        now = timezone.now()
+        # Pairs of projects share a created_at, so ties are broken by id
+        cls.projects = Project.objects.bulk_create([
+            Project(
+                host_user=host,
+                title=f'Project {index}',
+                description='d' * 30,
+                what_it_does='Tests paging',
+                desired_outputs='o' * 30,
+                created_at=now - timedelta(minutes=index // 2),
+            )
+            for index in range(7)
+        ])
+        cls.expected = [
+            project.pk for project in sorted(
+                cls.projects, key=lambda project: (project.created_at, project.pk), reverse=True
+            )
+        ]
+
+    def paginate(self, cursor=None, page_size=3):
+        params = {'page_size': page_size}
+        if cursor:
+            params['cursor'] = cursor
+        request = Request(APIRequestFactory().get('/api/v1/projects/', params))
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(Project.objects.all(), request)
+        return paginator, [project.pk for project in page]
+
+    def test_pages_forward_through_ties(self):
+        seen = []
+        paginator, page = self.paginate()
+        seen.extend(page)
+        while paginator.get_next_link():
+            paginator, page = self.paginate(cursor_from(paginator.get_next_link()))
+            seen.extend(page)
+
+        self.assertEqual(seen, self.expected)
+        self.assertIsNone(paginator.get_next_link())
+
+    def test_first_page_has_no_previous_link(self):
+        paginator, page = self.paginate()
+
+        self.assertEqual(page, self.expected[:3])
+        self.assertIsNone(paginator.get_previous_link())
+
+    def test_previous_link_returns_the_preceding_page(self):
+        first, _ = self.paginate()
+        second, second_page = self.paginate(cursor_from(first.get_next_link()))
+        third, _ = self.paginate(cursor_from(second.get_next_link()))
+
+        back, page = self.paginate(cursor_from(third.get_previous_link()))
+
+        self.assertEqual(page, second_page)
+        self.assertEqual(cursor_from(back.get_next_link()), cursor_from(second.get_next_link()))
+
+    def test_cursor_round_trips_timestamp_and_id(self):
+        first, _ = self.paginate()
+        payload = json.loads(base64.urlsafe_b64decode(cursor_from(first.get_next_link())))
+        last = Project.objects.get(pk=self.expected[2])
+
+        self.assertEqual(payload, {'t': last.created_at.isoformat(), 'id': str(last.pk)})
+
+    def test_invalid_cursors_are_not_found(self):
+        bad_payloads = [
+            'not base64 at all!',
+            base64.urlsafe_b64encode(b'not json').decode('ascii'),
+            base64.urlsafe_b64encode(json.dumps({'t': 'yesterday', 'id': 'x'}).encode()).decode('ascii'),
+            base64.urlsafe_b64encode(json.dumps({'t': timezone.now().isoformat()}).encode()).decode('ascii'),
+            base64.urlsafe_b64encode(
+                json.dumps({'t': timezone.now().isoformat(), 'id': 'not-a-uuid'}).encode()
+            ).decode('ascii'),
+        ]
+        for cursor in bad_payloads:
+            with self.subTest(cursor=cursor), self.assertRaises(NotFound):
+                self.paginate(cursor)
+
+
+class CappedCountPaginator(ApproximateCountPaginator):
+    count_cap = 5
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ApproximateCountPaginatorTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        host = User.objects.create(email='host@example.com', username='host', display_name='host')
+        Project.objects.bulk_create([
+            Project(
+                host_user=host,
+                title=f'Project {index}',
+                description='d' * 30,
+                what_it_does='Tests counts',
+                desired_outputs='o' * 30,
+            )
+            for index in range(7)
+        ])
+
+    def test_count_is_exact_under_the_cap(self):
+        paginator = CappedCountPaginator(Project.objects.filter(title__in=['Project 1', 'Project 2']), 1)
+
+        self.assertEqual(paginator.count, 2)
+        self.assertFalse(paginator.count_is_approximate)
+
+    def test_count_is_capped_over_the_cap(self):
+        paginator = CappedCountPaginator(Project.objects.order_by('title'), 2)
+
+        self.assertEqual(paginator.count, 5)
+        self.assertTrue(paginator.count_is_approximate)
+
+    def test_capped_pages_continue_past_the_reported_count(self):
+        paginator = CappedCountPaginator(Project.objects.order_by('title'), 2)
+
+        third = paginator.page(3)
+        fourth = paginator.page(4)
+
+        self.assertEqual(paginator.num_pages, 3)
+        self.assertTrue(third.has_next())
+        self.assertEqual([project.title for project in fourth], ['Project 6'])
+        self.assertFalse(fourth.has_next())